@@ -0,0 +1,2 @@
+# Query budget checks and report of the api tests
+pytest_plugins = ["plane.tests.pytest_plugin"]
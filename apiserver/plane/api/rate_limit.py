@@ -1,7 +1,8 @@
-from rest_framework.throttling import SimpleRateThrottle
+# Module imports
+from plane.utils.rate_limit import RedisRateThrottle
 
 
-class ApiKeyRateThrottle(SimpleRateThrottle):
+class ApiKeyRateThrottle(RedisRateThrottle):
     scope = "api_key"
     rate = "60/minute"
 
@@ -14,35 +15,8 @@ class ApiKeyRateThrottle(SimpleRateThrottle):
         # Use the API key as part of the cache key
         return f"{self.scope}:{api_key}"
 
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
 
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
-
-            # Calculate the requests
-            num_requests = len(history)
-
-            # Check available requests
-            available = self.num_requests - num_requests
-
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
-
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
-
-        return allowed
-
-
-class ServiceTokenRateThrottle(SimpleRateThrottle):
+class ServiceTokenRateThrottle(RedisRateThrottle):
     scope = "service_token"
     rate = "300/minute"
 
@@ -54,30 +28,3 @@ class ServiceTokenRateThrottle(SimpleRateThrottle):
 
         # Use the API key as part of the cache key
         return f"{self.scope}:{api_key}"
-
-    def allow_request(self, request, view):
-        allowed = super().allow_request(request, view)
-
-        if allowed:
-            now = self.timer()
-            # Calculate the remaining limit and reset time
-            history = self.cache.get(self.key, [])
-
-            # Remove old histories
-            while history and history[-1] <= now - self.duration:
-                history.pop()
-
-            # Calculate the requests
-            num_requests = len(history)
-
-            # Check available requests
-            available = self.num_requests - num_requests
-
-            # Unix timestamp for when the rate limit will reset
-            reset_time = int(now + self.duration)
-
-            # Add headers
-            request.META["X-RateLimit-Remaining"] = max(0, available)
-            request.META["X-RateLimit-Reset"] = reset_time
-
-        return allowed
\ No newline at end of file
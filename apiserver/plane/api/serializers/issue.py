@@ -22,6 +22,7 @@ from plane.db.models import (
     State,
     User,
 )
+from plane.utils.group_count import invalidate_group_counts
 
 from .base import BaseSerializer
 from .cycle import CycleLiteSerializer, CycleSerializer
@@ -181,6 +182,9 @@ class IssueSerializer(BaseSerializer):
                 batch_size=10,
             )
 
+        # The links are written after the issue was saved
+        invalidate_group_counts(project_id)
+
         return issue
 
     def update(self, instance, validated_data):
@@ -7,7 +7,7 @@ from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import IntegrityError
 from django.urls import resolve
 from django.utils import timezone
-from plane.db.models.api import APIToken
+from plane.utils.api_token import is_service_token
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -55,12 +55,8 @@ class BaseAPIView(TimezoneMixin, APIView, BasePaginator):
         api_key = self.request.headers.get("X-Api-Key")
 
         if api_key:
-            service_token = APIToken.objects.filter(
-                token=api_key,
-                is_service=True,
-            ).first()
-
-            if service_token:
+            # Resolved through the token cache shared with the authentication
+            if is_service_token(api_key):
                 throttle_classes.append(ServiceTokenRateThrottle())
                 return throttle_classes
 
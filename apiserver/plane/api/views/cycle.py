@@ -38,6 +38,8 @@ from plane.db.models import (
     UserFavorite,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.group_count import invalidate_group_counts
+from plane.utils.issue_progress import refresh_cycle_progress
 
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
@@ -409,6 +411,7 @@ class CycleAPIEndpoint(BaseAPIView):
         CycleIssue.objects.filter(
             cycle_id=self.kwargs.get("pk"),
         ).delete()
+        invalidate_group_counts(project_id)
         # Delete the user favorite cycle
         UserFavorite.objects.filter(
             entity_type="cycle",
@@ -724,6 +727,14 @@ class CycleIssueAPIEndpoint(BaseAPIView):
         CycleIssue.objects.bulk_update(
             updated_records, ["cycle_id"], batch_size=100
         )
+        invalidate_group_counts(project_id)
+        refresh_cycle_progress(
+            [cycle_id]
+            + [
+                activity["old_cycle_id"]
+                for activity in update_cycle_issue_activity
+            ]
+        )
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -1172,6 +1183,8 @@ class TransferCycleIssueAPIEndpoint(BaseAPIView):
         cycle_issues = CycleIssue.objects.bulk_update(
             updated_cycles, ["cycle_id"], batch_size=100
         )
+        invalidate_group_counts(project_id)
+        refresh_cycle_progress([cycle_id, new_cycle_id])
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -30,6 +30,8 @@ from plane.db.models import (
     ProjectMember,
     UserFavorite,
 )
+from plane.utils.group_count import invalidate_group_counts
+from plane.utils.issue_progress import refresh_module_progress
 
 from .base import BaseAPIView
 from plane.bgtasks.webhook_task import model_activity
@@ -307,6 +309,7 @@ class ModuleAPIEndpoint(BaseAPIView):
             module=pk,
             project_id=project_id,
         ).delete()
+        invalidate_group_counts(project_id)
         # Delete the user favorite module
         UserFavorite.objects.filter(
             entity_type="module",
@@ -470,6 +473,14 @@ class ModuleIssueAPIEndpoint(BaseAPIView):
             ["module"],
             batch_size=10,
         )
+        invalidate_group_counts(project_id)
+        refresh_module_progress(
+            [module_id]
+            + [
+                activity["old_module_id"]
+                for activity in update_module_issue_activity
+            ]
+        )
 
         # Capture Issue Activity
         issue_activity.delay(
@@ -2,7 +2,8 @@
 from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 # Module import
-from plane.db.models import ProjectMember, WorkspaceMember
+from plane.db.models import ProjectMember
+from plane.utils.membership import is_project_member, is_workspace_member
 
 # Permission Mappings
 Admin = 20
@@ -18,29 +19,18 @@ class ProjectBasePermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return is_workspace_member(request, view.workspace_slug)
 
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return is_workspace_member(
+                request, view.workspace_slug, roles=[Admin, Member]
+            )
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role=Admin,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return is_project_member(
+            request, view.workspace_slug, view.project_id, roles=[Admin]
+        )
 
 
 class ProjectMemberPermission(BasePermission):
@@ -50,28 +40,20 @@ class ProjectMemberPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return is_project_member(request, view.workspace_slug)
         ## Only workspace owners or admins can create the projects
         if request.method == "POST":
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                role__in=[Admin, Member],
-                is_active=True,
-            ).exists()
+            return is_workspace_member(
+                request, view.workspace_slug, roles=[Admin, Member]
+            )
 
         ## Only Project Admins can update project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return is_project_member(
+            request,
+            view.workspace_slug,
+            view.project_id,
+            roles=[Admin, Member],
+        )
 
 
 class ProjectEntityPermission(BasePermission):
@@ -91,21 +73,17 @@ class ProjectEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return ProjectMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                project_id=view.project_id,
-                is_active=True,
-            ).exists()
+            return is_project_member(
+                request, view.workspace_slug, view.project_id
+            )
 
         ## Only project members or admins can create and edit the project attributes
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            role__in=[Admin, Member],
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return is_project_member(
+            request,
+            view.workspace_slug,
+            view.project_id,
+            roles=[Admin, Member],
+        )
 
 
 class ProjectLitePermission(BasePermission):
@@ -113,9 +91,6 @@ class ProjectLitePermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return ProjectMember.objects.filter(
-            workspace__slug=view.workspace_slug,
-            member=request.user,
-            project_id=view.project_id,
-            is_active=True,
-        ).exists()
+        return is_project_member(
+            request, view.workspace_slug, view.project_id
+        )
@@ -3,6 +3,7 @@ from rest_framework.permissions import BasePermission, SAFE_METHODS
 
 # Module imports
 from plane.db.models import WorkspaceMember
+from plane.utils.membership import is_workspace_member
 
 
 # Permission Mappings
@@ -28,21 +29,15 @@ class WorkSpaceBasePermission(BasePermission):
 
         # allow only admins and owners to update the workspace settings
         if request.method in ["PUT", "PATCH"]:
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role__in=[Owner, Admin],
-                is_active=True,
-            ).exists()
+            return is_workspace_member(
+                request, view.workspace_slug, roles=[Owner, Admin]
+            )
 
         # allow only owner to delete the workspace
         if request.method == "DELETE":
-            return WorkspaceMember.objects.filter(
-                member=request.user,
-                workspace__slug=view.workspace_slug,
-                role=Owner,
-                is_active=True,
-            ).exists()
+            return is_workspace_member(
+                request, view.workspace_slug, roles=[Owner]
+            )
 
 
 class WorkspaceOwnerPermission(BasePermission):
@@ -62,12 +57,9 @@ class WorkSpaceAdminPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-            is_active=True,
-        ).exists()
+        return is_workspace_member(
+            request, view.workspace_slug, roles=[Owner, Admin]
+        )
 
 
 class WorkspaceEntityPermission(BasePermission):
@@ -77,18 +69,11 @@ class WorkspaceEntityPermission(BasePermission):
 
         ## Safe Methods -> Handle the filtering logic in queryset
         if request.method in SAFE_METHODS:
-            return WorkspaceMember.objects.filter(
-                workspace__slug=view.workspace_slug,
-                member=request.user,
-                is_active=True,
-            ).exists()
+            return is_workspace_member(request, view.workspace_slug)
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            role__in=[Owner, Admin],
-            is_active=True,
-        ).exists()
+        return is_workspace_member(
+            request, view.workspace_slug, roles=[Owner, Admin]
+        )
 
 
 class WorkspaceViewerPermission(BasePermission):
@@ -96,11 +81,7 @@ class WorkspaceViewerPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            is_active=True,
-        ).exists()
+        return is_workspace_member(request, view.workspace_slug)
 
 
 class WorkspaceUserPermission(BasePermission):
@@ -108,8 +89,4 @@ class WorkspaceUserPermission(BasePermission):
         if request.user.is_anonymous:
             return False
 
-        return WorkspaceMember.objects.filter(
-            member=request.user,
-            workspace__slug=view.workspace_slug,
-            is_active=True,
-        ).exists()
+        return is_workspace_member(request, view.workspace_slug)
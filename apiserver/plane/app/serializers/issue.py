@@ -34,6 +34,7 @@ from plane.db.models import (
     IssueRelation,
     State,
 )
+from plane.utils.group_count import invalidate_group_counts
 
 
 class IssueFlatSerializer(BaseSerializer):
@@ -188,6 +189,9 @@ class IssueCreateSerializer(BaseSerializer):
                 batch_size=10,
             )
 
+        # The links are written after the issue was saved
+        invalidate_group_counts(project_id)
+
         return issue
 
     def update(self, instance, validated_data):
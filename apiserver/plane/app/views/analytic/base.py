@@ -14,6 +14,10 @@ from plane.app.views.base import BaseAPIView, BaseViewSet
 from plane.bgtasks.analytic_plot_export import analytic_export_task
 from plane.db.models import AnalyticView, Issue, Workspace
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_rollup import (
+    get_rollup_details,
+    get_rollup_distribution,
+)
 from plane.utils.issue_filters import issue_filters
 from plane.app.permissions import allow_permission, ROLE
 
@@ -76,6 +80,31 @@ class AnalyticsEndpoint(BaseAPIView):
         # Additional filters that need to be applied
         filters = issue_filters(request.GET, "GET")
 
+        # Answer from the rollups when the filters allow
+        rollup = get_rollup_distribution(
+            slug, filters, x_axis=x_axis, y_axis=y_axis, segment=segment
+        )
+        if rollup is not None:
+            total_issues, distribution = rollup
+            extras = {
+                "state_details": {},
+                "assignee_details": {},
+                "label_details": {},
+                "cycle_details": {},
+                "module_details": {},
+            }
+            extras.update(
+                get_rollup_details(distribution, x_axis, segment=segment)
+            )
+            return Response(
+                {
+                    "total": total_issues,
+                    "distribution": distribution,
+                    "extras": extras,
+                },
+                status=status.HTTP_200_OK,
+            )
+
         # Get the issues for the workspace with the additional filters applied
         queryset = Issue.issue_objects.filter(workspace__slug=slug, **filters)
 
@@ -12,12 +12,10 @@ from django.db.models import (
     F,
     Func,
     OuterRef,
-    Prefetch,
     Q,
     UUIDField,
     Value,
     When,
-    Subquery,
     Sum,
     FloatField,
 )
@@ -43,12 +41,16 @@ from plane.db.models import (
     UserFavorite,
     CycleUserProperties,
     Issue,
-    Label,
-    User,
     Project,
     ProjectMember,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.group_count import invalidate_group_counts
+from plane.utils.issue_progress import (
+    ensure_cycle_progress,
+    progress_annotations,
+    refresh_cycle_progress,
+)
 
 # Module imports
 from .. import BaseAPIView, BaseViewSet
@@ -68,88 +70,12 @@ class CycleViewSet(BaseViewSet):
             project_id=self.kwargs.get("project_id"),
             workspace__slug=self.kwargs.get("slug"),
         )
-        backlog_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="backlog",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                backlog_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("backlog_estimate_point")[:1]
-        )
-        unstarted_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="unstarted",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                unstarted_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("unstarted_estimate_point")[:1]
-        )
-        started_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="started",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                started_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("started_estimate_point")[:1]
-        )
-        cancelled_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="cancelled",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                cancelled_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("cancelled_estimate_point")[:1]
-        )
-        completed_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="completed",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                completed_estimate_points=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("completed_estimate_points")[:1]
-        )
-        total_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_cycle__cycle_id=OuterRef("pk"),
-            )
-            .values("issue_cycle__cycle_id")
-            .annotate(
-                total_estimate_points=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
+        # Cycles created before the progress table get theirs on first read
+        ensure_cycle_progress(
+            Cycle.objects.filter(
+                workspace__slug=self.kwargs.get("slug"),
+                project_id=self.kwargs.get("project_id"),
             )
-            .values("total_estimate_points")[:1]
         )
         return self.filter_queryset(
             super()
@@ -162,88 +88,8 @@ class CycleViewSet(BaseViewSet):
             )
             .filter(project__archived_at__isnull=True)
             .select_related("project", "workspace", "owned_by")
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__assignees",
-                    queryset=User.objects.only(
-                        "avatar", "first_name", "id"
-                    ).distinct(),
-                )
-            )
-            .prefetch_related(
-                Prefetch(
-                    "issue_cycle__issue__labels",
-                    queryset=Label.objects.only(
-                        "name", "color", "id"
-                    ).distinct(),
-                )
-            )
             .annotate(is_favorite=Exists(favorite_subquery))
-            .annotate(
-                total_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="cancelled",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="started",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="unstarted",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__id",
-                    distinct=True,
-                    filter=Q(
-                        issue_cycle__issue__state__group="backlog",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
+            .annotate(**progress_annotations())
             .annotate(
                 status=Case(
                     When(
@@ -275,42 +121,6 @@ class CycleViewSet(BaseViewSet):
                     Value([], output_field=ArrayField(UUIDField())),
                 )
             )
-            .annotate(
-                backlog_estimate_points=Coalesce(
-                    Subquery(backlog_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                unstarted_estimate_points=Coalesce(
-                    Subquery(unstarted_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                started_estimate_points=Coalesce(
-                    Subquery(started_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                cancelled_estimate_points=Coalesce(
-                    Subquery(cancelled_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                completed_estimate_points=Coalesce(
-                    Subquery(completed_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                total_estimate_points=Coalesce(
-                    Subquery(total_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
             .order_by("-is_favorite", "name")
             .distinct()
         )
@@ -1081,6 +891,7 @@ class CycleViewSet(BaseViewSet):
         CycleIssue.objects.filter(
             cycle_id=self.kwargs.get("pk"),
         ).delete()
+        invalidate_group_counts(project_id)
         # Delete the user favorite cycle
         UserFavorite.objects.filter(
             user=request.user,
@@ -1176,70 +987,11 @@ class TransferCycleIssueEndpoint(BaseAPIView):
             workspace__slug=slug, project_id=project_id, pk=new_cycle_id
         ).first()
 
-        old_cycle = (
-            Cycle.objects.filter(
-                workspace__slug=slug, project_id=project_id, pk=cycle_id
-            )
-            .annotate(
-                total_issues=Count(
-                    "issue_cycle",
-                    filter=Q(
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                completed_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="completed",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                cancelled_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="cancelled",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                started_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="started",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                unstarted_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="unstarted",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
-            .annotate(
-                backlog_issues=Count(
-                    "issue_cycle__issue__state__group",
-                    filter=Q(
-                        issue_cycle__issue__state__group="backlog",
-                        issue_cycle__issue__archived_at__isnull=True,
-                        issue_cycle__issue__is_draft=False,
-                    ),
-                )
-            )
+        old_cycle = Cycle.objects.filter(
+            workspace__slug=slug, project_id=project_id, pk=cycle_id
         )
+        ensure_cycle_progress(old_cycle)
+        old_cycle = old_cycle.annotate(**progress_annotations())
 
         estimate_type = Project.objects.filter(
             workspace__slug=slug,
@@ -1549,6 +1301,8 @@ class TransferCycleIssueEndpoint(BaseAPIView):
         cycle_issues = CycleIssue.objects.bulk_update(
             updated_cycles, ["cycle_id"], batch_size=100
         )
+        invalidate_group_counts(project_id)
+        refresh_cycle_progress([cycle_id, new_cycle_id])
 
         # Capture Issue Activity
         issue_activity.delay(
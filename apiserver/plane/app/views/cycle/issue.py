@@ -25,12 +25,14 @@ from plane.db.models import (
     IssueAttachment,
     IssueLink,
 )
+from plane.utils.group_count import invalidate_group_counts
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_progress import refresh_cycle_progress
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
     GroupedOffsetPaginator,
@@ -157,6 +159,7 @@ class CycleIssueViewSet(BaseViewSet):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -193,6 +196,7 @@ class CycleIssueViewSet(BaseViewSet):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -220,6 +224,7 @@ class CycleIssueViewSet(BaseViewSet):
             # List Paginate
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
@@ -302,6 +307,14 @@ class CycleIssueViewSet(BaseViewSet):
         CycleIssue.objects.bulk_update(
             updated_records, ["cycle_id"], batch_size=100
         )
+        invalidate_group_counts(project_id)
+        refresh_cycle_progress(
+            [cycle_id]
+            + [
+                activity["old_cycle_id"]
+                for activity in update_cycle_issue_activity
+            ]
+        )
         # Capture Issue Activity
         issue_activity.delay(
             type="cycle.activity.created",
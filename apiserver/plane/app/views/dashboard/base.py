@@ -43,78 +43,21 @@ from plane.db.models import (
     ProjectMember,
     User,
     Widget,
-    WorkspaceMember,
+)
+from plane.utils.dashboard import (
+    get_assigned_issue_counts,
+    get_overview_counts,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.membership import get_workspace_role
 
 # Module imports
 from .. import BaseAPIView
 
 
 def dashboard_overview_stats(self, request, slug):
-    extra_filters = {}
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    assigned_issues = (
-        Issue.issue_objects.filter(
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(**extra_filters)
-        .count()
-    )
-
-    pending_issues_count = (
-        Issue.issue_objects.filter(
-            ~Q(state__group__in=["completed", "cancelled"]),
-            target_date__lt=timezone.now().date(),
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            workspace__slug=slug,
-            assignees__in=[request.user],
-        )
-        .filter(**extra_filters)
-        .count()
-    )
-
-    created_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            created_by_id=request.user.id,
-        )
-        .filter(**extra_filters)
-        .count()
-    )
-
-    completed_issues_count = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-            state__group="completed",
-        )
-        .filter(**extra_filters)
-        .count()
-    )
-
     return Response(
-        {
-            "assigned_issues_count": assigned_issues,
-            "pending_issues_count": pending_issues_count,
-            "completed_issues_count": completed_issues_count,
-            "created_issues_count": created_issues_count,
-        },
+        get_overview_counts(request, slug),
         status=status.HTTP_200_OK,
     )
 
@@ -192,12 +135,7 @@ def dashboard_assigned_issues(self, request, slug):
         )
     )
 
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
+    if get_workspace_role(request, slug) == 5:
         assigned_issues = assigned_issues.filter(created_by=request.user)
 
     # Priority Ordering
@@ -442,39 +380,12 @@ def dashboard_created_issues(self, request, slug):
 
 def dashboard_issues_by_state_groups(self, request, slug):
     filters = issue_filters(request.query_params, "GET")
-    state_order = ["backlog", "unstarted", "started", "completed", "cancelled"]
-    extra_filters = {}
-
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    issues_by_state_groups = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-        )
-        .filter(**filters, **extra_filters)
-        .values("state__group")
-        .annotate(count=Count("id"))
-    )
-
-    # default state
-    all_groups = {state: 0 for state in state_order}
-
-    # Update counts for existing groups
-    for entry in issues_by_state_groups:
-        all_groups[entry["state__group"]] = entry["count"]
+    counts = get_assigned_issue_counts(request, slug, filters)
 
     # Prepare output including all groups with their counts
     output_data = [
-        {"state": group, "count": count} for group, count in all_groups.items()
+        {"state": group, "count": count}
+        for group, count in counts["state_groups"].items()
     ]
 
     return Response(output_data, status=status.HTTP_200_OK)
@@ -482,40 +393,12 @@ def dashboard_issues_by_state_groups(self, request, slug):
 
 def dashboard_issues_by_priority(self, request, slug):
     filters = issue_filters(request.query_params, "GET")
-    priority_order = ["urgent", "high", "medium", "low", "none"]
-    extra_filters = {}
-
-    if WorkspaceMember.objects.filter(
-        workspace__slug=slug,
-        member=request.user,
-        role=5,
-        is_active=True,
-    ).exists():
-        extra_filters = {"created_by": request.user}
-
-    issues_by_priority = (
-        Issue.issue_objects.filter(
-            workspace__slug=slug,
-            project__project_projectmember__is_active=True,
-            project__project_projectmember__member=request.user,
-            assignees__in=[request.user],
-        )
-        .filter(**filters, **extra_filters)
-        .values("priority")
-        .annotate(count=Count("id"))
-    )
-
-    # default priority
-    all_groups = {priority: 0 for priority in priority_order}
-
-    # Update counts for existing groups
-    for entry in issues_by_priority:
-        all_groups[entry["priority"]] = entry["count"]
+    counts = get_assigned_issue_counts(request, slug, filters)
 
     # Prepare output including all groups with their counts
     output_data = [
         {"priority": group, "count": count}
-        for group, count in all_groups.items()
+        for group, count in counts["priorities"].items()
     ]
 
     return Response(output_data, status=status.HTTP_200_OK)
@@ -716,21 +599,18 @@ class DashboardEndpoint(BaseAPIView):
                         "recent_collaborators",
                     ]
 
-                    updated_dashboard_widgets = []
-                    for widget_key in widgets_to_fetch:
-                        widget = Widget.objects.filter(
-                            key=widget_key
-                        ).values_list("id", flat=True)
-                        if widget:
-                            updated_dashboard_widgets.append(
-                                DashboardWidget(
-                                    widget_id=widget,
-                                    dashboard_id=dashboard.id,
-                                )
-                            )
-
+                    # The widgets are looked up at once, not per key
                     DashboardWidget.objects.bulk_create(
-                        updated_dashboard_widgets, batch_size=100
+                        [
+                            DashboardWidget(
+                                widget_id=widget_id,
+                                dashboard_id=dashboard.id,
+                            )
+                            for widget_id in Widget.objects.filter(
+                                key__in=widgets_to_fetch
+                            ).values_list("id", flat=True)
+                        ],
+                        batch_size=100,
                     )
 
                 widgets = (
@@ -777,8 +657,6 @@ class DashboardEndpoint(BaseAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        widget_key = request.GET.get("widget_key", "overview_stats")
-
         WIDGETS_MAPPER = {
             "overview_stats": dashboard_overview_stats,
             "assigned_issues": dashboard_assigned_issues,
@@ -790,6 +668,28 @@ class DashboardEndpoint(BaseAPIView):
             "recent_collaborators": dashboard_recent_collaborators,
         }
 
+        # Several widgets can be loaded in one request
+        widget_keys = request.GET.get("widget_keys", None)
+        if widget_keys:
+            widget_keys = [key for key in widget_keys.split(",") if key]
+            if any(key not in WIDGETS_MAPPER for key in widget_keys):
+                return Response(
+                    {"error": "Please specify a valid widget key"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            results = {}
+            for key in widget_keys:
+                response = WIDGETS_MAPPER[key](
+                    self,
+                    request=request,
+                    slug=slug,
+                )
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                results[key] = response.data
+            return Response(results, status=status.HTTP_200_OK)
+
+        widget_key = request.GET.get("widget_key", "overview_stats")
         func = WIDGETS_MAPPER.get(widget_key)
         if func is not None:
             response = func(
@@ -35,12 +35,14 @@ from plane.db.models import (
     IssueSubscriber,
     IssueReaction,
 )
+from plane.utils.group_count import invalidate_group_counts
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_progress import refresh_issue_progress
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
     GroupedOffsetPaginator,
@@ -142,6 +144,7 @@ class IssueArchiveViewSet(BaseViewSet):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -178,6 +181,7 @@ class IssueArchiveViewSet(BaseViewSet):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -205,6 +209,7 @@ class IssueArchiveViewSet(BaseViewSet):
             # List Paginate
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
@@ -371,6 +376,8 @@ class BulkArchiveIssuesEndpoint(BaseAPIView):
             issue.archived_at = timezone.now().date()
             bulk_archive_issues.append(issue)
         Issue.objects.bulk_update(bulk_archive_issues, ["archived_at"])
+        invalidate_group_counts(project_id)
+        refresh_issue_progress([issue.id for issue in bulk_archive_issues])
 
         return Response(
             {"archived_at": str(timezone.now().date())},
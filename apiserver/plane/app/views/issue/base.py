@@ -269,6 +269,7 @@ class IssueViewSet(BaseViewSet):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -304,6 +305,7 @@ class IssueViewSet(BaseViewSet):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -330,6 +332,7 @@ class IssueViewSet(BaseViewSet):
         else:
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
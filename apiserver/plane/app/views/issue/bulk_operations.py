@@ -20,7 +20,9 @@ from plane.db.models import (
     IssueLabel,
     IssueAssignee,
 )
-from plane.bgtasks.issue_activities_task import issue_activity
+from plane.bgtasks.issue_activities_task import issue_activity_batch
+from plane.utils.group_count import invalidate_group_counts
+from plane.utils.issue_progress import refresh_issue_progress
 
 
 class BulkIssueOperationsEndpoint(BaseAPIView):
@@ -270,6 +272,7 @@ class BulkIssueOperationsEndpoint(BaseAPIView):
             ],
             batch_size=100,
         )
+        refresh_issue_progress([issue.id for issue in bulk_update_issues])
 
         # Create new labels
         IssueLabel.objects.bulk_create(
@@ -284,10 +287,8 @@ class BulkIssueOperationsEndpoint(BaseAPIView):
             ignore_conflicts=True,
             batch_size=100,
         )
+        invalidate_group_counts(project_id)
         # update the issue activity
-        [
-            issue_activity.delay(**activity)
-            for activity in bulk_issue_activities
-        ]
+        issue_activity_batch.delay(bulk_issue_activities)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -135,6 +135,7 @@ class IssueDraftViewSet(BaseViewSet):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -171,6 +172,7 @@ class IssueDraftViewSet(BaseViewSet):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -198,6 +200,7 @@ class IssueDraftViewSet(BaseViewSet):
             # List Paginate
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
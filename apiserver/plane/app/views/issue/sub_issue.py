@@ -31,6 +31,7 @@ from plane.db.models import (
     IssueAttachment,
 )
 from plane.bgtasks.issue_activities_task import issue_activity
+from plane.utils.group_count import invalidate_group_counts
 from plane.utils.user_timezone_converter import user_timezone_converter
 from collections import defaultdict
 
@@ -163,6 +164,7 @@ class SubIssuesEndpoint(BaseAPIView):
             sub_issue.parent = parent_issue
 
         _ = Issue.objects.bulk_update(sub_issues, ["parent"], batch_size=10)
+        invalidate_group_counts(project_id)
 
         updated_sub_issues = Issue.issue_objects.filter(
             id__in=sub_issue_ids
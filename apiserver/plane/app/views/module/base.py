@@ -9,11 +9,9 @@ from django.db.models import (
     Exists,
     F,
     Func,
-    IntegerField,
     OuterRef,
     Prefetch,
     Q,
-    Subquery,
     UUIDField,
     Value,
     Sum,
@@ -52,6 +50,11 @@ from plane.db.models import (
     Project,
 )
 from plane.utils.analytics_plot import burndown_plot
+from plane.utils.group_count import invalidate_group_counts
+from plane.utils.issue_progress import (
+    ensure_module_progress,
+    progress_annotations,
+)
 from plane.utils.user_timezone_converter import user_timezone_converter
 from plane.bgtasks.webhook_task import model_activity
 from .. import BaseAPIView, BaseViewSet
@@ -76,142 +79,12 @@ class ModuleViewSet(BaseViewSet):
             project_id=self.kwargs.get("project_id"),
             workspace__slug=self.kwargs.get("slug"),
         )
-        cancelled_issues = (
-            Issue.issue_objects.filter(
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_issues = (
-            Issue.issue_objects.filter(
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        started_issues = (
-            Issue.issue_objects.filter(
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        unstarted_issues = (
-            Issue.issue_objects.filter(
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        backlog_issues = (
-            Issue.issue_objects.filter(
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        total_issues = (
-            Issue.issue_objects.filter(
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(cnt=Count("pk"))
-            .values("cnt")
-        )
-        completed_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="completed",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                completed_estimate_points=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("completed_estimate_points")[:1]
-        )
-
-        total_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                total_estimate_points=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("total_estimate_points")[:1]
-        )
-        backlog_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="backlog",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                backlog_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("backlog_estimate_point")[:1]
-        )
-        unstarted_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="unstarted",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                unstarted_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("unstarted_estimate_point")[:1]
-        )
-        started_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="started",
-                issue_module__module_id=OuterRef("pk"),
-            )
-            .values("issue_module__module_id")
-            .annotate(
-                started_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("started_estimate_point")[:1]
-        )
-        cancelled_estimate_point = (
-            Issue.issue_objects.filter(
-                estimate_point__estimate__type="points",
-                state__group="cancelled",
-                issue_module__module_id=OuterRef("pk"),
+        # Modules created before the progress table get theirs on first read
+        ensure_module_progress(
+            Module.objects.filter(
+                workspace__slug=self.kwargs.get("slug"),
+                project_id=self.kwargs.get("project_id"),
             )
-            .values("issue_module__module_id")
-            .annotate(
-                cancelled_estimate_point=Sum(
-                    Cast("estimate_point__value", FloatField())
-                )
-            )
-            .values("cancelled_estimate_point")[:1]
         )
         return (
             super()
@@ -231,78 +104,7 @@ class ModuleViewSet(BaseViewSet):
                     ),
                 )
             )
-            .annotate(
-                completed_issues=Coalesce(
-                    Subquery(completed_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                cancelled_issues=Coalesce(
-                    Subquery(cancelled_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                started_issues=Coalesce(
-                    Subquery(started_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                unstarted_issues=Coalesce(
-                    Subquery(unstarted_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                backlog_issues=Coalesce(
-                    Subquery(backlog_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                total_issues=Coalesce(
-                    Subquery(total_issues[:1]),
-                    Value(0, output_field=IntegerField()),
-                )
-            )
-            .annotate(
-                backlog_estimate_points=Coalesce(
-                    Subquery(backlog_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                unstarted_estimate_points=Coalesce(
-                    Subquery(unstarted_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                started_estimate_points=Coalesce(
-                    Subquery(started_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                cancelled_estimate_points=Coalesce(
-                    Subquery(cancelled_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                completed_estimate_points=Coalesce(
-                    Subquery(completed_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
-            .annotate(
-                total_estimate_points=Coalesce(
-                    Subquery(total_estimate_point),
-                    Value(0, output_field=FloatField()),
-                ),
-            )
+            .annotate(**progress_annotations())
             .annotate(
                 member_ids=Coalesce(
                     ArrayAgg(
@@ -776,6 +578,7 @@ class ModuleViewSet(BaseViewSet):
             module=pk,
             project_id=project_id,
         ).delete()
+        invalidate_group_counts(project_id)
         # Delete the user favorite module
         UserFavorite.objects.filter(
             user=request.user,
@@ -29,12 +29,14 @@ from plane.db.models import (
     ModuleIssue,
     Project,
 )
+from plane.utils.group_count import invalidate_group_counts
 from plane.utils.grouper import (
     issue_group_values,
     issue_on_results,
     issue_queryset_grouper,
 )
 from plane.utils.issue_filters import issue_filters
+from plane.utils.issue_progress import refresh_module_progress
 from plane.utils.order_queryset import order_issue_queryset
 from plane.utils.paginator import (
     GroupedOffsetPaginator,
@@ -129,6 +131,7 @@ class ModuleIssueViewSet(BaseViewSet):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -165,6 +168,7 @@ class ModuleIssueViewSet(BaseViewSet):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -192,6 +196,7 @@ class ModuleIssueViewSet(BaseViewSet):
             # List Paginate
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
@@ -224,6 +229,8 @@ class ModuleIssueViewSet(BaseViewSet):
             batch_size=10,
             ignore_conflicts=True,
         )
+        invalidate_group_counts(project_id)
+        refresh_module_progress([module_id])
         # Bulk Update the activity
         _ = [
             issue_activity.delay(
@@ -264,6 +271,8 @@ class ModuleIssueViewSet(BaseViewSet):
                 batch_size=10,
                 ignore_conflicts=True,
             )
+            invalidate_group_counts(project_id)
+            refresh_module_progress(modules)
             # Bulk Update the activity
             _ = [
                 issue_activity.delay(
@@ -18,6 +18,7 @@ from .base import BaseViewSet, BaseAPIView
 from plane.app.serializers import ProjectMemberInviteSerializer
 
 from plane.app.permissions import ProjectBasePermission
+from plane.utils.membership import invalidate_membership
 
 from plane.db.models import (
     ProjectMember,
@@ -178,6 +179,7 @@ class UserProjectInvitationsViewset(BaseViewSet):
             ],
             ignore_conflicts=True,
         )
+        invalidate_membership(request.user.id)
 
         IssueUserProperty.objects.bulk_create(
             [
@@ -27,6 +27,7 @@ from plane.db.models import (
 )
 from plane.bgtasks.project_add_user_email_task import project_add_user_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_membership
 from plane.app.permissions.base import allow_permission, ROLE
 
 
@@ -171,6 +172,9 @@ class ProjectMemberViewSet(BaseViewSet):
             bulk_issue_props, batch_size=10, ignore_conflicts=True
         )
 
+        # Bulk writes do not send signals
+        invalidate_membership(*[member.get("member_id") for member in members])
+
         project_members = ProjectMember.objects.filter(
             project_id=project_id,
             member_id__in=[member.get("member_id") for member in members],
@@ -371,6 +375,7 @@ class AddTeamToProjectEndpoint(BaseAPIView):
         ProjectMember.objects.bulk_create(
             project_members, batch_size=10, ignore_conflicts=True
         )
+        invalidate_membership(*team_members)
 
         _ = IssueUserProperty.objects.bulk_create(
             issue_props, batch_size=10, ignore_conflicts=True
@@ -2,10 +2,22 @@
 import re
 
 # Django imports
-from django.db.models import Q, OuterRef, Subquery, Value, UUIDField, CharField
-from django.contrib.postgres.aggregates import ArrayAgg
+from django.contrib.postgres.expressions import ArraySubquery
 from django.contrib.postgres.fields import ArrayField
-from django.db.models.functions import Coalesce
+from django.contrib.postgres.search import SearchRank, TrigramSimilarity
+from django.db.models import (
+    Case,
+    CharField,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    UUIDField,
+    Value,
+    When,
+)
+from django.db.models.functions import Cast, Greatest
 
 # Third party imports
 from rest_framework import status
@@ -15,7 +27,9 @@ from rest_framework.response import Response
 from plane.app.views.base import BaseAPIView
 from plane.db.models import (
     Workspace,
+    WorkspaceMember,
     Project,
+    ProjectMember,
     Issue,
     Cycle,
     Module,
@@ -23,6 +37,99 @@ from plane.db.models import (
     IssueView,
     ProjectPage,
 )
+from plane.utils.search import document_search_vector, search_query
+
+# Results returned for each type of entity, best ranked first
+SEARCH_RESULTS_LIMIT = 50
+
+# Columns shared by every entity so that they are searched in one union
+SEARCH_COLUMNS = {
+    "search_entity": CharField(),
+    "search_id": UUIDField(),
+    "search_name": CharField(),
+    "search_rank": FloatField(),
+    "search_sequence_id": IntegerField(),
+    "search_identifier": CharField(),
+    "search_project_id": UUIDField(),
+    "search_project_ids": ArrayField(UUIDField()),
+    "search_project_identifiers": ArrayField(CharField()),
+    "search_workspace_slug": CharField(),
+}
+
+# The fields of each entity in the response, mapped to the columns
+SEARCH_RESULT_FIELDS = {
+    "workspace": {
+        "name": "search_name",
+        "id": "search_id",
+        "slug": "search_workspace_slug",
+    },
+    "project": {
+        "name": "search_name",
+        "id": "search_id",
+        "identifier": "search_identifier",
+        "workspace__slug": "search_workspace_slug",
+    },
+    "issue": {
+        "name": "search_name",
+        "id": "search_id",
+        "sequence_id": "search_sequence_id",
+        "project__identifier": "search_identifier",
+        "project_id": "search_project_id",
+        "workspace__slug": "search_workspace_slug",
+    },
+    "cycle": {
+        "name": "search_name",
+        "id": "search_id",
+        "project_id": "search_project_id",
+        "project__identifier": "search_identifier",
+        "workspace__slug": "search_workspace_slug",
+    },
+    "module": {
+        "name": "search_name",
+        "id": "search_id",
+        "project_id": "search_project_id",
+        "project__identifier": "search_identifier",
+        "workspace__slug": "search_workspace_slug",
+    },
+    "issue_view": {
+        "name": "search_name",
+        "id": "search_id",
+        "project_id": "search_project_id",
+        "project__identifier": "search_identifier",
+        "workspace__slug": "search_workspace_slug",
+    },
+    "page": {
+        "name": "search_name",
+        "id": "search_id",
+        "project_ids": "search_project_ids",
+        "project_identifiers": "search_project_identifiers",
+        "workspace__slug": "search_workspace_slug",
+    },
+}
+
+
+def search_results(queryset, entity, rank, **columns):
+    """Select the shared columns of the entity, best ranked first"""
+    columns.update(
+        search_entity=Value(entity, output_field=CharField()),
+        search_id=F("id"),
+        search_name=F("name"),
+        search_rank=rank,
+    )
+    # Every branch annotates the columns in the same order, and the missing
+    # ones as typed nulls since a bare null of the first branch is text
+    return (
+        queryset.annotate(
+            **{
+                column: columns.get(
+                    column, Cast(Value(None), output_field=output_field)
+                )
+                for column, output_field in SEARCH_COLUMNS.items()
+            }
+        )
+        .values(*SEARCH_COLUMNS)
+        .order_by("-search_rank")[:SEARCH_RESULTS_LIMIT]
+    )
 
 
 class GlobalSearchEndpoint(BaseAPIView):
@@ -30,195 +137,169 @@ class GlobalSearchEndpoint(BaseAPIView):
     also show related workspace if found
     """
 
+    def get_member_projects(self, slug):
+        # Matched as a semi join instead of joining the memberships
+        return ProjectMember.objects.filter(
+            member=self.request.user,
+            is_active=True,
+            workspace__slug=slug,
+            project__archived_at__isnull=True,
+        ).values("project_id")
+
     def filter_workspaces(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return (
-            Workspace.objects.filter(
-                q, workspace_member__member=self.request.user
-            )
-            .distinct()
-            .values("name", "id", "slug")
+        workspaces = Workspace.objects.filter(
+            name__icontains=query,
+            pk__in=WorkspaceMember.objects.filter(
+                member=self.request.user
+            ).values("workspace_id"),
+        )
+        return search_results(
+            workspaces,
+            "workspace",
+            TrigramSimilarity("name", query),
+            search_workspace_slug=F("slug"),
         )
 
     def filter_projects(self, query, slug, project_id, workspace_search):
-        fields = ["name", "identifier"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-        return (
-            Project.objects.filter(
-                q,
-                project_projectmember__member=self.request.user,
-                project_projectmember__is_active=True,
-                archived_at__isnull=True,
-                workspace__slug=slug,
-            )
-            .distinct()
-            .values("name", "id", "identifier", "workspace__slug")
+        projects = Project.objects.filter(
+            Q(name__icontains=query) | Q(identifier__icontains=query),
+            pk__in=self.get_member_projects(slug),
+            workspace__slug=slug,
+        )
+        return search_results(
+            projects,
+            "project",
+            Greatest(
+                TrigramSimilarity("name", query),
+                TrigramSimilarity("identifier", query),
+            ),
+            search_identifier=F("identifier"),
+            search_workspace_slug=F("workspace__slug"),
         )
 
     def filter_issues(self, query, slug, project_id, workspace_search):
-        fields = ["name", "sequence_id", "project__identifier"]
-        q = Q()
-        for field in fields:
-            if field == "sequence_id":
-                # Match whole integers only (exclude decimal numbers)
-                sequences = re.findall(r"\b\d+\b", query)
-                for sequence_id in sequences:
-                    q |= Q(**{"sequence_id": sequence_id})
-            else:
-                q |= Q(**{f"{field}__icontains": query})
-
-        issues = Issue.issue_objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
-            workspace__slug=slug,
+        # Match whole integers only (exclude decimal numbers)
+        sequences = re.findall(r"\b\d+\b", query)
+        q = (
+            Q(name__icontains=query)
+            | Q(sequence_id__in=sequences)
+            | Q(
+                project_id__in=Project.objects.filter(
+                    identifier__icontains=query, workspace__slug=slug
+                ).values("id")
+            )
         )
-
-        if workspace_search == "false" and project_id:
-            issues = issues.filter(project_id=project_id)
-
-        return issues.distinct().values(
-            "name",
-            "id",
-            "sequence_id",
-            "project__identifier",
-            "project_id",
-            "workspace__slug",
+        rank = Case(
+            When(sequence_id__in=sequences, then=Value(1.0)),
+            default=Value(0.0),
+            output_field=FloatField(),
         )
 
-    def filter_cycles(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        issues = Issue.issue_objects.alias(
+            search_document=document_search_vector()
+        )
+        query_words = search_query(query)
+        if query_words is not None:
+            q |= Q(search_document=query_words)
+            rank += SearchRank(F("search_document"), query_words)
 
-        cycles = Cycle.objects.filter(
+        issues = issues.filter(
             q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+            project_id__in=self.get_member_projects(slug),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
-            cycles = cycles.filter(project_id=project_id)
-
-        return cycles.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
-        )
+            issues = issues.filter(project_id=project_id)
 
-    def filter_modules(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        return search_results(
+            issues.distinct(),
+            "issue",
+            rank,
+            search_sequence_id=F("sequence_id"),
+            search_identifier=F("project__identifier"),
+            search_project_id=F("project_id"),
+            search_workspace_slug=F("workspace__slug"),
+        )
 
-        modules = Module.objects.filter(
-            q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+    def filter_project_entities(
+        self, model, entity, query, slug, project_id, workspace_search
+    ):
+        """Cycles, modules and views are all matched on their names"""
+        queryset = model.objects.filter(
+            name__icontains=query,
+            project_id__in=self.get_member_projects(slug),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
-            modules = modules.filter(project_id=project_id)
-
-        return modules.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+            queryset = queryset.filter(project_id=project_id)
+
+        return search_results(
+            queryset,
+            entity,
+            TrigramSimilarity("name", query),
+            search_project_id=F("project_id"),
+            search_identifier=F("project__identifier"),
+            search_workspace_slug=F("workspace__slug"),
         )
 
-    def filter_pages(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
-
-        pages = (
-            Page.objects.filter(
-                q,
-                projects__project_projectmember__member=self.request.user,
-                projects__project_projectmember__is_active=True,
-                projects__archived_at__isnull=True,
-                workspace__slug=slug,
-            )
-            .annotate(
-                project_ids=Coalesce(
-                    ArrayAgg(
-                        "projects__id",
-                        distinct=True,
-                        filter=~Q(projects__id=True),
-                    ),
-                    Value([], output_field=ArrayField(UUIDField())),
-                ),
-            )
-            .annotate(
-                project_identifiers=Coalesce(
-                    ArrayAgg(
-                        "projects__identifier",
-                        distinct=True,
-                        filter=~Q(projects__id=True),
-                    ),
-                    Value([], output_field=ArrayField(CharField())),
-                ),
-            )
+    def filter_cycles(self, query, slug, project_id, workspace_search):
+        return self.filter_project_entities(
+            Cycle, "cycle", query, slug, project_id, workspace_search
         )
 
-        if workspace_search == "false" and project_id:
-            project_subquery = ProjectPage.objects.filter(
-                page_id=OuterRef("id"),
-                project_id=project_id,
-            ).values_list("project_id", flat=True)[:1]
-
-            pages = pages.annotate(
-                project_id=Subquery(project_subquery)
-            ).filter(project_id=project_id)
-
-        return pages.distinct().values(
-            "name",
-            "id",
-            "project_ids",
-            "project_identifiers",
-            "workspace__slug",
+    def filter_modules(self, query, slug, project_id, workspace_search):
+        return self.filter_project_entities(
+            Module, "module", query, slug, project_id, workspace_search
         )
 
     def filter_views(self, query, slug, project_id, workspace_search):
-        fields = ["name"]
-        q = Q()
-        for field in fields:
-            q |= Q(**{f"{field}__icontains": query})
+        return self.filter_project_entities(
+            IssueView, "issue_view", query, slug, project_id, workspace_search
+        )
+
+    def filter_pages(self, query, slug, project_id, workspace_search):
+        member_projects = self.get_member_projects(slug)
+        project_pages = ProjectPage.objects.filter(
+            project_id__in=member_projects
+        )
+        q = Q(name__icontains=query)
+        rank = TrigramSimilarity("name", query)
+
+        pages = Page.objects.alias(search_document=document_search_vector())
+        query_words = search_query(query)
+        if query_words is not None:
+            q |= Q(search_document=query_words)
+            rank = Greatest(
+                rank, SearchRank(F("search_document"), query_words)
+            )
 
-        issue_views = IssueView.objects.filter(
+        pages = pages.filter(
             q,
-            project__project_projectmember__member=self.request.user,
-            project__project_projectmember__is_active=True,
-            project__archived_at__isnull=True,
+            pk__in=project_pages.values("page_id"),
             workspace__slug=slug,
         )
 
         if workspace_search == "false" and project_id:
-            issue_views = issue_views.filter(project_id=project_id)
-
-        return issue_views.distinct().values(
-            "name",
-            "id",
-            "project_id",
-            "project__identifier",
-            "workspace__slug",
+            pages = pages.filter(
+                pk__in=project_pages.filter(project_id=project_id).values(
+                    "page_id"
+                )
+            )
+
+        page_projects = project_pages.filter(page_id=OuterRef("id"))
+        return search_results(
+            pages,
+            "page",
+            rank,
+            search_project_ids=ArraySubquery(
+                page_projects.values("project_id")
+            ),
+            search_project_identifiers=ArraySubquery(
+                page_projects.values("project__identifier")
+            ),
+            search_workspace_slug=F("workspace__slug"),
         )
 
     def get(self, request, slug):
@@ -254,9 +335,21 @@ class GlobalSearchEndpoint(BaseAPIView):
             "page": self.filter_pages,
         }
 
-        results = {}
+        # Search all the entities in a single query
+        querysets = [
+            func(query, slug, project_id, workspace_search)
+            for func in MODELS_MAPPER.values()
+        ]
+        rows = querysets[0].union(*querysets[1:], all=True)
 
-        for model in MODELS_MAPPER.keys():
-            func = MODELS_MAPPER.get(model, None)
-            results[model] = func(query, slug, project_id, workspace_search)
+        results = {model: [] for model in MODELS_MAPPER.keys()}
+        for row in sorted(rows, key=lambda row: -(row["search_rank"] or 0)):
+            results[row["search_entity"]].append(
+                {
+                    field: row[column]
+                    for field, column in SEARCH_RESULT_FIELDS[
+                        row["search_entity"]
+                    ].items()
+                }
+            )
         return Response({"results": results}, status=status.HTTP_200_OK)
@@ -37,6 +37,7 @@ from plane.utils.paginator import BasePaginator
 from plane.authentication.utils.host import user_ip
 from plane.bgtasks.user_deactivation_email_task import user_deactivation_email
 from plane.utils.host import base_host
+from plane.utils.membership import invalidate_membership
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -170,6 +171,7 @@ class UserEndpoint(BaseViewSet):
         WorkspaceMember.objects.bulk_update(
             workspaces_to_deactivate, ["is_active"], batch_size=100
         )
+        invalidate_membership(request.user.id)
 
         # Delete all workspace invites
         WorkspaceMemberInvite.objects.filter(
@@ -177,7 +179,9 @@ class UserEndpoint(BaseViewSet):
         ).delete()
 
         # Delete all sessions
-        Session.objects.filter(user_id=request.user.id).delete()
+        Session.get_session_store_class().revoke_user_sessions(
+            request.user.id
+        )
 
         # Profile updates
         profile = Profile.objects.get(user=user)
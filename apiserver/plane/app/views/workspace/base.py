@@ -43,7 +43,11 @@ from plane.db.models import (
     WorkspaceMember,
     WorkspaceTheme,
 )
-from plane.utils.cache import cache_response, invalidate_cache
+from plane.utils.cache import (
+    cache_response,
+    invalidate_cache,
+    invalidate_workspace_cache,
+)
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_control
 from django.views.decorators.vary import vary_on_cookie
@@ -163,7 +167,9 @@ class WorkSpaceViewSet(BaseViewSet):
         path="/api/users/me/settings/", multiple=True, user=False
     )
     def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
+        response = super().destroy(request, *args, **kwargs)
+        invalidate_workspace_cache(kwargs.get("slug"))
+        return response
 
 
 class UserWorkSpacesEndpoint(BaseAPIView):
@@ -0,0 +1,18 @@
+# Django imports
+from django.contrib.auth.backends import ModelBackend
+
+# Module imports
+from plane.utils.user_cache import get_cached_user
+
+
+class CachedModelBackend(ModelBackend):
+    """
+    Model backend loading the user of the session from the cache, so that
+    authenticated requests do not query the user
+    """
+
+    def get_user(self, user_id):
+        user = get_cached_user(user_id)
+        if user is None or not self.user_can_authenticate(user):
+            return None
+        return user
@@ -81,8 +81,9 @@ class MagicCodeProvider(CredentialAdapter):
         key = "magic_" + str(self.key)
 
         # Check if the key already exists in python
-        if ri.exists(key):
-            data = json.loads(ri.get(key))
+        existing_data = ri.get(key)
+        if existing_data:
+            data = json.loads(existing_data)
 
             current_attempt = data["current_attempt"] + 1
 
@@ -121,8 +122,9 @@ class MagicCodeProvider(CredentialAdapter):
 
     def set_user_data(self):
         ri = redis_instance()
-        if ri.exists(self.key):
-            data = json.loads(ri.get(self.key))
+        existing_data = ri.get(self.key)
+        if existing_data:
+            data = json.loads(existing_data)
             token = data["token"]
             email = data["email"]
 
@@ -7,7 +7,11 @@ from plane.authentication.utils.host import base_host
 
 
 def user_login(request, user, is_app=False, is_admin=False, is_space=False):
-    login(request=request, user=user)
+    login(
+        request=request,
+        user=user,
+        backend="plane.authentication.backends.CachedModelBackend",
+    )
 
     # If is admin cookie set the custom age
     if is_admin:
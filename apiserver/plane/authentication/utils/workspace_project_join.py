@@ -5,6 +5,7 @@ from plane.db.models import (
     WorkspaceMemberInvite,
 )
 from plane.utils.cache import invalidate_cache_directly
+from plane.utils.membership import invalidate_membership
 
 
 def process_workspace_project_invitations(user):
@@ -78,6 +79,9 @@ def process_workspace_project_invitations(user):
         ignore_conflicts=True,
     )
 
+    # Bulk writes do not send signals
+    invalidate_membership(user.id)
+
     # Delete all the invites
     workspace_member_invites.delete()
     project_member_invites.delete()
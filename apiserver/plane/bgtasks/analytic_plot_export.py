@@ -15,6 +15,10 @@ from django.utils.html import strip_tags
 from plane.db.models import Issue
 from plane.license.utils.instance_value import get_email_configuration
 from plane.utils.analytics_plot import build_graph_plot
+from plane.utils.analytics_rollup import (
+    get_rollup_details,
+    get_rollup_distribution,
+)
 from plane.utils.exception_logger import log_exception
 from plane.utils.issue_filters import issue_filters
 
@@ -442,41 +446,53 @@ def analytic_export_task(email, data, slug):
         x_axis = data.get("x_axis", False)
         y_axis = data.get("y_axis", False)
         segment = data.get("segment", False)
-
-        distribution = build_graph_plot(
-            queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
-        )
         key = "count" if y_axis == "issue_count" else "estimate"
 
-        assignee_details = (
-            get_assignee_details(slug, filters)
-            if x_axis == ASSIGNEE_ID or segment == ASSIGNEE_ID
-            else {}
+        rollup = get_rollup_distribution(
+            slug, filters, x_axis=x_axis, y_axis=y_axis, segment=segment
         )
+        if rollup is not None:
+            _, distribution = rollup
+            details = get_rollup_details(distribution, x_axis, segment)
+            assignee_details = details.get("assignee_details", {})
+            label_details = details.get("label_details", {})
+            state_details = details.get("state_details", {})
+            cycle_details = details.get("cycle_details", {})
+            module_details = details.get("module_details", {})
+        else:
+            distribution = build_graph_plot(
+                queryset, x_axis=x_axis, y_axis=y_axis, segment=segment
+            )
 
-        label_details = (
-            get_label_details(slug, filters)
-            if x_axis == LABEL_ID or segment == LABEL_ID
-            else {}
-        )
+            assignee_details = (
+                get_assignee_details(slug, filters)
+                if x_axis == ASSIGNEE_ID or segment == ASSIGNEE_ID
+                else {}
+            )
 
-        state_details = (
-            get_state_details(slug, filters)
-            if x_axis == STATE_ID or segment == STATE_ID
-            else {}
-        )
+            label_details = (
+                get_label_details(slug, filters)
+                if x_axis == LABEL_ID or segment == LABEL_ID
+                else {}
+            )
 
-        cycle_details = (
-            get_cycle_details(slug, filters)
-            if x_axis == CYCLE_ID or segment == CYCLE_ID
-            else {}
-        )
+            state_details = (
+                get_state_details(slug, filters)
+                if x_axis == STATE_ID or segment == STATE_ID
+                else {}
+            )
 
-        module_details = (
-            get_module_details(slug, filters)
-            if x_axis == MODULE_ID or segment == MODULE_ID
-            else {}
-        )
+            cycle_details = (
+                get_cycle_details(slug, filters)
+                if x_axis == CYCLE_ID or segment == CYCLE_ID
+                else {}
+            )
+
+            module_details = (
+                get_module_details(slug, filters)
+                if x_axis == MODULE_ID or segment == MODULE_ID
+                else {}
+            )
 
         if segment:
             rows = generate_segmented_rows(
@@ -0,0 +1,68 @@
+# Third party imports
+from celery import shared_task
+
+# Module imports
+from plane.db.models import IssueAnalyticsRollup, Project
+from plane.utils.analytics_rollup import (
+    ROLLUP_TOTAL_AXIS,
+    rebuild_project_rollups,
+)
+from plane.utils.exception_logger import log_exception
+
+
+def rollup_axes(project_ids):
+    """The rolled up axes of the projects, keyed by the project"""
+    axes = {}
+    for project_id, x_axis, segment_axis in (
+        IssueAnalyticsRollup.objects.filter(project_id__in=project_ids)
+        .values_list("project_id", "x_axis", "segment_axis")
+        .distinct()
+    ):
+        axes.setdefault(project_id, set()).add((x_axis, segment_axis))
+    return axes
+
+
+@shared_task
+def build_analytics_rollups(slug, x_axis, segment_axis=""):
+    """Roll up the axis for every project of the workspace"""
+    try:
+        for project in Project.objects.filter(
+            workspace__slug=slug, archived_at__isnull=True
+        ):
+            rebuild_project_rollups(project, x_axis, segment_axis)
+            rebuild_project_rollups(project, ROLLUP_TOTAL_AXIS)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def refresh_project_analytics(project_id):
+    """Recompute the rolled up axes of a project after its issues change"""
+    try:
+        project = Project.objects.filter(pk=project_id).first()
+        if project is None:
+            return
+        for x_axis, segment_axis in rollup_axes([project.id]).get(
+            project.id, set()
+        ):
+            rebuild_project_rollups(project, x_axis, segment_axis)
+    except Exception as e:
+        log_exception(e)
+        return
+
+
+@shared_task
+def reconcile_analytics_rollups():
+    """
+    Recompute all the rollups, catches the changes made without the
+    signals such as queryset updates and raw deletes
+    """
+    projects = Project.objects.filter(archived_at__isnull=True)
+    axes = rollup_axes(projects.values("id"))
+    for project in projects.filter(pk__in=list(axes.keys())):
+        for x_axis, segment_axis in axes[project.id]:
+            try:
+                rebuild_project_rollups(project, x_axis, segment_axis)
+            except Exception as e:
+                log_exception(e)
@@ -1,8 +1,42 @@
-from django.utils import timezone
+# Python imports
+import json
 from datetime import timedelta
-from plane.db.models import APIActivityLog
+
+# Django imports
+from django.core.cache import cache
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+# Third party imports
 from celery import shared_task
 
+# Module imports
+from plane.db.models import APIActivityLog, APIToken
+from plane.settings.redis import redis_instance
+from plane.utils.api_token import API_TOKEN_LAST_USED_KEY
+from plane.utils.exception_logger import log_exception
+
+# Redis list the api log middleware pushes the request logs to
+API_LOG_QUEUE_KEY = "api_activity_logs"
+API_LOG_BATCH_SIZE = 500
+# Batches written by a run, the rest waits for the next run
+API_LOG_MAX_BATCHES = 200
+# Batch taken from the queue and not yet written to the database
+API_LOG_PROCESSING_KEY = "api_activity_logs:processing"
+API_LOG_LOCK_KEY = "api_activity_logs:lock"
+API_LOG_LOCK_TIMEOUT = 60 * 30
+
+# Moves the head of the queue to the processing list in one atomic call, a
+# cap trim of the middleware can not shift the queue in between
+CLAIM_API_LOGS_SCRIPT = """
+local logs = redis.call("LRANGE", KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #logs > 0 then
+    redis.call("LTRIM", KEYS[1], #logs, -1)
+    redis.call("RPUSH", KEYS[2], unpack(logs))
+end
+return logs
+"""
+
 
 @shared_task
 def delete_api_logs():
@@ -13,3 +47,91 @@ def delete_api_logs():
 
     # Delete the logs
     logs_to_delete._raw_delete(logs_to_delete.db)
+
+
+def save_api_logs(logs):
+    api_logs = []
+    requested_at = []
+    for log in logs:
+        try:
+            payload = json.loads(log)
+            created_at = payload.pop("created_at", None)
+            if created_at is not None:
+                created_at = parse_datetime(created_at)
+            api_logs.append(APIActivityLog(**payload))
+            requested_at.append(created_at)
+        except Exception as e:
+            log_exception(e)
+
+    # The logs carry their id, a batch written twice is not duplicated
+    APIActivityLog.objects.bulk_create(
+        api_logs, batch_size=API_LOG_BATCH_SIZE, ignore_conflicts=True
+    )
+
+    # bulk_create stamps created_at with the insert time, the rows are
+    # dated with the time of their request instead
+    dated_logs = []
+    for api_log, created_at in zip(api_logs, requested_at):
+        if created_at is not None:
+            api_log.created_at = created_at
+            dated_logs.append(api_log)
+    APIActivityLog.objects.bulk_update(
+        dated_logs, ["created_at"], batch_size=API_LOG_BATCH_SIZE
+    )
+
+
+@shared_task
+def process_api_logs():
+    """Move the queued api logs from redis to the database in batches"""
+    # A single run at a time owns the processing list
+    if not cache.add(API_LOG_LOCK_KEY, True, API_LOG_LOCK_TIMEOUT):
+        return
+
+    try:
+        ri = redis_instance()
+        claim_api_logs = ri.register_script(CLAIM_API_LOGS_SCRIPT)
+        # A batch left by a failed run is written first
+        logs = ri.lrange(API_LOG_PROCESSING_KEY, 0, -1)
+        for _ in range(API_LOG_MAX_BATCHES):
+            if not logs:
+                logs = claim_api_logs(
+                    keys=[API_LOG_QUEUE_KEY, API_LOG_PROCESSING_KEY],
+                    args=[API_LOG_BATCH_SIZE],
+                    client=ri,
+                )
+            if not logs:
+                return
+
+            # The batch is dropped from redis once it is in the database,
+            # on a failure it stays for the next run
+            try:
+                save_api_logs(logs)
+            except Exception as e:
+                log_exception(e)
+                return
+            ri.delete(API_LOG_PROCESSING_KEY)
+            logs = None
+    finally:
+        cache.delete(API_LOG_LOCK_KEY)
+
+
+@shared_task
+def flush_api_token_last_used():
+    """Save the last use of the tokens recorded since the previous run"""
+    ri = redis_instance()
+    with ri.pipeline(transaction=True) as pipe:
+        pipe.hgetall(API_TOKEN_LAST_USED_KEY)
+        pipe.delete(API_TOKEN_LAST_USED_KEY)
+        last_used, _ = pipe.execute()
+
+    if not last_used:
+        return
+
+    api_tokens = [
+        APIToken(id=token_id.decode(), last_used=parse_datetime(used.decode()))
+        for token_id, used in last_used.items()
+    ]
+    try:
+        APIToken.objects.bulk_update(api_tokens, ["last_used"], batch_size=500)
+    except Exception as e:
+        log_exception(e)
@@ -1,161 +1,348 @@
+# Python imports
+import logging
+import time
+from functools import lru_cache
+
 # Django imports
 from django.utils import timezone
 from django.apps import apps
 from django.conf import settings
-from django.core.exceptions import ObjectDoesNotExist
+from django.core.cache import cache
+from django.db import models
+from django.db.models.deletion import Collector
 
 # Third party imports
 from celery import shared_task
 
+# Rows updated by a single statement of a cascade
+CASCADE_CHUNK_SIZE = 1000
+# Last purged row, a purge resumes after it when interrupted
+HARD_DELETE_CHECKPOINT_KEY = "hard_delete:checkpoint"
+HARD_DELETE_LOCK_KEY = "hard_delete:lock"
+HARD_DELETE_LOCK_TIMEOUT = 60 * 60 * 12
+
+
+def is_soft_deletable(model):
+    return hasattr(model, "all_objects") and any(
+        field.name == "deleted_at" for field in model._meta.concrete_fields
+    )
+
+
+@lru_cache(maxsize=None)
+def get_cascade_relations(model):
+    """
+    The soft deletable models pointing at the model with a cascading
+    foreign key, as (related model, foreign key name) pairs
+    """
+    return [
+        (field.related_model, field.field.name)
+        for field in model._meta.get_fields()
+        if (field.one_to_many or field.one_to_one)
+        and field.auto_created
+        and not field.concrete
+        and field.on_delete is models.CASCADE
+        and is_soft_deletable(field.related_model)
+    ]
+
+
+def get_cascade_order(*models):
+    """
+    The models reachable from the models through cascading relations, each
+    one after the models pointing at it
+    """
+    # Post order of a depth first walk, its reverse is a topological order
+    order = []
+    visited = set()
+
+    def visit(current):
+        visited.add(current)
+        for related_model, _ in get_cascade_relations(current):
+            if related_model not in visited:
+                visit(related_model)
+        order.append(current)
+
+    for model in models:
+        if model not in visited:
+            visit(model)
+    return order
+
+
+@lru_cache(maxsize=None)
+def get_cascade_plan(model):
+    """
+    The relations a soft delete of the model cascades through, as
+    (model, related model, foreign key name). The relations of a model come
+    after every relation into it, and its relations to itself come first
+    """
+    plan = []
+    for current in reversed(get_cascade_order(model)):
+        relations = get_cascade_relations(current)
+        plan.extend(
+            (current, related_model, field_name)
+            for related_model, field_name in relations
+            if related_model is current
+        )
+        plan.extend(
+            (current, related_model, field_name)
+            for related_model, field_name in relations
+            if related_model is not current
+        )
+    return plan
+
+
+def get_cascaded_member_ids(model, deleted_at, using):
+    """
+    The members of the memberships a cascade of the model updated. The
+    cascade sends no signals, so their cached roles are dropped by the task
+    """
+    from plane.db.models import ProjectMember, WorkspaceMember
+
+    member_ids = set()
+    for _, related_model, _ in get_cascade_plan(model):
+        if related_model in (ProjectMember, WorkspaceMember):
+            member_ids.update(
+                related_model.all_objects.db_manager(using)
+                .filter(deleted_at=deleted_at)
+                .values_list("member_id", flat=True)
+            )
+    return member_ids
+
+
+def update_deleted_at(queryset, deleted_at, pks=None):
+    """
+    Set deleted_at on the rows of the queryset in chunks, the queryset is
+    evaluated again for every chunk unless the primary keys are given
+    """
+    manager = queryset.model.all_objects.db_manager(queryset.db)
+    updated = 0
+    while True:
+        if pks is None:
+            chunk = list(
+                queryset.order_by().values_list("pk", flat=True)[
+                    :CASCADE_CHUNK_SIZE
+                ]
+            )
+        else:
+            chunk, pks = pks[:CASCADE_CHUNK_SIZE], pks[CASCADE_CHUNK_SIZE:]
+        if not chunk:
+            return updated
+        updated += manager.filter(pk__in=chunk).update(deleted_at=deleted_at)
+
+
+def cascade_queryset(model, related_model, field_name, deleted_at, using):
+    """
+    Rows of the related model pointing at the rows of the model deleted by
+    the cascade. Every row of a cascade shares the deleted_at of its root
+    """
+    return related_model.all_objects.db_manager(using).filter(
+        **{
+            f"{field_name}__in": model.all_objects.db_manager(using)
+            .filter(deleted_at=deleted_at)
+            .values("pk")
+        }
+    )
+
 
 @shared_task
 def soft_delete_related_objects(
     app_label, model_name, instance_pk, using=None
 ):
+    from plane.utils.membership import invalidate_membership
+
     model_class = apps.get_model(app_label, model_name)
-    instance = model_class.all_objects.get(pk=instance_pk)
-    related_fields = instance._meta.get_fields()
-    for field in related_fields:
-        if field.one_to_many or field.one_to_one:
-            try:
-                if field.one_to_many:
-                    related_objects = getattr(instance, field.name).all()
-                elif field.one_to_one:
-                    related_object = getattr(instance, field.name)
-                    related_objects = (
-                        [related_object] if related_object is not None else []
-                    )
-                for obj in related_objects:
-                    if obj:
-                        obj.deleted_at = timezone.now()
-                        obj.save(using=using)
-            except ObjectDoesNotExist:
-                pass
-
-
-# @shared_task
+    instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    deleted_at = instance.deleted_at
+    if deleted_at is None:
+        return {}
+
+    updated = {}
+    for model, related_model, field_name in get_cascade_plan(model_class):
+        count = update_deleted_at(
+            cascade_queryset(
+                model, related_model, field_name, deleted_at, using
+            ).filter(deleted_at__isnull=True),
+            deleted_at,
+        )
+        if count:
+            table = related_model._meta.db_table
+            updated[table] = updated.get(table, 0) + count
+            logging.getLogger("plane").info(
+                f"Soft deleted {count} {table} rows through {field_name} "
+                f"of {model._meta.db_table} {instance_pk}"
+            )
+
+    invalidate_membership(
+        *get_cascaded_member_ids(model_class, deleted_at, using)
+    )
+    return updated
+
+
+@shared_task
 def restore_related_objects(app_label, model_name, instance_pk, using=None):
-    pass
+    """
+    Restore the instance and every row its soft delete cascaded to. The
+    rows are restored from the leaves up, while the rows they point at
+    still carry the deleted_at of the cascade
+    """
+    from plane.utils.membership import invalidate_membership
+
+    model_class = apps.get_model(app_label, model_name)
+    instance = model_class.all_objects.using(using).get(pk=instance_pk)
+    deleted_at = instance.deleted_at
+    if deleted_at is None:
+        return {}
+
+    # Read while the memberships still carry the deleted_at of the cascade
+    member_ids = get_cascaded_member_ids(model_class, deleted_at, using)
+
+    restored = {}
+    for model, related_model, field_name in reversed(
+        get_cascade_plan(model_class)
+    ):
+        queryset = cascade_queryset(
+            model, related_model, field_name, deleted_at, using
+        ).filter(deleted_at=deleted_at)
+        # Restoring a row of a relation to its own model takes it out of
+        # the cascade for its children, so they are all selected up front
+        pks = (
+            list(queryset.order_by().values_list("pk", flat=True))
+            if related_model is model
+            else None
+        )
+        count = update_deleted_at(queryset, None, pks)
+        if count:
+            table = related_model._meta.db_table
+            restored[table] = restored.get(table, 0) + count
+            logging.getLogger("plane").info(
+                f"Restored {count} {table} rows through {field_name} "
+                f"of {model._meta.db_table} {instance_pk}"
+            )
+
+    model_class.all_objects.using(using).filter(pk=instance_pk).update(
+        deleted_at=None
+    )
+    invalidate_membership(*member_ids)
+    return restored
+
+
+def delete_batch(batch):
+    """
+    Delete the batch through the collector. The issue, cycle issue and
+    module issue receivers are skipped per row, the counts and the progress
+    they maintain are refreshed once for the whole batch
+    """
+    from plane.db.models import CycleIssue, Issue, ModuleIssue
+    from plane.db.models.issue import batched_issue_deletes
+    from plane.utils.analytics_rollup import schedule_analytics_refresh
+    from plane.utils.group_count import invalidate_group_counts
+    from plane.utils.issue_progress import (
+        refresh_cycle_progress,
+        refresh_module_progress,
+    )
+
+    collector = Collector(using=batch.db)
+    collector.collect(batch)
+    issues = collector.data.get(Issue, set())
+    cycle_ids = {row.cycle_id for row in collector.data.get(CycleIssue, [])}
+    module_ids = {
+        row.module_id for row in collector.data.get(ModuleIssue, [])
+    }
+
+    with batched_issue_deletes():
+        _, deleted = collector.delete()
+
+    refresh_cycle_progress(cycle_ids)
+    refresh_module_progress(module_ids)
+    for project_id in {issue.project_id for issue in issues}:
+        invalidate_group_counts(project_id)
+        schedule_analytics_refresh(project_id)
+    return deleted
+
+
+def purge_model(model, cutoff, start_pk=None):
+    """
+    Delete the rows of the model soft deleted before the cutoff, in batches
+    ordered by primary key. Rows nothing depends on are deleted with a
+    single statement per batch, others go through the collector. Returns
+    the deleted rows per model
+    """
+    queryset = model.all_objects.filter(deleted_at__lt=cutoff).order_by("pk")
+    fast_delete = Collector(using=queryset.db).can_fast_delete(queryset)
+
+    deleted = {}
+    last_pk = start_pk
+    while True:
+        batch = queryset
+        if last_pk is not None:
+            batch = batch.filter(pk__gt=last_pk)
+        pks = list(
+            batch.values_list("pk", flat=True)[
+                : settings.HARD_DELETE_BATCH_SIZE
+            ]
+        )
+        if not pks:
+            return deleted
+
+        batch = model.all_objects.filter(pk__in=pks)
+        if fast_delete:
+            batch_deleted = {model._meta.label: batch._raw_delete(batch.db)}
+        else:
+            batch_deleted = delete_batch(batch)
+        for label, count in batch_deleted.items():
+            deleted[label] = deleted.get(label, 0) + count
+
+        # Resume after the last batch if the purge is interrupted
+        last_pk = pks[-1]
+        cache.set(
+            HARD_DELETE_CHECKPOINT_KEY,
+            {"model": model._meta.label, "pk": last_pk},
+            None,
+        )
+        if settings.HARD_DELETE_BATCH_SLEEP:
+            time.sleep(settings.HARD_DELETE_BATCH_SLEEP)
 
 
 @shared_task
 def hard_delete():
+    # Skip the run while a previous one is still purging
+    if not cache.add(HARD_DELETE_LOCK_KEY, True, HARD_DELETE_LOCK_TIMEOUT):
+        return {}
 
-    from plane.db.models import (
-        Workspace,
-        Project,
-        Cycle,
-        Module,
-        Issue,
-        Page,
-        IssueView,
-        Label,
-        State,
-        IssueActivity,
-        IssueComment,
-        IssueLink,
-        IssueReaction,
-        UserFavorite,
-        ModuleIssue,
-        CycleIssue,
-        Estimate,
-        EstimatePoint,
-    )
+    try:
+        cutoff = timezone.now() - timezone.timedelta(
+            days=settings.HARD_DELETE_AFTER_DAYS
+        )
+        # Models pointing at another one are purged before it, so that its
+        # cascade has less left to collect
+        purge_order = get_cascade_order(
+            *[model for model in apps.get_models() if is_soft_deletable(model)]
+        )
+
+        # Resume from the checkpoint of an interrupted run
+        start_pk = None
+        checkpoint = cache.get(HARD_DELETE_CHECKPOINT_KEY)
+        labels = [model._meta.label for model in purge_order]
+        if checkpoint and checkpoint["model"] in labels:
+            purge_order = purge_order[labels.index(checkpoint["model"]) :]
+            start_pk = checkpoint["pk"]
+
+        metrics = {}
+        for model in purge_order:
+            started_at = time.monotonic()
+            deleted = purge_model(model, cutoff, start_pk)
+            start_pk = None
+            duration = time.monotonic() - started_at
+
+            metrics[model._meta.label] = {
+                "deleted": deleted,
+                "seconds": round(duration, 3),
+            }
+            if deleted:
+                logging.getLogger("plane").info(
+                    f"Hard deleted {deleted} in {duration:.2f}s"
+                )
 
-    days = settings.HARD_DELETE_AFTER_DAYS
-    # check delete workspace
-    _ = Workspace.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete project
-    _ = Project.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete cycle
-    _ = Cycle.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete module
-    _ = Module.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete issue
-    _ = Issue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete page
-    _ = Page.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete view
-    _ = IssueView.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete label
-    _ = Label.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # check delete state
-    _ = State.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueActivity.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueComment.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueLink.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = IssueReaction.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = UserFavorite.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = ModuleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = CycleIssue.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = Estimate.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    _ = EstimatePoint.all_objects.filter(
-        deleted_at__lt=timezone.now() - timezone.timedelta(days=days)
-    ).delete()
-
-    # at last, check for every thing which ever is left and delete it
-    # Get all Django models
-    all_models = apps.get_models()
-
-    # Iterate through all models
-    for model in all_models:
-        # Check if the model has a 'deleted_at' field
-        if hasattr(model, "deleted_at"):
-            # Get all instances where 'deleted_at' is greater than 30 days ago
-            _ = model.all_objects.filter(
-                deleted_at__lt=timezone.now()
-                - timezone.timedelta(days=days)
-            ).delete()
-
-    return
+        cache.delete(HARD_DELETE_CHECKPOINT_KEY)
+        return metrics
+    finally:
+        cache.delete(HARD_DELETE_LOCK_KEY)
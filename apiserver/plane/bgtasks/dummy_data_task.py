@@ -22,6 +22,7 @@ from plane.db.models import (
     Module,
     Issue,
     IssueSequence,
+    IssueSequenceCounter,
     IssueAssignee,
     IssueLabel,
     IssueActivity,
@@ -33,6 +34,7 @@ from plane.db.models import (
     Inbox,
     InboxIssue,
 )
+from plane.utils.group_count import invalidate_group_counts
 
 
 def create_project(workspace, user_id):
@@ -316,15 +318,13 @@ def create_issues(workspace, project, user_id, issue_count):
     ).values_list("member_id", flat=True)
 
     issues = []
+    if issue_count < 1:
+        return issues
 
-    # Get the maximum sequence_id
-    last_id = IssueSequence.objects.filter(
-        project=project,
-    ).aggregate(
-        largest=Max("sequence")
-    )["largest"]
-
-    last_id = 1 if last_id is None else last_id + 1
+    # Reserve the sequence ids for all the issues at once
+    last_id = IssueSequenceCounter.objects.allocate(
+        project.id, count=issue_count
+    )[0]
 
     # Get the maximum sort order
     largest_sort_order = Issue.objects.filter(
@@ -695,4 +695,7 @@ def create_dummy_data(
         issue_count=issue_count,
     )
 
+    # The issues and their links are bulk created without the signals
+    invalidate_group_counts(project.id)
+
     return
@@ -1,6 +1,8 @@
 import logging
 import re
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 
 from bs4 import BeautifulSoup
 
@@ -19,6 +21,14 @@ from plane.license.utils.instance_value import get_email_configuration
 from plane.settings.redis import redis_instance
 from plane.utils.exception_logger import log_exception
 
+# Logs read from the database cursor at a time
+EMAIL_DIGEST_CHUNK_SIZE = 1000
+# Emails handed to a single sender task
+EMAIL_DIGEST_BATCH_SIZE = 50
+# Logs processed by a run, a backlog is worked off over several runs
+EMAIL_DIGEST_MAX_LOGS = 10000
+EMAIL_DIGEST_LOCK_TIMEOUT = 60 * 10
+
 
 def remove_unwanted_characters(input_text):
     # Keep only alphanumeric characters, spaces, and dashes.
@@ -39,64 +49,92 @@ def release_lock(lock_id):
     redis_client.delete(lock_id)
 
 
-@shared_task
-def stack_email_notification():
-    # get all email notifications
-    email_notifications = (
-        EmailNotificationLog.objects.filter(processed_at__isnull=True)
-        .order_by("receiver")
-        .values()
+def queue_email_notifications(notifications, email_notification_ids):
+    """Hand a batch of emails to a sender and mark their logs processed"""
+    if not email_notification_ids:
+        return
+    send_email_notification_batch.delay(notifications=notifications)
+    EmailNotificationLog.objects.filter(pk__in=email_notification_ids).update(
+        processed_at=timezone.now()
     )
 
-    # Create the below format for each of the issues
-    # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
 
-    # Convert to unique receivers list
-    receivers = list(
-        set(
-            [
-                str(notification.get("receiver_id"))
-                for notification in email_notifications
-            ]
+@shared_task
+def stack_email_notification():
+    # Only one run at a time, the next run picks up the unprocessed logs
+    if not acquire_lock(
+        lock_id="stack_email_notification",
+        expire_time=EMAIL_DIGEST_LOCK_TIMEOUT,
+    ):
+        return
+
+    try:
+        # Stream the unprocessed logs, the logs of a receiver are adjacent
+        email_notifications = (
+            EmailNotificationLog.objects.filter(processed_at__isnull=True)
+            .order_by("receiver_id", "created_at")
+            .values(
+                "id",
+                "receiver_id",
+                "triggered_by_id",
+                "entity_identifier",
+                "data",
+            )
+            .iterator(chunk_size=EMAIL_DIGEST_CHUNK_SIZE)
         )
-    )
-    processed_notifications = []
-    # Loop through all the issues to create the emails
-    for receiver_id in receivers:
-        # Notification triggered for the receiver
-        receiver_notifications = [
-            notification
-            for notification in email_notifications
-            if str(notification.get("receiver_id")) == receiver_id
-        ]
-        # create payload for all issues
-        payload = {}
+
+        # Create the below format for each of the issues of the receiver
+        # {"issue_id" : { "actor_id1": [ { data }, { data } ], "actor_id2": [ { data }, { data } ] }}
+        notifications = []
         email_notification_ids = []
-        for receiver_notification in receiver_notifications:
-            payload.setdefault(
-                receiver_notification.get("entity_identifier"), {}
-            ).setdefault(
-                str(receiver_notification.get("triggered_by_id")), []
-            ).append(
-                receiver_notification.get("data")
-            )
-            # append processed notifications
-            processed_notifications.append(receiver_notification.get("id"))
-            email_notification_ids.append(receiver_notification.get("id"))
-
-        # Create emails for all the issues
-        for issue_id, notification_data in payload.items():
-            send_email_notification.delay(
-                issue_id=issue_id,
-                notification_data=notification_data,
-                receiver_id=receiver_id,
-                email_notification_ids=email_notification_ids,
-            )
+        processed_count = 0
+        for receiver_id, receiver_notifications in groupby(
+            email_notifications, key=itemgetter("receiver_id")
+        ):
+            payload = {}
+            for receiver_notification in receiver_notifications:
+                issue_payload = payload.setdefault(
+                    str(receiver_notification.get("entity_identifier")),
+                    {"notification_data": {}, "email_notification_ids": []},
+                )
+                issue_payload["notification_data"].setdefault(
+                    str(receiver_notification.get("triggered_by_id")), []
+                ).append(receiver_notification.get("data"))
+                issue_payload["email_notification_ids"].append(
+                    str(receiver_notification.get("id"))
+                )
 
-    # Update the email notification log
-    EmailNotificationLog.objects.filter(pk__in=processed_notifications).update(
-        processed_at=timezone.now()
-    )
+            # Create emails for all the issues
+            for issue_id, issue_payload in payload.items():
+                notifications.append(
+                    {
+                        "issue_id": issue_id,
+                        "receiver_id": str(receiver_id),
+                        **issue_payload,
+                    }
+                )
+                email_notification_ids.extend(
+                    issue_payload["email_notification_ids"]
+                )
+
+            if len(notifications) >= EMAIL_DIGEST_BATCH_SIZE:
+                queue_email_notifications(
+                    notifications, email_notification_ids
+                )
+                processed_count += len(email_notification_ids)
+                notifications = []
+                email_notification_ids = []
+
+            # Leave the rest of a large backlog to the next runs
+            if (
+                processed_count + len(email_notification_ids)
+                >= EMAIL_DIGEST_MAX_LOGS
+            ):
+                break
+
+        queue_email_notifications(notifications, email_notification_ids)
+    finally:
+        release_lock(lock_id="stack_email_notification")
 
 
 def create_payload(notification_data):
@@ -168,177 +206,245 @@ def process_html_content(content):
     return processed_content_list
 
 
-@shared_task
-def send_email_notification(
-    issue_id, notification_data, receiver_id, email_notification_ids
+def get_email_connection():
+    # Get email configurations
+    (
+        EMAIL_HOST,
+        EMAIL_HOST_USER,
+        EMAIL_HOST_PASSWORD,
+        EMAIL_PORT,
+        EMAIL_USE_TLS,
+        EMAIL_USE_SSL,
+        EMAIL_FROM,
+    ) = get_email_configuration()
+
+    connection = get_connection(
+        host=EMAIL_HOST,
+        port=int(EMAIL_PORT),
+        username=EMAIL_HOST_USER,
+        password=EMAIL_HOST_PASSWORD,
+        use_tls=EMAIL_USE_TLS == "1",
+        use_ssl=EMAIL_USE_SSL == "1",
+    )
+    return connection, EMAIL_FROM
+
+
+def create_email_notification(
+    issue, receiver, users, base_api, notification_data, from_email
 ):
+    """
+    Render the issue update email of the receiver, the actors are looked up
+    in the users fetched for the whole batch
+    """
+    data = create_payload(notification_data=notification_data)
+
+    template_data = []
+    total_changes = 0
+    comments = []
+    actors_involved = []
+    for actor_id, changes in data.items():
+        actor = users.get(str(actor_id))
+        if actor is None:
+            return None
+        total_changes = total_changes + len(changes)
+        comment = changes.pop("comment", False)
+        mention = changes.pop("mention", False)
+        actors_involved.append(actor_id)
+        if comment:
+            comments.append(
+                {
+                    "actor_comments": comment,
+                    "actor_detail": {
+                        "avatar_url": actor.avatar,
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        if mention:
+            mention["new_value"] = process_html_content(
+                mention.get("new_value")
+            )
+            mention["old_value"] = process_html_content(
+                mention.get("old_value")
+            )
+            comments.append(
+                {
+                    "actor_comments": mention,
+                    "actor_detail": {
+                        "avatar_url": actor.avatar,
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                }
+            )
+        activity_time = changes.pop("activity_time")
+        # Parse the input string into a datetime object
+        formatted_time = datetime.strptime(
+            activity_time, "%Y-%m-%d %H:%M:%S"
+        ).strftime("%H:%M %p")
+
+        if changes:
+            template_data.append(
+                {
+                    "actor_detail": {
+                        "avatar_url": actor.avatar,
+                        "first_name": actor.first_name,
+                        "last_name": actor.last_name,
+                    },
+                    "changes": changes,
+                    "issue_details": {
+                        "name": issue.name,
+                        "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
+                    },
+                    "activity_time": str(formatted_time),
+                }
+            )
+
+    summary = "Updates were made to the issue by"
+
+    # Send the mail
+    subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
+    context = {
+        "data": template_data,
+        "summary": summary,
+        "actors_involved": len(set(actors_involved)),
+        "issue": {
+            "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
+            "name": issue.name,
+            "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        },
+        "receiver": {
+            "email": receiver.email,
+        },
+        "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
+        "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
+        "workspace": str(issue.project.workspace.slug),
+        "project": str(issue.project.name),
+        "user_preference": f"{base_api}/profile/preferences/email",
+        "comments": comments,
+    }
+    html_content = render_to_string(
+        "emails/notifications/issue-updates.html", context
+    )
+    text_content = strip_tags(html_content)
+
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=from_email,
+        to=[receiver.email],
+    )
+    msg.attach_alternative(html_content, "text/html")
+    return msg
+
+
+def get_email_lock_id(issue_id, receiver_id, email_notification_ids):
     # Convert UUIDs to a sorted, concatenated string
     sorted_ids = sorted(email_notification_ids)
     ids_str = "_".join(str(id) for id in sorted_ids)
-    lock_id = f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
+    return f"send_email_notif_{issue_id}_{receiver_id}_{ids_str}"
 
-    # acquire the lock for sending emails
-    try:
-        if acquire_lock(lock_id=lock_id):
-            # get the redis instance
-            ri = redis_instance()
-            base_api = (
-                ri.get(str(issue_id)).decode()
-                if ri.get(str(issue_id))
-                else None
-            )
 
-            # Skip if base api is not present
-            if not base_api:
-                return
-
-            data = create_payload(notification_data=notification_data)
-
-            # Get email configurations
-            (
-                EMAIL_HOST,
-                EMAIL_HOST_USER,
-                EMAIL_HOST_PASSWORD,
-                EMAIL_PORT,
-                EMAIL_USE_TLS,
-                EMAIL_USE_SSL,
-                EMAIL_FROM,
-            ) = get_email_configuration()
-
-            receiver = User.objects.get(pk=receiver_id)
-            issue = Issue.objects.get(pk=issue_id)
-            template_data = []
-            total_changes = 0
-            comments = []
-            actors_involved = []
-            for actor_id, changes in data.items():
-                actor = User.objects.get(pk=actor_id)
-                total_changes = total_changes + len(changes)
-                comment = changes.pop("comment", False)
-                mention = changes.pop("mention", False)
-                actors_involved.append(actor_id)
-                if comment:
-                    comments.append(
-                        {
-                            "actor_comments": comment,
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                if mention:
-                    mention["new_value"] = process_html_content(
-                        mention.get("new_value")
-                    )
-                    mention["old_value"] = process_html_content(
-                        mention.get("old_value")
-                    )
-                    comments.append(
-                        {
-                            "actor_comments": mention,
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                        }
-                    )
-                activity_time = changes.pop("activity_time")
-                # Parse the input string into a datetime object
-                formatted_time = datetime.strptime(
-                    activity_time, "%Y-%m-%d %H:%M:%S"
-                ).strftime("%H:%M %p")
-
-                if changes:
-                    template_data.append(
-                        {
-                            "actor_detail": {
-                                "avatar_url": actor.avatar,
-                                "first_name": actor.first_name,
-                                "last_name": actor.last_name,
-                            },
-                            "changes": changes,
-                            "issue_details": {
-                                "name": issue.name,
-                                "identifier": f"{issue.project.identifier}-{issue.sequence_id}",
-                            },
-                            "activity_time": str(formatted_time),
-                        }
-                    )
-
-            summary = "Updates were made to the issue by"
-
-            # Send the mail
-            subject = f"{issue.project.identifier}-{issue.sequence_id} {remove_unwanted_characters(issue.name)}"
-            context = {
-                "data": template_data,
-                "summary": summary,
-                "actors_involved": len(set(actors_involved)),
-                "issue": {
-                    "issue_identifier": f"{str(issue.project.identifier)}-{str(issue.sequence_id)}",
-                    "name": issue.name,
-                    "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                },
-                "receiver": {
-                    "email": receiver.email,
-                },
-                "issue_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/{str(issue.id)}",
-                "project_url": f"{base_api}/{str(issue.project.workspace.slug)}/projects/{str(issue.project.id)}/issues/",
-                "workspace": str(issue.project.workspace.slug),
-                "project": str(issue.project.name),
-                "user_preference": f"{base_api}/profile/preferences/email",
-                "comments": comments,
+@shared_task
+def send_email_notification_batch(notifications):
+    """
+    Send the issue update emails of a batch of receivers over one smtp
+    connection, the issues and the users are fetched once for the batch
+    """
+    issues = {
+        str(issue.id): issue
+        for issue in Issue.objects.filter(
+            pk__in={
+                notification["issue_id"] for notification in notifications
             }
-            html_content = render_to_string(
-                "emails/notifications/issue-updates.html", context
-            )
-            text_content = strip_tags(html_content)
-
-            try:
-                connection = get_connection(
-                    host=EMAIL_HOST,
-                    port=int(EMAIL_PORT),
-                    username=EMAIL_HOST_USER,
-                    password=EMAIL_HOST_PASSWORD,
-                    use_tls=EMAIL_USE_TLS == "1",
-                    use_ssl=EMAIL_USE_SSL == "1",
-                )
-
-                msg = EmailMultiAlternatives(
-                    subject=subject,
-                    body=text_content,
-                    from_email=EMAIL_FROM,
-                    to=[receiver.email],
-                    connection=connection,
+        ).select_related("project__workspace")
+    }
+    user_ids = set()
+    for notification in notifications:
+        user_ids.add(notification["receiver_id"])
+        user_ids.update(notification["notification_data"].keys())
+    users = {
+        str(user.id): user for user in User.objects.filter(pk__in=user_ids)
+    }
+
+    # get the redis instance
+    ri = redis_instance()
+    issue_ids = list(issues.keys())
+    base_apis = dict(zip(issue_ids, ri.mget(issue_ids))) if issue_ids else {}
+
+    sent_ids = []
+    connection, from_email = get_email_connection()
+    try:
+        with connection:
+            for notification in notifications:
+                issue = issues.get(notification["issue_id"])
+                receiver = users.get(notification["receiver_id"])
+                base_api = base_apis.get(notification["issue_id"])
+                # Skip if the issue, the receiver or the base api is gone
+                if issue is None or receiver is None or not base_api:
+                    continue
+
+                # acquire the lock for sending emails
+                lock_id = get_email_lock_id(
+                    issue_id=notification["issue_id"],
+                    receiver_id=notification["receiver_id"],
+                    email_notification_ids=notification[
+                        "email_notification_ids"
+                    ],
                 )
-                msg.attach_alternative(html_content, "text/html")
-                msg.send()
-                logging.getLogger("plane").info("Email Sent Successfully")
-
-                # Update the logs
-                EmailNotificationLog.objects.filter(
-                    pk__in=email_notification_ids
-                ).update(sent_at=timezone.now())
-
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-            except Exception as e:
-                log_exception(e)
-                # release the lock
-                release_lock(lock_id=lock_id)
-                return
-        else:
-            logging.getLogger("plane").info(
-                "Duplicate email received skipping"
-            )
-            return
-    except (Issue.DoesNotExist, User.DoesNotExist):
-        release_lock(lock_id=lock_id)
-        return
+                if not acquire_lock(lock_id=lock_id):
+                    logging.getLogger("plane").info(
+                        "Duplicate email received skipping"
+                    )
+                    continue
+
+                try:
+                    msg = create_email_notification(
+                        issue=issue,
+                        receiver=receiver,
+                        users=users,
+                        base_api=base_api.decode(),
+                        notification_data=notification["notification_data"],
+                        from_email=from_email,
+                    )
+                    if msg is not None:
+                        msg.connection = connection
+                        msg.send()
+                        sent_ids.extend(notification["email_notification_ids"])
+                except Exception as e:
+                    log_exception(e)
+                finally:
+                    # release the lock
+                    release_lock(lock_id=lock_id)
     except Exception as e:
         log_exception(e)
-        release_lock(lock_id=lock_id)
-        return
+    finally:
+        # Update the logs
+        if sent_ids:
+            logging.getLogger("plane").info(
+                f"{len(sent_ids)} notification emails sent"
+            )
+            EmailNotificationLog.objects.filter(pk__in=sent_ids).update(
+                sent_at=timezone.now()
+            )
+
+
+@shared_task
+def send_email_notification(
+    issue_id, notification_data, receiver_id, email_notification_ids
+):
+    # Kept for the emails queued before the batched sender
+    send_email_notification_batch(
+        notifications=[
+            {
+                "issue_id": str(issue_id),
+                "receiver_id": str(receiver_id),
+                "notification_data": notification_data,
+                "email_notification_ids": [
+                    str(email_notification_id)
+                    for email_notification_id in email_notification_ids
+                ],
+            }
+        ]
+    )
@@ -2,7 +2,10 @@
 import csv
 import io
 import json
+import shutil
+import tempfile
 import zipfile
+from itertools import islice
 
 import boto3
 from botocore.client import Config
@@ -16,9 +19,21 @@ from django.utils import timezone
 from openpyxl import Workbook
 
 # Module imports
-from plane.db.models import ExporterHistory, Issue
+from plane.db.models import (
+    CycleIssue,
+    ExporterHistory,
+    Issue,
+    IssueAssignee,
+    IssueLabel,
+    ModuleIssue,
+)
 from plane.utils.exception_logger import log_exception
 
+# Issues read from the database cursor at a time
+EXPORT_CHUNK_SIZE = 2000
+# Parts of the multipart upload, s3 needs at least 5mb per part
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 def dateTimeConverter(time):
     if time:
@@ -30,117 +45,169 @@ def dateConverter(time):
         return time.strftime("%a, %d %b %Y")
 
 
-def create_csv_file(data):
-    csv_buffer = io.StringIO()
-    csv_writer = csv.writer(csv_buffer, delimiter=",", quoting=csv.QUOTE_ALL)
-
-    for row in data:
-        csv_writer.writerow(row)
+class S3MultipartWriter:
+    """
+    Write only file object uploading to the bucket in parts as the data
+    comes in, at most one part is held in memory
+    """
 
-    csv_buffer.seek(0)
-    return csv_buffer.getvalue()
+    def __init__(self, client, bucket, key, content_type):
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.buffer = bytearray()
+        self.parts = []
+        self.position = 0
+        self.upload_id = client.create_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            ACL="public-read",
+            ContentType=content_type,
+        )["UploadId"]
+
+    def write(self, data):
+        self.buffer.extend(data)
+        self.position += len(data)
+        if len(self.buffer) >= MULTIPART_CHUNK_SIZE:
+            self.upload_part()
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def upload_part(self):
+        part_number = len(self.parts) + 1
+        response = self.client.upload_part(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            PartNumber=part_number,
+            Body=bytes(self.buffer),
+        )
+        self.parts.append(
+            {"ETag": response["ETag"], "PartNumber": part_number}
+        )
+        self.buffer.clear()
+
+    def close(self):
+        # The last part may be smaller than the minimum part size
+        if self.buffer or not self.parts:
+            self.upload_part()
+        self.client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self.parts},
+        )
 
+    def abort(self):
+        self.client.abort_multipart_upload(
+            Bucket=self.bucket, Key=self.key, UploadId=self.upload_id
+        )
 
-def create_json_file(data):
-    return json.dumps(data)
 
+def get_s3_client(endpoint_url=None):
+    if endpoint_url:
+        return boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            config=Config(signature_version="s3v4"),
+        )
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=Config(signature_version="s3v4"),
+    )
 
-def create_xlsx_file(data):
-    workbook = Workbook()
-    sheet = workbook.active
 
-    for row in data:
+def write_csv_file(stream, header, rows):
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    csv_writer = csv.writer(text_stream, delimiter=",", quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(header)
+    for row in rows:
+        csv_writer.writerow(row)
+    text_stream.flush()
+    text_stream.detach()
+
+
+def write_json_file(stream, header, rows):
+    # Same output as dumping the whole list, written one issue at a time
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8")
+    text_stream.write("[")
+    for index, row in enumerate(rows):
+        if index:
+            text_stream.write(", ")
+        text_stream.write(json.dumps(dict(zip(header, row))))
+    text_stream.write("]")
+    text_stream.flush()
+    text_stream.detach()
+
+
+def write_xlsx_file(stream, header, rows):
+    # Write only workbooks keep the rows in a temporary file on disk
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
         sheet.append(row)
 
-    xlsx_buffer = io.BytesIO()
-    workbook.save(xlsx_buffer)
-    xlsx_buffer.seek(0)
-    return xlsx_buffer.getvalue()
-
+    with tempfile.TemporaryFile() as xlsx_file:
+        workbook.save(xlsx_file)
+        xlsx_file.seek(0)
+        shutil.copyfileobj(xlsx_file, stream, MULTIPART_CHUNK_SIZE)
 
-def create_zip_file(files):
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for filename, file_content in files:
-            zipf.writestr(filename, file_content)
 
-    zip_buffer.seek(0)
-    return zip_buffer
-
-
-def upload_to_s3(zip_file, workspace_id, token_id, slug):
+def upload_export(files, workspace_id, token_id, slug):
+    """
+    Stream the zip of the export files into a multipart upload.
+    Every file is a (name, writer, rows) tuple, the rows are written
+    into the zip entry as they are read
+    """
     file_name = f"{workspace_id}/export-{slug}-{token_id[:6]}-{str(timezone.now().date())}.zip"
     expires_in = 7 * 24 * 60 * 60
 
     if settings.USE_MINIO:
-        upload_s3 = boto3.client(
-            "s3",
-            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-        )
-        upload_s3.upload_fileobj(
-            zip_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
-        )
-
+        upload_s3 = get_s3_client(settings.AWS_S3_ENDPOINT_URL)
         # Generate presigned url for the uploaded file with different base
-        presign_s3 = boto3.client(
-            "s3",
-            endpoint_url=f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/",
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=Config(signature_version="s3v4"),
-        )
-
-        presigned_url = presign_s3.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                "Key": file_name,
-            },
-            ExpiresIn=expires_in,
+        presign_s3 = get_s3_client(
+            f"{settings.AWS_S3_URL_PROTOCOL}//{str(settings.AWS_S3_CUSTOM_DOMAIN).replace('/uploads', '')}/"
         )
     else:
-
         # If endpoint url is present, use it
-        if settings.AWS_S3_ENDPOINT_URL:
-            s3 = boto3.client(
-                "s3",
-                endpoint_url=settings.AWS_S3_ENDPOINT_URL,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
-        else:
-            s3 = boto3.client(
-                "s3",
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version="s3v4"),
-            )
-
-        # Upload the file to S3
-        s3.upload_fileobj(
-            zip_file,
-            settings.AWS_STORAGE_BUCKET_NAME,
-            file_name,
-            ExtraArgs={"ACL": "public-read", "ContentType": "application/zip"},
-        )
+        upload_s3 = presign_s3 = get_s3_client(settings.AWS_S3_ENDPOINT_URL)
 
-        # Generate presigned url for the uploaded file
-        presigned_url = s3.generate_presigned_url(
-            "get_object",
-            Params={
-                "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                "Key": file_name,
-            },
-            ExpiresIn=expires_in,
-        )
+    zip_stream = S3MultipartWriter(
+        upload_s3,
+        settings.AWS_STORAGE_BUCKET_NAME,
+        file_name,
+        "application/zip",
+    )
+    try:
+        with zipfile.ZipFile(zip_stream, "w", zipfile.ZIP_DEFLATED) as zipf:
+            for name, writer, header, rows in files:
+                with zipf.open(name, "w", force_zip64=True) as stream:
+                    writer(stream, header, rows)
+        zip_stream.close()
+    except Exception:
+        zip_stream.abort()
+        raise
+
+    # Generate presigned url for the uploaded file
+    presigned_url = presign_s3.generate_presigned_url(
+        "get_object",
+        Params={
+            "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
+            "Key": file_name,
+        },
+        ExpiresIn=expires_in,
+    )
 
     exporter_instance = ExporterHistory.objects.get(token=token_id)
 
@@ -169,12 +236,8 @@ def generate_table_row(issue):
             and issue["created_by__last_name"]
             else ""
         ),
-        (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        issue["labels__name"],
+        ", ".join(issue["assignees"]),
+        ", ".join(issue["labels"]) or None,
         issue["issue_cycle__cycle__name"],
         dateConverter(issue["issue_cycle__cycle__start_date"]),
         dateConverter(issue["issue_cycle__cycle__end_date"]),
@@ -188,122 +251,103 @@ def generate_table_row(issue):
     ]
 
 
-def generate_json_row(issue):
-    return {
-        "ID": f"""{issue["project__identifier"]}-{issue["sequence_id"]}""",
-        "Project": issue["project__name"],
-        "Name": issue["name"],
-        "Description": issue["description_stripped"],
-        "State": issue["state__name"],
-        "Priority": issue["priority"],
-        "Created By": (
-            f"{issue['created_by__first_name']} {issue['created_by__last_name']}"
-            if issue["created_by__first_name"]
-            and issue["created_by__last_name"]
-            else ""
-        ),
-        "Assignee": (
-            f"{issue['assignees__first_name']} {issue['assignees__last_name']}"
-            if issue["assignees__first_name"] and issue["assignees__last_name"]
-            else ""
-        ),
-        "Labels": issue["labels__name"],
-        "Cycle Name": issue["issue_cycle__cycle__name"],
-        "Cycle Start Date": dateConverter(
-            issue["issue_cycle__cycle__start_date"]
-        ),
-        "Cycle End Date": dateConverter(issue["issue_cycle__cycle__end_date"]),
-        "Module Name": issue["issue_module__module__name"],
-        "Module Start Date": dateConverter(
-            issue["issue_module__module__start_date"]
-        ),
-        "Module Target Date": dateConverter(
-            issue["issue_module__module__target_date"]
-        ),
-        "Created At": dateTimeConverter(issue["created_at"]),
-        "Updated At": dateTimeConverter(issue["updated_at"]),
-        "Completed At": dateTimeConverter(issue["completed_at"]),
-        "Archived At": dateTimeConverter(issue["archived_at"]),
+def get_issue_relations(issue_ids):
+    """
+    Fetch the assignees, labels, cycle and module of the issues with one
+    query per relation, indexed by the issue id
+    """
+    relations = {
+        issue_id: {
+            "assignees": [],
+            "labels": [],
+            "issue_cycle__cycle__name": None,
+            "issue_cycle__cycle__start_date": None,
+            "issue_cycle__cycle__end_date": None,
+            "issue_module__module__name": None,
+            "issue_module__module__start_date": None,
+            "issue_module__module__target_date": None,
+        }
+        for issue_id in issue_ids
     }
 
+    for issue_id, first_name, last_name in (
+        IssueAssignee.objects.filter(issue_id__in=issue_ids)
+        .order_by("created_at")
+        .values_list("issue_id", "assignee__first_name", "assignee__last_name")
+    ):
+        if first_name and last_name:
+            relations[issue_id]["assignees"].append(
+                f"{first_name} {last_name}"
+            )
 
-def update_json_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row["ID"] == row["ID"]
-        ),
-        None,
-    )
-
-    if matched_index is not None:
-        existing_assignees, existing_labels = (
-            rows[matched_index]["Assignee"],
-            rows[matched_index]["Labels"],
+    for issue_id, label_name in (
+        IssueLabel.objects.filter(issue_id__in=issue_ids)
+        .order_by("label__name")
+        .values_list("issue_id", "label__name")
+        .distinct()
+    ):
+        relations[issue_id]["labels"].append(label_name)
+
+    for cycle_issue in CycleIssue.objects.filter(
+        issue_id__in=issue_ids
+    ).values(
+        "issue_id",
+        "cycle__name",
+        "cycle__start_date",
+        "cycle__end_date",
+    ):
+        relations[cycle_issue["issue_id"]].update(
+            {
+                "issue_cycle__cycle__name": cycle_issue["cycle__name"],
+                "issue_cycle__cycle__start_date": cycle_issue[
+                    "cycle__start_date"
+                ],
+                "issue_cycle__cycle__end_date": cycle_issue["cycle__end_date"],
+            }
         )
-        assignee, label = row["Assignee"], row["Labels"]
 
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index]["Assignee"] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index]["Labels"] += f", {label}"
-    else:
-        rows.append(row)
-
-
-def update_table_row(rows, row):
-    matched_index = next(
-        (
-            index
-            for index, existing_row in enumerate(rows)
-            if existing_row[0] == row[0]
-        ),
-        None,
-    )
+    # The export has a single module column, keep the first module added
+    for module_issue in (
+        ModuleIssue.objects.filter(issue_id__in=issue_ids)
+        .order_by("issue_id", "created_at")
+        .distinct("issue_id")
+        .values(
+            "issue_id",
+            "module__name",
+            "module__start_date",
+            "module__target_date",
+        )
+    ):
+        relations[module_issue["issue_id"]].update(
+            {
+                "issue_module__module__name": module_issue["module__name"],
+                "issue_module__module__start_date": module_issue[
+                    "module__start_date"
+                ],
+                "issue_module__module__target_date": module_issue[
+                    "module__target_date"
+                ],
+            }
+        )
 
-    if matched_index is not None:
-        existing_assignees, existing_labels = rows[matched_index][7:9]
-        assignee, label = row[7:9]
+    return relations
 
-        if assignee is not None and assignee not in existing_assignees:
-            rows[matched_index][7] += f", {assignee}"
-        if label is not None and label not in existing_labels:
-            rows[matched_index][8] += f", {label}"
-    else:
-        rows.append(row)
 
-
-def generate_csv(header, project_id, issues, files):
+def generate_rows(issues):
     """
-    Generate CSV export for all the passed issues.
+    Yield one table row per issue while reading the issues in chunks,
+    the relations of every chunk are fetched in bulk
     """
-    rows = [
-        header,
-    ]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    csv_file = create_csv_file(rows)
-    files.append((f"{project_id}.csv", csv_file))
+    issues = issues.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    while True:
+        chunk = list(islice(issues, EXPORT_CHUNK_SIZE))
+        if not chunk:
+            return
 
-
-def generate_json(header, project_id, issues, files):
-    rows = []
-    for issue in issues:
-        row = generate_json_row(issue)
-        update_json_row(rows, row)
-    json_file = create_json_file(rows)
-    files.append((f"{project_id}.json", json_file))
-
-
-def generate_xlsx(header, project_id, issues, files):
-    rows = [header]
-    for issue in issues:
-        row = generate_table_row(issue)
-        update_table_row(rows, row)
-    xlsx_file = create_xlsx_file(rows)
-    files.append((f"{project_id}.xlsx", xlsx_file))
+        relations = get_issue_relations([issue["id"] for issue in chunk])
+        for issue in chunk:
+            issue.update(relations[issue["id"]])
+            yield generate_table_row(issue)
 
 
 @shared_task
@@ -316,49 +360,29 @@ def issue_export_task(
         exporter_instance.save(update_fields=["status"])
 
         workspace_issues = (
-            (
-                Issue.objects.filter(
-                    workspace__id=workspace_id,
-                    project_id__in=project_ids,
-                    project__project_projectmember__member=exporter_instance.initiated_by_id,
-                    project__project_projectmember__is_active=True,
-                    project__archived_at__isnull=True,
-                )
-                .select_related(
-                    "project", "workspace", "state", "parent", "created_by"
-                )
-                .prefetch_related(
-                    "assignees",
-                    "labels",
-                    "issue_cycle__cycle",
-                    "issue_module__module",
-                )
-                .values(
-                    "id",
-                    "project__identifier",
-                    "project__name",
-                    "project__id",
-                    "sequence_id",
-                    "name",
-                    "description_stripped",
-                    "priority",
-                    "state__name",
-                    "created_at",
-                    "updated_at",
-                    "completed_at",
-                    "archived_at",
-                    "issue_cycle__cycle__name",
-                    "issue_cycle__cycle__start_date",
-                    "issue_cycle__cycle__end_date",
-                    "issue_module__module__name",
-                    "issue_module__module__start_date",
-                    "issue_module__module__target_date",
-                    "created_by__first_name",
-                    "created_by__last_name",
-                    "assignees__first_name",
-                    "assignees__last_name",
-                    "labels__name",
-                )
+            Issue.objects.filter(
+                workspace__id=workspace_id,
+                project_id__in=project_ids,
+                project__project_projectmember__member=exporter_instance.initiated_by_id,
+                project__project_projectmember__is_active=True,
+                project__archived_at__isnull=True,
+            )
+            .values(
+                "id",
+                "project__identifier",
+                "project__name",
+                "project__id",
+                "sequence_id",
+                "name",
+                "description_stripped",
+                "priority",
+                "state__name",
+                "created_at",
+                "updated_at",
+                "completed_at",
+                "archived_at",
+                "created_by__first_name",
+                "created_by__last_name",
             )
             .order_by("project__identifier", "sequence_id")
             .distinct()
@@ -387,36 +411,36 @@ def issue_export_task(
         ]
 
         EXPORTER_MAPPER = {
-            "csv": generate_csv,
-            "json": generate_json,
-            "xlsx": generate_xlsx,
+            "csv": write_csv_file,
+            "json": write_json_file,
+            "xlsx": write_xlsx_file,
         }
 
+        exporter = EXPORTER_MAPPER.get(provider)
         files = []
-        if multiple:
-            for project_id in project_ids:
-                issues = workspace_issues.filter(project__id=project_id)
-                exporter = EXPORTER_MAPPER.get(provider)
-                if exporter is not None:
-                    exporter(
+        if exporter is not None:
+            if multiple:
+                for project_id in project_ids:
+                    issues = workspace_issues.filter(project__id=project_id)
+                    files.append(
+                        (
+                            f"{project_id}.{provider}",
+                            exporter,
+                            header,
+                            generate_rows(issues),
+                        )
+                    )
+            else:
+                files.append(
+                    (
+                        f"{workspace_id}.{provider}",
+                        exporter,
                         header,
-                        project_id,
-                        issues,
-                        files,
+                        generate_rows(workspace_issues),
                     )
-
-        else:
-            exporter = EXPORTER_MAPPER.get(provider)
-            if exporter is not None:
-                exporter(
-                    header,
-                    workspace_id,
-                    workspace_issues,
-                    files,
                 )
 
-        zip_buffer = create_zip_file(files)
-        upload_to_s3(zip_buffer, workspace_id, token_id, slug)
+        upload_export(files, workspace_id, token_id, slug)
 
     except Exception as e:
         exporter_instance = ExporterHistory.objects.get(token=token_id)
@@ -1,5 +1,7 @@
 # Python imports
 import json
+from collections import defaultdict
+from uuid import UUID
 
 import requests
 
@@ -29,8 +31,11 @@ from plane.db.models import (
     State,
     User,
     EstimatePoint,
+    Webhook,
 )
-from plane.settings.redis import redis_instance
+from plane.settings.redis import redis_instance, redis_pipeline
+from plane.utils.analytics_rollup import schedule_analytics_refresh
+from plane.utils.group_count import invalidate_group_counts
 from plane.utils.exception_logger import log_exception
 from plane.bgtasks.webhook_task import webhook_activity
 
@@ -1614,6 +1619,143 @@ def create_inbox_activity(
         )
 
 
+ACTIVITY_MAPPER = {
+    "issue.activity.created": create_issue_activity,
+    "issue.activity.updated": update_issue_activity,
+    "issue.activity.deleted": delete_issue_activity,
+    "comment.activity.created": create_comment_activity,
+    "comment.activity.updated": update_comment_activity,
+    "comment.activity.deleted": delete_comment_activity,
+    "cycle.activity.created": create_cycle_issue_activity,
+    "cycle.activity.deleted": delete_cycle_issue_activity,
+    "module.activity.created": create_module_issue_activity,
+    "module.activity.deleted": delete_module_issue_activity,
+    "link.activity.created": create_link_activity,
+    "link.activity.updated": update_link_activity,
+    "link.activity.deleted": delete_link_activity,
+    "attachment.activity.created": create_attachment_activity,
+    "attachment.activity.deleted": delete_attachment_activity,
+    "issue_relation.activity.created": create_issue_relation_activity,
+    "issue_relation.activity.deleted": delete_issue_relation_activity,
+    "issue_reaction.activity.created": create_issue_reaction_activity,
+    "issue_reaction.activity.deleted": delete_issue_reaction_activity,
+    "comment_reaction.activity.created": create_comment_reaction_activity,
+    "comment_reaction.activity.deleted": delete_comment_reaction_activity,
+    "issue_vote.activity.created": create_issue_vote_activity,
+    "issue_vote.activity.deleted": delete_issue_vote_activity,
+    "issue_draft.activity.created": create_draft_issue_activity,
+    "issue_draft.activity.updated": update_draft_issue_activity,
+    "issue_draft.activity.deleted": delete_draft_issue_activity,
+    "inbox.activity.created": create_inbox_activity,
+}
+
+
+def dispatch_issue_activities(issue_activities_created, origin, inbox):
+    """Post the created activities to the proxy and the webhooks"""
+    # Post the updates to segway for integrations and webhooks
+    try:
+        if settings.PROXY_BASE_URL:
+            for issue_activity in issue_activities_created:
+                headers = {"Content-Type": "application/json"}
+                issue_activity_json = json.dumps(
+                    IssueActivitySerializer(issue_activity).data,
+                    cls=DjangoJSONEncoder,
+                )
+                _ = requests.post(
+                    f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
+                    json=issue_activity_json,
+                    headers=headers,
+                )
+    except Exception as e:
+        log_exception(e)
+
+    # Only fan out to the workspaces having an active webhook
+    workspace_slugs = dict(
+        Webhook.objects.filter(
+            workspace_id__in={
+                activity.workspace_id for activity in issue_activities_created
+            },
+            is_active=True,
+        ).values_list("workspace_id", "workspace__slug")
+    )
+
+    for activity in issue_activities_created:
+        if activity.workspace_id not in workspace_slugs:
+            continue
+        webhook_activity.delay(
+            event=(
+                "issue_comment"
+                if activity.field == "comment"
+                else "inbox_issue" if inbox else "issue"
+            ),
+            event_id=(
+                activity.issue_comment_id
+                if activity.field == "comment"
+                else inbox if inbox else activity.issue_id
+            ),
+            verb=activity.verb,
+            field=(
+                "description" if activity.field == "comment" else activity.field
+            ),
+            old_value=(
+                activity.old_value if activity.old_value != "" else None
+            ),
+            new_value=(
+                activity.new_value if activity.new_value != "" else None
+            ),
+            actor_id=activity.actor_id,
+            current_site=origin,
+            slug=workspace_slugs[activity.workspace_id],
+            old_identifier=activity.old_identifier,
+            new_identifier=activity.new_identifier,
+        )
+
+
+def coalesce_issue_activities(activities):
+    """
+    Merge the field updates of the same issue by the same actor into a
+    single payload. The oldest current value and the newest requested value
+    of every field are kept, so a field changed back and forth yields no
+    activity at all
+    """
+    coalesced = []
+    updates = {}
+    for activity in activities:
+        if activity.get("type") != "issue.activity.updated":
+            coalesced.append(dict(activity))
+            continue
+
+        key = (
+            str(activity.get("issue_id")),
+            str(activity.get("actor_id")),
+            activity.get("subscriber", True),
+            activity.get("notification", False),
+            activity.get("origin"),
+            activity.get("inbox"),
+        )
+        if key not in updates:
+            updates[key] = dict(activity)
+            coalesced.append(updates[key])
+            continue
+
+        update = updates[key]
+        requested_data = json.loads(update.get("requested_data") or "{}")
+        requested_data.update(
+            json.loads(activity.get("requested_data") or "{}")
+        )
+        current_instance = json.loads(update.get("current_instance") or "{}")
+        for field, value in json.loads(
+            activity.get("current_instance") or "{}"
+        ).items():
+            current_instance.setdefault(field, value)
+
+        update["requested_data"] = json.dumps(requested_data)
+        update["current_instance"] = json.dumps(current_instance)
+        update["epoch"] = activity.get("epoch", update.get("epoch"))
+
+    return coalesced
+
+
 # Receive message from room group
 @shared_task
 def issue_activity(
@@ -1648,36 +1790,6 @@ def issue_activity(
                 except Exception:
                     pass
 
-        ACTIVITY_MAPPER = {
-            "issue.activity.created": create_issue_activity,
-            "issue.activity.updated": update_issue_activity,
-            "issue.activity.deleted": delete_issue_activity,
-            "comment.activity.created": create_comment_activity,
-            "comment.activity.updated": update_comment_activity,
-            "comment.activity.deleted": delete_comment_activity,
-            "cycle.activity.created": create_cycle_issue_activity,
-            "cycle.activity.deleted": delete_cycle_issue_activity,
-            "module.activity.created": create_module_issue_activity,
-            "module.activity.deleted": delete_module_issue_activity,
-            "link.activity.created": create_link_activity,
-            "link.activity.updated": update_link_activity,
-            "link.activity.deleted": delete_link_activity,
-            "attachment.activity.created": create_attachment_activity,
-            "attachment.activity.deleted": delete_attachment_activity,
-            "issue_relation.activity.created": create_issue_relation_activity,
-            "issue_relation.activity.deleted": delete_issue_relation_activity,
-            "issue_reaction.activity.created": create_issue_reaction_activity,
-            "issue_reaction.activity.deleted": delete_issue_reaction_activity,
-            "comment_reaction.activity.created": create_comment_reaction_activity,
-            "comment_reaction.activity.deleted": delete_comment_reaction_activity,
-            "issue_vote.activity.created": create_issue_vote_activity,
-            "issue_vote.activity.deleted": delete_issue_vote_activity,
-            "issue_draft.activity.created": create_draft_issue_activity,
-            "issue_draft.activity.updated": update_draft_issue_activity,
-            "issue_draft.activity.deleted": delete_draft_issue_activity,
-            "inbox.activity.created": create_inbox_activity,
-        }
-
         func = ACTIVITY_MAPPER.get(type)
         if func is not None:
             func(
@@ -1695,63 +1807,10 @@ def issue_activity(
         issue_activities_created = IssueActivity.objects.bulk_create(
             issue_activities
         )
-        # Post the updates to segway for integrations and webhooks
         if len(issue_activities_created):
-            # Don't send activities if the actor is a bot
-            try:
-                if settings.PROXY_BASE_URL:
-                    for issue_activity in issue_activities_created:
-                        headers = {"Content-Type": "application/json"}
-                        issue_activity_json = json.dumps(
-                            IssueActivitySerializer(issue_activity).data,
-                            cls=DjangoJSONEncoder,
-                        )
-                        _ = requests.post(
-                            f"{settings.PROXY_BASE_URL}/hooks/workspaces/{str(issue_activity.workspace_id)}/projects/{str(issue_activity.project_id)}/issues/{str(issue_activity.issue_id)}/issue-activity-hooks/",
-                            json=issue_activity_json,
-                            headers=headers,
-                        )
-            except Exception as e:
-                log_exception(e)
-
-            for activity in issue_activities_created:
-                webhook_activity.delay(
-                    event=(
-                        "issue_comment"
-                        if activity.field == "comment"
-                        else "inbox_issue"
-                        if inbox
-                        else "issue"
-                    ),
-                    event_id=(
-                        activity.issue_comment_id
-                        if activity.field == "comment"
-                        else inbox
-                        if inbox
-                        else activity.issue_id
-                    ),
-                    verb=activity.verb,
-                    field=(
-                        "description"
-                        if activity.field == "comment"
-                        else activity.field
-                    ),
-                    old_value=(
-                        activity.old_value
-                        if activity.old_value != ""
-                        else None
-                    ),
-                    new_value=(
-                        activity.new_value
-                        if activity.new_value != ""
-                        else None
-                    ),
-                    actor_id=activity.actor_id,
-                    current_site=origin,
-                    slug=activity.workspace.slug,
-                    old_identifier=activity.old_identifier,
-                    new_identifier=activity.new_identifier,
-                )
+            dispatch_issue_activities(
+                issue_activities_created, origin=origin, inbox=inbox
+            )
 
         if notification:
             notifications.delay(
@@ -1774,3 +1833,103 @@ def issue_activity(
     except Exception as e:
         log_exception(e)
         return
+
+
+@shared_task
+def issue_activity_batch(activities):
+    """
+    Process many issue_activity payloads at once. Updates of the same issue
+    are coalesced, projects are resolved and issues are touched with one
+    query each and all the activities are inserted with one bulk create
+    """
+    try:
+        activities = coalesce_issue_activities(activities)
+
+        workspace_ids = dict(
+            Project.objects.filter(
+                pk__in={activity["project_id"] for activity in activities}
+            ).values_list("id", "workspace_id")
+        )
+
+        issue_ids = {
+            str(activity["issue_id"])
+            for activity in activities
+            if activity.get("issue_id") is not None
+        }
+        origins = {
+            str(activity["issue_id"]): activity["origin"]
+            for activity in activities
+            if activity.get("issue_id") is not None and activity.get("origin")
+        }
+        if origins:
+            with redis_pipeline() as pipe:
+                for issue_id, origin in origins.items():
+                    # set the request origin in redis
+                    pipe.set(issue_id, origin, ex=600)
+
+        if issue_ids:
+            Issue.objects.filter(pk__in=issue_ids).update(
+                updated_at=timezone.now()
+            )
+            # The update above sends no signal to invalidate the counts
+            for project_id in {
+                activity["project_id"] for activity in activities
+            }:
+                invalidate_group_counts(project_id)
+                schedule_analytics_refresh(project_id)
+
+        # Collect the activities of every payload into one list
+        issue_activities = []
+        payload_activities = []
+        for activity in activities:
+            start = len(issue_activities)
+            func = ACTIVITY_MAPPER.get(activity["type"])
+            workspace_id = workspace_ids.get(UUID(str(activity["project_id"])))
+            if func is not None and workspace_id is not None:
+                func(
+                    requested_data=activity.get("requested_data"),
+                    current_instance=activity.get("current_instance"),
+                    issue_id=activity.get("issue_id"),
+                    project_id=activity["project_id"],
+                    workspace_id=workspace_id,
+                    actor_id=activity.get("actor_id"),
+                    issue_activities=issue_activities,
+                    epoch=activity.get("epoch"),
+                )
+            payload_activities.append((start, len(issue_activities)))
+
+        # Save all the values to database
+        issue_activities_created = IssueActivity.objects.bulk_create(
+            issue_activities, batch_size=1000
+        )
+
+        dispatch_groups = defaultdict(list)
+        for activity, (start, stop) in zip(activities, payload_activities):
+            created = issue_activities_created[start:stop]
+            dispatch_groups[
+                (activity.get("origin"), activity.get("inbox"))
+            ].extend(created)
+
+            if activity.get("notification", False):
+                notifications.delay(
+                    type=activity["type"],
+                    issue_id=activity.get("issue_id"),
+                    actor_id=activity.get("actor_id"),
+                    project_id=activity["project_id"],
+                    subscriber=activity.get("subscriber", True),
+                    issue_activities_created=json.dumps(
+                        IssueActivitySerializer(created, many=True).data,
+                        cls=DjangoJSONEncoder,
+                    ),
+                    requested_data=activity.get("requested_data"),
+                    current_instance=activity.get("current_instance"),
+                )
+
+        for (origin, inbox), created in dispatch_groups.items():
+            if created:
+                dispatch_issue_activities(created, origin=origin, inbox=inbox)
+
+        return
+    except Exception as e:
+        log_exception(e)
+        return
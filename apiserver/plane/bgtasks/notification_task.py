@@ -83,36 +83,47 @@ def get_removed_mentions(requested_instance, current_instance):
 def extract_mentions_as_subscribers(project_id, issue_id, mentions):
     # mentions is an array of User IDs representing the FILTERED set of mentioned users
 
-    bulk_mention_subscribers = []
+    if not mentions:
+        return []
 
-    for mention_id in mentions:
-        # If the particular mention has not already been subscribed to the issue, he must be sent the mentioned notification
-        if (
-            not IssueSubscriber.objects.filter(
-                issue_id=issue_id,
-                subscriber_id=mention_id,
-                project_id=project_id,
-            ).exists()
-            and not IssueAssignee.objects.filter(
-                project_id=project_id,
-                issue_id=issue_id,
-                assignee_id=mention_id,
-            ).exists()
-            and not Issue.objects.filter(
-                project_id=project_id, pk=issue_id, created_by_id=mention_id
-            ).exists()
-        ):
-            project = Project.objects.get(pk=project_id)
-
-            bulk_mention_subscribers.append(
-                IssueSubscriber(
-                    workspace_id=project.workspace_id,
-                    project_id=project_id,
-                    issue_id=issue_id,
-                    subscriber_id=mention_id,
-                )
-            )
-    return bulk_mention_subscribers
+    # Users already subscribed, assigned or creating the issue are skipped
+    skipped_users = {
+        str(user_id)
+        for user_id in IssueSubscriber.objects.filter(
+            issue_id=issue_id,
+            project_id=project_id,
+            subscriber_id__in=mentions,
+        ).values_list("subscriber_id", flat=True)
+    }
+    skipped_users.update(
+        str(user_id)
+        for user_id in IssueAssignee.objects.filter(
+            project_id=project_id,
+            issue_id=issue_id,
+            assignee_id__in=mentions,
+        ).values_list("assignee_id", flat=True)
+    )
+    skipped_users.update(
+        str(user_id)
+        for user_id in Issue.objects.filter(
+            project_id=project_id, pk=issue_id
+        ).values_list("created_by_id", flat=True)
+    )
+
+    workspace_id = Project.objects.values_list(
+        "workspace_id", flat=True
+    ).get(pk=project_id)
+
+    return [
+        IssueSubscriber(
+            workspace_id=workspace_id,
+            project_id=project_id,
+            issue_id=issue_id,
+            subscriber_id=mention_id,
+        )
+        for mention_id in mentions
+        if str(mention_id) not in skipped_users
+    ]
 
 
 # Parse Issue Description & extracts mentions
@@ -311,7 +322,11 @@ def notifications(
                 .values_list("subscriber", flat=True)
             )
 
-            issue = Issue.objects.filter(pk=issue_id).first()
+            issue = (
+                Issue.objects.filter(pk=issue_id)
+                .select_related("project__workspace", "state")
+                .first()
+            )
 
             if subscriber:
                 # add the user to issue subscriber
@@ -324,16 +339,60 @@ def notifications(
                 except Exception:
                     pass
 
-            project = Project.objects.get(pk=project_id)
+            project = Project.objects.select_related("workspace").get(
+                pk=project_id
+            )
 
-            issue_assignees = IssueAssignee.objects.filter(
-                issue_id=issue_id, project_id=project_id
-            ).values_list("assignee", flat=True)
+            issue_assignees = set(
+                IssueAssignee.objects.filter(
+                    issue_id=issue_id, project_id=project_id
+                ).values_list("assignee", flat=True)
+            )
 
             issue_subscribers = list(
                 set(issue_subscribers) - {uuid.UUID(actor_id)}
             )
 
+            # Resolve the preferences of all the receivers at once
+            preferences = {
+                str(preference.user_id): preference
+                for preference in UserNotificationPreference.objects.filter(
+                    user_id__in=issue_subscribers
+                    + comment_mentions
+                    + new_mentions
+                )
+            }
+
+            # Resolve the comments of the activities at once
+            issue_comments = {
+                str(comment_id): comment
+                for comment_id, comment in IssueComment.objects.filter(
+                    id__in=[
+                        issue_activity.get("issue_comment")
+                        for issue_activity in issue_activities_created
+                        if issue_activity.get("issue_comment")
+                    ],
+                    issue_id=issue_id,
+                    project_id=project_id,
+                    workspace_id=project.workspace_id,
+                ).values_list("id", "comment_stripped")
+            }
+
+            # Completed states of the project, only needed for state changes
+            completed_states = (
+                {
+                    str(state_id)
+                    for state_id in State.objects.filter(
+                        project_id=project_id, group="completed"
+                    ).values_list("id", flat=True)
+                }
+                if any(
+                    issue_activity.get("field") == "state"
+                    for issue_activity in issue_activities_created
+                )
+                else set()
+            )
+
             for subscriber in issue_subscribers:
                 if issue.created_by_id and issue.created_by_id == subscriber:
                     sender = "in_app:issue_activities:created"
@@ -345,9 +404,7 @@ def notifications(
                 else:
                     sender = "in_app:issue_activities:subscribed"
 
-                preference = UserNotificationPreference.objects.get(
-                    user_id=subscriber
-                )
+                preference = preferences.get(str(subscriber))
 
                 for issue_activity in issue_activities_created:
                     # If activity done in blocking then blocked by email should not go
@@ -363,7 +420,9 @@ def notifications(
 
                     # Check if the value should be sent or not
                     send_email = False
-                    if (
+                    if preference is None:
+                        send_email = False
+                    elif (
                         issue_activity.get("field") == "state"
                         and preference.state_change
                     ):
@@ -371,11 +430,8 @@ def notifications(
                     elif (
                         issue_activity.get("field") == "state"
                         and preference.issue_completed
-                        and State.objects.filter(
-                            project_id=project_id,
-                            pk=issue_activity.get("new_identifier"),
-                            group="completed",
-                        ).exists()
+                        and str(issue_activity.get("new_identifier"))
+                        in completed_states
                     ):
                         send_email = True
                     elif (
@@ -388,16 +444,9 @@ def notifications(
                     else:
                         send_email = False
 
-                    # If activity is of issue comment fetch the comment
-                    issue_comment = (
-                        IssueComment.objects.filter(
-                            id=issue_activity.get("issue_comment"),
-                            issue_id=issue_id,
-                            project_id=project_id,
-                            workspace_id=project.workspace_id,
-                        ).first()
-                        if issue_activity.get("issue_comment")
-                        else None
+                    # If activity is of issue comment use the comment
+                    issue_comment = issue_comments.get(
+                        str(issue_activity.get("issue_comment")), ""
                     )
 
                     # Create in app notification
@@ -435,11 +484,7 @@ def notifications(
                                     "old_value": str(
                                         issue_activity.get("old_value")
                                     ),
-                                    "issue_comment": str(
-                                        issue_comment.comment_stripped
-                                        if issue_comment is not None
-                                        else ""
-                                    ),
+                                    "issue_comment": str(issue_comment),
                                 },
                             },
                         )
@@ -484,11 +529,7 @@ def notifications(
                                         "old_value": str(
                                             issue_activity.get("old_value")
                                         ),
-                                        "issue_comment": str(
-                                            issue_comment.comment_stripped
-                                            if issue_comment is not None
-                                            else ""
-                                        ),
+                                        "issue_comment": str(issue_comment),
                                         "activity_time": issue_activity.get(
                                             "created_at"
                                         ),
@@ -516,9 +557,7 @@ def notifications(
 
             for mention_id in comment_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     for issue_activity in issue_activities_created:
                         notification = create_mention_notification(
                             project=project,
@@ -531,7 +570,7 @@ def notifications(
                         )
 
                         # check for email notifications
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
@@ -583,9 +622,7 @@ def notifications(
 
             for mention_id in new_mentions:
                 if mention_id != actor_id:
-                    preference = UserNotificationPreference.objects.get(
-                        user_id=mention_id
-                    )
+                    preference = preferences.get(str(mention_id))
                     if (
                         last_activity is not None
                         and last_activity.field == "description"
@@ -631,11 +668,11 @@ def notifications(
                                 },
                             )
                         )
-                        if preference.mention:
+                        if preference is not None and preference.mention:
                             bulk_email_logs.append(
                                 EmailNotificationLog(
                                     triggered_by_id=actor_id,
-                                    receiver_id=subscriber,
+                                    receiver_id=mention_id,
                                     entity_identifier=issue_id,
                                     entity_name="issue",
                                     data={
@@ -678,11 +715,11 @@ def notifications(
                                 issue_id=issue_id,
                                 activity=issue_activity,
                             )
-                            if preference.mention:
+                            if preference is not None and preference.mention:
                                 bulk_email_logs.append(
                                     EmailNotificationLog(
                                         triggered_by_id=actor_id,
-                                        receiver_id=subscriber,
+                                        receiver_id=mention_id,
                                         entity_identifier=issue_id,
                                         entity_name="issue",
                                         data={
@@ -1,8 +1,5 @@
-import hashlib
-import hmac
 import json
 import logging
-import uuid
 
 import requests
 
@@ -12,7 +9,6 @@ from celery import shared_task
 # Django imports
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives, get_connection
-from django.core.serializers.json import DjangoJSONEncoder
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 from django.core.exceptions import ObjectDoesNotExist
@@ -39,11 +35,18 @@ from plane.db.models import (
     Project,
     User,
     Webhook,
-    WebhookLog,
     InboxIssue,
 )
 from plane.license.utils.instance_value import get_email_configuration
 from plane.utils.exception_logger import log_exception
+from plane.utils.webhook_delivery import (
+    create_webhook_logs,
+    deliver_webhooks,
+    to_json_data,
+)
+
+WEBHOOK_RETRY_BACKOFF = 600
+WEBHOOK_MAX_RETRIES = 5
 
 SERIALIZER_MAPPER = {
     "project": ProjectSerializer,
@@ -80,106 +83,76 @@ def get_model_data(event, event_id, many=False):
     return serializer(queryset, many=many).data
 
 
+def deactivate_failed_webhook(webhook, current_site, reason):
+    Webhook.objects.filter(pk=webhook.id).update(is_active=False)
+    # send email for the deactivation of the webhook
+    send_webhook_deactivation_email(
+        webhook_id=webhook.id,
+        receiver_id=webhook.created_by_id,
+        reason=reason,
+        current_site=current_site,
+    )
+
+
+def send_webhook(
+    task,
+    webhook,
+    slug,
+    event,
+    event_data,
+    action,
+    current_site,
+    activity=None,
+):
+    webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
+
+    deliveries = deliver_webhooks(
+        [webhook],
+        event=event,
+        action=action,
+        event_data=to_json_data(event_data),
+        activity=to_json_data(activity),
+    )
+
+    # Log the webhook request
+    create_webhook_logs(
+        deliveries,
+        event=event,
+        action=action,
+        retry_count=task.request.retries,
+    )
+
+    error = deliveries[0][4]
+    if error is None:
+        return
+
+    # Retry logic
+    if task.request.retries >= task.max_retries:
+        deactivate_failed_webhook(webhook, current_site, str(error))
+        return
+    raise requests.RequestException()
+
+
 @shared_task(
     bind=True,
     autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
+    max_retries=WEBHOOK_MAX_RETRIES,
     retry_jitter=True,
 )
 def webhook_task(self, webhook, slug, event, event_data, action, current_site):
     try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(
-            webhook.url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
-
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
+        send_webhook(
+            self,
+            webhook=webhook,
+            slug=slug,
+            event=event,
+            event_data=event_data,
+            action=action,
+            current_site=current_site,
         )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
-
+    except requests.RequestException:
+        raise
     except Exception as e:
         if settings.DEBUG:
             print(e)
@@ -249,8 +222,8 @@ def send_webhook_deactivation_email(
 @shared_task(
     bind=True,
     autoretry_for=(requests.RequestException,),
-    retry_backoff=600,
-    max_retries=5,
+    retry_backoff=WEBHOOK_RETRY_BACKOFF,
+    max_retries=WEBHOOK_MAX_RETRIES,
     retry_jitter=True,
 )
 def webhook_send_task(
@@ -264,104 +237,18 @@ def webhook_send_task(
     activity,
 ):
     try:
-        webhook = Webhook.objects.get(id=webhook, workspace__slug=slug)
-
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Autopilot",
-            "X-Plane-Delivery": str(uuid.uuid4()),
-            "X-Plane-Event": event,
-        }
-
-        # # Your secret key
-        event_data = (
-            json.loads(json.dumps(event_data, cls=DjangoJSONEncoder))
-            if event_data is not None
-            else None
-        )
-
-        activity = (
-            json.loads(json.dumps(activity, cls=DjangoJSONEncoder))
-            if activity is not None
-            else None
-        )
-
-        action = {
-            "POST": "create",
-            "PATCH": "update",
-            "PUT": "update",
-            "DELETE": "delete",
-        }.get(action, action)
-
-        payload = {
-            "event": event,
-            "action": action,
-            "webhook_id": str(webhook.id),
-            "workspace_id": str(webhook.workspace_id),
-            "data": event_data,
-            "activity": activity,
-        }
-
-        # Use HMAC for generating signature
-        if webhook.secret_key:
-            hmac_signature = hmac.new(
-                webhook.secret_key.encode("utf-8"),
-                json.dumps(payload).encode("utf-8"),
-                hashlib.sha256,
-            )
-            signature = hmac_signature.hexdigest()
-            headers["X-Plane-Signature"] = signature
-
-        # Send the webhook event
-        response = requests.post(
-            webhook.url,
-            headers=headers,
-            json=payload,
-            timeout=30,
-        )
-
-        # Log the webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=str(response.status_code),
-            response_headers=str(response.headers),
-            response_body=str(response.text),
-            retry_count=str(self.request.retries),
-        )
-
-    except requests.RequestException as e:
-        # Log the failed webhook request
-        WebhookLog.objects.create(
-            workspace_id=str(webhook.workspace_id),
-            webhook_id=str(webhook.id),
-            event_type=str(event),
-            request_method=str(action),
-            request_headers=str(headers),
-            request_body=str(payload),
-            response_status=500,
-            response_headers="",
-            response_body=str(e),
-            retry_count=str(self.request.retries),
+        send_webhook(
+            self,
+            webhook=webhook,
+            slug=slug,
+            event=event,
+            event_data=event_data,
+            action=action,
+            current_site=current_site,
+            activity=activity,
         )
-        # Retry logic
-        if self.request.retries >= self.max_retries:
-            Webhook.objects.filter(pk=webhook.id).update(is_active=False)
-            if webhook:
-                # send email for the deactivation of the webhook
-                send_webhook_deactivation_email(
-                    webhook_id=webhook.id,
-                    receiver_id=webhook.created_by_id,
-                    reason=str(e),
-                    current_site=current_site,
-                )
-            return
-        raise requests.RequestException()
-
+    except requests.RequestException:
+        raise
     except Exception as e:
         if settings.DEBUG:
             print(e)
@@ -401,25 +288,51 @@ def webhook_activity(
         if event == "issue_comment":
             webhooks = webhooks.filter(issue_comment=True)
 
-        for webhook in webhooks:
-            webhook_send_task.delay(
-                webhook=webhook.id,
-                slug=slug,
-                event=event,
-                event_data=get_model_data(
-                    event=event,
-                    event_id=event_id,
-                ),
-                action=verb,
-                current_site=current_site,
-                activity={
-                    "field": field,
-                    "new_value": new_value,
-                    "old_value": old_value,
-                    "actor": get_model_data(event="user", event_id=actor_id),
-                    "old_identifier": old_identifier,
-                    "new_identifier": new_identifier,
+        webhooks = list(webhooks)
+        if not webhooks:
+            return
+
+        # Serialize the event once for all the webhooks of the workspace
+        event_data = to_json_data(
+            get_model_data(event=event, event_id=event_id)
+        )
+        activity = to_json_data(
+            {
+                "field": field,
+                "new_value": new_value,
+                "old_value": old_value,
+                "actor": get_model_data(event="user", event_id=actor_id),
+                "old_identifier": old_identifier,
+                "new_identifier": new_identifier,
+            }
+        )
+
+        deliveries = deliver_webhooks(
+            webhooks,
+            event=event,
+            action=verb,
+            event_data=event_data,
+            activity=activity,
+        )
+        create_webhook_logs(deliveries, event=event, action=verb)
+
+        # Hand the failed deliveries over to the retrying task, the first
+        # attempt already happened here
+        for webhook, _, _, _, error in deliveries:
+            if error is None:
+                continue
+            webhook_send_task.apply_async(
+                kwargs={
+                    "webhook": webhook.id,
+                    "slug": slug,
+                    "event": event,
+                    "event_data": event_data,
+                    "action": verb,
+                    "current_site": current_site,
+                    "activity": activity,
                 },
+                countdown=WEBHOOK_RETRY_BACKOFF,
+                retries=1,
             )
         return
     except Exception as e:
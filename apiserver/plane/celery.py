@@ -1,6 +1,7 @@
 import os
 from celery import Celery
-from plane.settings.redis import redis_instance
+from celery.signals import worker_process_init
+from plane.settings.redis import redis_instance, reset_redis_pool
 from celery.schedules import crontab
 
 # Set the default Django settings module for the 'celery' program.
@@ -32,10 +33,22 @@ app.conf.beat_schedule = {
         "task": "plane.bgtasks.email_notification_task.stack_email_notification",
         "schedule": crontab(minute="*/5"),
     },
+    "check-every-minute-to-process-api-logs": {
+        "task": "plane.bgtasks.api_logs_task.process_api_logs",
+        "schedule": crontab(minute="*"),
+    },
+    "check-every-minute-to-flush-api-token-last-used": {
+        "task": "plane.bgtasks.api_logs_task.flush_api_token_last_used",
+        "schedule": crontab(minute="*"),
+    },
     "check-every-day-to-delete-api-logs": {
         "task": "plane.bgtasks.api_logs_task.delete_api_logs",
         "schedule": crontab(hour=0, minute=0),
     },
+    "check-every-day-to-reconcile-analytics-rollups": {
+        "task": "plane.bgtasks.analytics_rollup_task.reconcile_analytics_rollups",
+        "schedule": crontab(hour=1, minute=0),
+    },
     "check-every-day-to-delete-hard-delete": {
         "task": "plane.bgtasks.deletion_task.hard_delete",
         "schedule": crontab(hour=0, minute=0),
@@ -46,3 +59,9 @@ app.conf.beat_schedule = {
 app.autodiscover_tasks()
 
 app.conf.beat_scheduler = "django_celery_beat.schedulers.DatabaseScheduler"
+
+
+@worker_process_init.connect
+def reset_redis_connections(**kwargs):
+    # Do not share the redis sockets of the parent with the forked worker
+    reset_redis_pool()
@@ -0,0 +1,59 @@
+# Python imports
+import time
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.db.models import User
+from plane.utils.synthetic_data import (
+    SYNTHETIC_DATA_PROFILES,
+    generate_synthetic_data,
+)
+
+
+class Command(BaseCommand):
+    help = "Fill a workspace with generated projects of the given size"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", type=str, help="workspace slug")
+        parser.add_argument("email", type=str, help="owner email")
+        parser.add_argument(
+            "--profile",
+            choices=list(SYNTHETIC_DATA_PROFILES),
+            default="S",
+            help="size of the generated data",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="the same seed generates the same data",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="parallel processes, one per cpu by default",
+        )
+
+    def handle(self, *args, **options):
+        if not User.objects.filter(email=options["email"]).exists():
+            raise CommandError(
+                f"Error: User with {options['email']} does not exists"
+            )
+
+        started_at = time.monotonic()
+        project_ids = generate_synthetic_data(
+            slug=options["slug"],
+            email=options["email"],
+            profile=options["profile"],
+            seed=options["seed"],
+            processes=options["processes"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated {len(project_ids)} projects in "
+                f"{time.monotonic() - started_at:.1f}s"
+            )
+        )
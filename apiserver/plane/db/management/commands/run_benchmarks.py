@@ -0,0 +1,64 @@
+# Python imports
+import json
+
+# Django imports
+from django.core.management import BaseCommand, CommandError
+
+# Module imports
+from plane.utils.benchmark import BENCHMARK_ENDPOINTS, run_benchmarks
+
+
+class Command(BaseCommand):
+    help = "Measure the hot endpoints and write the results to a baseline"
+
+    def add_arguments(self, parser):
+        parser.add_argument("slug", type=str, help="workspace slug")
+        parser.add_argument("email", type=str, help="requesting user email")
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="measured requests per endpoint",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="requests per endpoint before measuring",
+        )
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            choices=list(BENCHMARK_ENDPOINTS),
+            help="endpoint to measure, all of them by default",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default="benchmark_baseline.json",
+            help="json file the results are written to",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(
+                slug=options["slug"],
+                email=options["email"],
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                endpoints=options["endpoint"],
+            )
+        except ValueError as e:
+            raise CommandError(f"Error: {str(e)}")
+
+        with open(options["output"], "w") as baseline:
+            json.dump(results, baseline, indent=2)
+
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name}: p50 {result['p50_ms']}ms, "
+                f"p95 {result['p95_ms']}ms, {result['queries']} queries"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Results written to {options['output']}")
+        )
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.15 on 2026-10-18 18:46
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def create_issue_sequence_counters(apps, schema_editor):
+    IssueSequence = apps.get_model("db", "IssueSequence")
+    IssueSequenceCounter = apps.get_model("db", "IssueSequenceCounter")
+
+    # Start every project from the largest sequence handed out so far
+    IssueSequenceCounter.objects.bulk_create(
+        [
+            IssueSequenceCounter(
+                project_id=sequence["project_id"],
+                last_sequence=sequence["largest"],
+            )
+            for sequence in IssueSequence.objects.values("project_id")
+            .annotate(largest=models.Max("sequence"))
+            .order_by()
+        ],
+        batch_size=1000,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0074_deploy_board_and_project_issues"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueSequenceCounter",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Last Modified At"
+                    ),
+                ),
+                (
+                    "project",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="issue_sequence_counter",
+                        serialize=False,
+                        to="db.project",
+                    ),
+                ),
+                ("last_sequence", models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Issue Sequence Counter",
+                "verbose_name_plural": "Issue Sequence Counters",
+                "db_table": "issue_sequence_counters",
+            },
+        ),
+        migrations.RunPython(
+            create_issue_sequence_counters,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
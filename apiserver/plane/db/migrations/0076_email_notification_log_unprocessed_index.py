@@ -0,0 +1,21 @@
+# Generated by Django 4.2.15 on 2026-10-18 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0075_issue_sequence_counter"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="emailnotificationlog",
+            index=models.Index(
+                condition=models.Q(("processed_at__isnull", True)),
+                fields=["receiver", "created_at"],
+                name="email_log_unprocessed_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 4.2.15 on 2026-10-18 18:59
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0076_email_notification_log_unprocessed_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IssueAnalyticsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Last Modified At"
+                    ),
+                ),
+                ("x_axis", models.CharField(max_length=64)),
+                (
+                    "segment_axis",
+                    models.CharField(blank=True, default="", max_length=64),
+                ),
+                ("dimension", models.TextField(blank=True, null=True)),
+                ("segment", models.TextField(blank=True, null=True)),
+                ("issue_count", models.PositiveIntegerField(default=0)),
+                ("estimate", models.FloatField(blank=True, null=True)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="issue_analytics_rollups",
+                        to="db.project",
+                    ),
+                ),
+                (
+                    "workspace",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="issue_analytics_rollups",
+                        to="db.workspace",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Issue Analytics Rollup",
+                "verbose_name_plural": "Issue Analytics Rollups",
+                "db_table": "issue_analytics_rollups",
+                "indexes": [
+                    models.Index(
+                        fields=["workspace", "x_axis", "segment_axis"],
+                        name="analytics_rollup_axis_idx",
+                    ),
+                    models.Index(
+                        fields=["project", "x_axis", "segment_axis"],
+                        name="analytics_rollup_project_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,102 @@
+# Generated by Django 4.2.15 on 2026-10-18 19:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("db", "0077_issue_analytics_rollup"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CycleProgress",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Last Modified At"
+                    ),
+                ),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_estimate_points", models.FloatField(default=0)),
+                ("backlog_estimate_points", models.FloatField(default=0)),
+                ("unstarted_estimate_points", models.FloatField(default=0)),
+                ("started_estimate_points", models.FloatField(default=0)),
+                ("completed_estimate_points", models.FloatField(default=0)),
+                ("cancelled_estimate_points", models.FloatField(default=0)),
+                (
+                    "cycle",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="progress",
+                        serialize=False,
+                        to="db.cycle",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Cycle Progress",
+                "verbose_name_plural": "Cycle Progress",
+                "db_table": "cycle_progress",
+            },
+        ),
+        migrations.CreateModel(
+            name="ModuleProgress",
+            fields=[
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Created At"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Last Modified At"
+                    ),
+                ),
+                ("total_issues", models.PositiveIntegerField(default=0)),
+                ("backlog_issues", models.PositiveIntegerField(default=0)),
+                ("unstarted_issues", models.PositiveIntegerField(default=0)),
+                ("started_issues", models.PositiveIntegerField(default=0)),
+                ("completed_issues", models.PositiveIntegerField(default=0)),
+                ("cancelled_issues", models.PositiveIntegerField(default=0)),
+                ("total_estimate_points", models.FloatField(default=0)),
+                ("backlog_estimate_points", models.FloatField(default=0)),
+                ("unstarted_estimate_points", models.FloatField(default=0)),
+                ("started_estimate_points", models.FloatField(default=0)),
+                ("completed_estimate_points", models.FloatField(default=0)),
+                ("cancelled_estimate_points", models.FloatField(default=0)),
+                (
+                    "module",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="progress",
+                        serialize=False,
+                        to="db.module",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Module Progress",
+                "verbose_name_plural": "Module Progress",
+                "db_table": "module_progress",
+            },
+        ),
+    ]
@@ -0,0 +1,135 @@
+# Generated by Django 4.2.15 on 2026-10-18 19:08
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import (
+    AddIndexConcurrently,
+    TrigramExtension,
+)
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    # The indexes are built without locking the tables for writes
+    atomic = False
+
+    dependencies = [
+        ("db", "0078_cycle_module_progress"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        AddIndexConcurrently(
+            model_name="cycle",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="cycle_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="issue_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issueview",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="issue_view_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="module",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="module_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="page",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="page_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="project_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="project",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("identifier"),
+                    name="gin_trgm_ops",
+                ),
+                name="project_identifier_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="workspace",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"),
+                    name="gin_trgm_ops",
+                ),
+                name="workspace_name_trgm_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="issue",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "name", config="simple", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description_stripped", config="simple", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                name="issue_search_vector_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="page",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "name", config="simple", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description_stripped", config="simple", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("simple"),
+                ),
+                name="page_search_vector_idx",
+            ),
+        ),
+    ]
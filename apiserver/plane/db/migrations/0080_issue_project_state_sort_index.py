@@ -0,0 +1,23 @@
+# Generated by Django 4.2.15 on 2026-10-18 20:05
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # The index is built without locking the issues for writes
+    atomic = False
+
+    dependencies = [
+        ("db", "0079_search_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="issue",
+            index=models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_project_state_sort_idx",
+            ),
+        ),
+    ]
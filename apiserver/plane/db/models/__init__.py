@@ -2,7 +2,13 @@ from .analytic import AnalyticView
 from .api import APIActivityLog, APIToken
 from .asset import FileAsset
 from .base import BaseModel
-from .cycle import Cycle, CycleFavorite, CycleIssue, CycleUserProperties
+from .cycle import (
+    Cycle,
+    CycleFavorite,
+    CycleIssue,
+    CycleProgress,
+    CycleUserProperties,
+)
 from .dashboard import Dashboard, DashboardWidget, Widget
 from .deploy_board import DeployBoard
 from .estimate import Estimate, EstimatePoint
@@ -33,6 +39,7 @@ from .issue import (
     IssueReaction,
     IssueRelation,
     IssueSequence,
+    IssueSequenceCounter,
     IssueSubscriber,
     IssueVote,
     Label,
@@ -43,6 +50,7 @@ from .module import (
     ModuleIssue,
     ModuleLink,
     ModuleMember,
+    ModuleProgress,
     ModuleUserProperties,
 )
 from .notification import (
@@ -93,7 +101,7 @@ from .estimate import Estimate, EstimatePoint
 
 from .inbox import Inbox, InboxIssue
 
-from .analytic import AnalyticView
+from .analytic import AnalyticView, IssueAnalyticsRollup
 
 from .notification import (
     Notification,
@@ -2,6 +2,7 @@
 from django.db import models
 
 from .base import BaseModel
+from ..mixins import TimeAuditModel
 
 
 class AnalyticView(BaseModel):
@@ -22,3 +23,46 @@ class AnalyticView(BaseModel):
     def __str__(self):
         """Return name of the analytic view"""
         return f"{self.name} <{self.workspace.name}>"
+
+
+class IssueAnalyticsRollup(TimeAuditModel):
+    """
+    Issue count and estimate of a project grouped by an analytics axis and
+    segment. Every rolled up axis of a project has at least one row with an
+    empty dimension, so a project without issues is still known as rolled up
+    """
+
+    workspace = models.ForeignKey(
+        "db.Workspace",
+        related_name="issue_analytics_rollups",
+        on_delete=models.CASCADE,
+    )
+    project = models.ForeignKey(
+        "db.Project",
+        related_name="issue_analytics_rollups",
+        on_delete=models.CASCADE,
+    )
+    x_axis = models.CharField(max_length=64)
+    segment_axis = models.CharField(max_length=64, blank=True, default="")
+    dimension = models.TextField(null=True, blank=True)
+    segment = models.TextField(null=True, blank=True)
+    issue_count = models.PositiveIntegerField(default=0)
+    estimate = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Issue Analytics Rollup"
+        verbose_name_plural = "Issue Analytics Rollups"
+        db_table = "issue_analytics_rollups"
+        indexes = [
+            models.Index(
+                fields=["workspace", "x_axis", "segment_axis"],
+                name="analytics_rollup_axis_idx",
+            ),
+            models.Index(
+                fields=["project", "x_axis", "segment_axis"],
+                name="analytics_rollup_project_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.project_id} <{self.x_axis}:{self.segment_axis}>"
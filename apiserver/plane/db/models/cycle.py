@@ -1,8 +1,11 @@
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 # Module imports
+from ..mixins import TimeAuditModel
 from .project import ProjectBaseModel
 
 
@@ -77,6 +80,12 @@ class Cycle(ProjectBaseModel):
         verbose_name_plural = "Cycles"
         db_table = "cycles"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="cycle_name_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if self._state.adding:
@@ -116,6 +125,46 @@ class CycleIssue(ProjectBaseModel):
         return f"{self.cycle}"
 
 
+class IssueProgressModel(TimeAuditModel):
+    """
+    Issue counts and estimate point sums per state group, kept up to date
+    when the issues change instead of being aggregated on every read
+    """
+
+    total_issues = models.PositiveIntegerField(default=0)
+    backlog_issues = models.PositiveIntegerField(default=0)
+    unstarted_issues = models.PositiveIntegerField(default=0)
+    started_issues = models.PositiveIntegerField(default=0)
+    completed_issues = models.PositiveIntegerField(default=0)
+    cancelled_issues = models.PositiveIntegerField(default=0)
+    total_estimate_points = models.FloatField(default=0)
+    backlog_estimate_points = models.FloatField(default=0)
+    unstarted_estimate_points = models.FloatField(default=0)
+    started_estimate_points = models.FloatField(default=0)
+    completed_estimate_points = models.FloatField(default=0)
+    cancelled_estimate_points = models.FloatField(default=0)
+
+    class Meta:
+        abstract = True
+
+
+class CycleProgress(IssueProgressModel):
+    cycle = models.OneToOneField(
+        Cycle,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="progress",
+    )
+
+    class Meta:
+        verbose_name = "Cycle Progress"
+        verbose_name_plural = "Cycle Progress"
+        db_table = "cycle_progress"
+
+    def __str__(self):
+        return f"{self.cycle_id} {self.completed_issues}/{self.total_issues}"
+
+
 # DEPRECATED TODO: - Remove in next release
 class CycleFavorite(ProjectBaseModel):
     """_summary_
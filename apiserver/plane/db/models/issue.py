@@ -1,18 +1,26 @@
 # Python import
+from contextlib import contextmanager
+from contextvars import ContextVar
 from uuid import uuid4
 
 # Django imports
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models, transaction
+from django.db import connection, models, transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.db.models import Q
+from django.db.models.functions import Upper
 
 # Module imports
 from plane.utils.html_processor import strip_tags
+from plane.utils.search import document_search_vector
 
+from ..mixins import TimeAuditModel
 from .project import ProjectBaseModel
 
 
@@ -180,6 +188,17 @@ class Issue(ProjectBaseModel):
         verbose_name_plural = "Issues"
         db_table = "issues"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["project", "state", "sort_order"],
+                name="issue_project_state_sort_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="issue_name_trgm_idx",
+            ),
+            GinIndex(document_search_vector(), name="issue_search_vector_idx"),
+        ]
 
     def save(self, *args, **kwargs):
         if self.state is None:
@@ -213,12 +232,6 @@ class Issue(ProjectBaseModel):
 
         if self._state.adding:
             with transaction.atomic():
-                last_sequence = (
-                    IssueSequence.objects.filter(project=self.project)
-                    .select_for_update()
-                    .aggregate(largest=models.Max("sequence"))["largest"]
-                )
-                self.sequence_id = last_sequence + 1 if last_sequence else 1
                 # Strip the html tags using html parser
                 self.description_stripped = (
                     None
@@ -228,12 +241,19 @@ class Issue(ProjectBaseModel):
                     )
                     else strip_tags(self.description_html)
                 )
+                # Served by the project, state and sort order index
                 largest_sort_order = Issue.objects.filter(
                     project=self.project, state=self.state
                 ).aggregate(largest=models.Max("sort_order"))["largest"]
                 if largest_sort_order is not None:
                     self.sort_order = largest_sort_order + 10000
 
+                # Only the counter row of the project is locked, and only
+                # until this transaction commits
+                self.sequence_id = IssueSequenceCounter.objects.allocate(
+                    self.project_id
+                )[0]
+
                 super(Issue, self).save(*args, **kwargs)
 
                 IssueSequence.objects.create(
@@ -627,6 +647,62 @@ class IssueSequence(ProjectBaseModel):
         ordering = ("-created_at",)
 
 
+class IssueSequenceCounterManager(models.Manager):
+    def allocate(self, project_id, count=1):
+        """
+        Reserve `count` consecutive sequence ids for the project and return
+        them as a range. The counter row stays locked until the surrounding
+        transaction ends, so a rolled back insert leaves no gap
+        """
+        if count < 1:
+            raise ValueError("At least one sequence id must be allocated")
+
+        table = self.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET last_sequence = last_sequence + %s, "
+                "updated_at = NOW() WHERE project_id = %s "
+                "RETURNING last_sequence",
+                [count, project_id],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                # First issue since the counter was introduced, start from
+                # the sequences already handed out
+                cursor.execute(
+                    f"INSERT INTO {table} "
+                    "(project_id, last_sequence, created_at, updated_at) "
+                    "SELECT %s, COALESCE(MAX(sequence), 0) + %s, NOW(), NOW() "
+                    f"FROM {IssueSequence._meta.db_table} WHERE project_id = %s "
+                    "ON CONFLICT (project_id) DO UPDATE SET "
+                    f"last_sequence = {table}.last_sequence + %s, "
+                    "updated_at = NOW() RETURNING last_sequence",
+                    [project_id, count, project_id, count],
+                )
+                row = cursor.fetchone()
+        return range(row[0] - count + 1, row[0] + 1)
+
+
+class IssueSequenceCounter(TimeAuditModel):
+    project = models.OneToOneField(
+        "db.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="issue_sequence_counter",
+    )
+    last_sequence = models.PositiveBigIntegerField(default=0)
+
+    objects = IssueSequenceCounterManager()
+
+    class Meta:
+        verbose_name = "Issue Sequence Counter"
+        verbose_name_plural = "Issue Sequence Counters"
+        db_table = "issue_sequence_counters"
+
+    def __str__(self):
+        return f"{self.project_id} <{self.last_sequence}>"
+
+
 class IssueSubscriber(ProjectBaseModel):
     issue = models.ForeignKey(
         Issue, on_delete=models.CASCADE, related_name="issue_subscribers"
@@ -752,3 +828,124 @@ class IssueVote(ProjectBaseModel):
 
     def __str__(self):
         return f"{self.issue.name} {self.actor.email}"
+
+
+# Set while the purge deletes rows in batches, it refreshes the counts and
+# the progress once per batch instead of once per deleted row
+_batched_deletes = ContextVar("batched_issue_deletes", default=False)
+
+
+@contextmanager
+def batched_issue_deletes():
+    token = _batched_deletes.set(True)
+    try:
+        yield
+    finally:
+        _batched_deletes.reset(token)
+
+
+def is_batched_delete(kwargs):
+    return kwargs.get("signal") is post_delete and _batched_deletes.get()
+
+
+@receiver([post_save, post_delete], sender=Issue)
+@receiver(post_save, sender="db.State")
+@receiver(post_save, sender="db.IssueLabel")
+@receiver(post_save, sender="db.IssueAssignee")
+@receiver(post_save, sender="db.CycleIssue")
+@receiver(post_save, sender="db.ModuleIssue")
+def invalidate_issue_group_counts(sender, instance, **kwargs):
+    # Bulk writes and queryset deletes skip the signals, their callers
+    # invalidate the counts of the project directly
+    if is_batched_delete(kwargs):
+        return
+    from plane.utils.group_count import invalidate_group_counts
+
+    invalidate_group_counts(instance.project_id)
+
+
+@receiver([post_save, post_delete], sender=Issue)
+@receiver(post_save, sender="db.State")
+def refresh_issue_analytics(sender, instance, **kwargs):
+    if is_batched_delete(kwargs):
+        return
+    from plane.utils.analytics_rollup import schedule_analytics_refresh
+
+    schedule_analytics_refresh(instance.project_id)
+
+
+@receiver(post_save, sender="db.Project")
+def refresh_project_rollups(sender, instance, **kwargs):
+    # Archiving and restoring the project changes its issue objects
+    from plane.utils.analytics_rollup import schedule_analytics_refresh
+
+    schedule_analytics_refresh(instance.id)
+
+
+# Issue fields the cycle and module progress depends on
+ISSUE_PROGRESS_FIELDS = [
+    "state_id",
+    "estimate_point_id",
+    "archived_at",
+    "is_draft",
+    "deleted_at",
+]
+
+
+def get_progress_values(instance, fields):
+    # Read the loaded values only, a deferred field is not fetched here
+    return {field: instance.__dict__.get(field) for field in fields}
+
+
+@receiver(post_init, sender=Issue)
+def track_issue_progress(sender, instance, **kwargs):
+    instance._progress_values = get_progress_values(
+        instance, ISSUE_PROGRESS_FIELDS
+    )
+
+
+@receiver(post_save, sender=Issue)
+def update_issue_progress(sender, instance, created, **kwargs):
+    values = get_progress_values(instance, ISSUE_PROGRESS_FIELDS)
+    # A new issue is not in a cycle or module yet
+    if not created and values != instance._progress_values:
+        from plane.utils.issue_progress import refresh_issue_progress
+
+        refresh_issue_progress([instance.id])
+    instance._progress_values = values
+
+
+@receiver(post_init, sender="db.CycleIssue")
+def track_cycle_issue_progress(sender, instance, **kwargs):
+    instance._progress_values = get_progress_values(instance, ["cycle_id"])
+
+
+@receiver([post_save, post_delete], sender="db.CycleIssue")
+def update_cycle_issue_progress(sender, instance, **kwargs):
+    if is_batched_delete(kwargs):
+        return
+    from plane.utils.issue_progress import refresh_cycle_progress
+
+    # Moving the issue changes the progress of both the cycles
+    refresh_cycle_progress(
+        [instance.cycle_id, instance._progress_values["cycle_id"]]
+    )
+    instance._progress_values = get_progress_values(instance, ["cycle_id"])
+
+
+@receiver([post_save, post_delete], sender="db.ModuleIssue")
+def update_module_issue_progress(sender, instance, **kwargs):
+    if is_batched_delete(kwargs):
+        return
+    from plane.utils.issue_progress import refresh_module_progress
+
+    refresh_module_progress([instance.module_id])
+
+
+@receiver(post_save, sender="db.State")
+@receiver([post_save, post_delete], sender="db.EstimatePoint")
+def update_project_progress(sender, instance, **kwargs):
+    # State groups and point values apply to every cycle and module
+    from plane.utils.issue_progress import refresh_project_progress
+
+    refresh_project_progress(instance.project_id)
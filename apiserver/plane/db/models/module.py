@@ -1,9 +1,12 @@
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Upper
 
 # Module imports
+from .cycle import IssueProgressModel
 from .project import ProjectBaseModel
 
 
@@ -109,6 +112,12 @@ class Module(ProjectBaseModel):
         verbose_name_plural = "Modules"
         db_table = "modules"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="module_name_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         if self._state.adding:
@@ -173,6 +182,23 @@ class ModuleIssue(ProjectBaseModel):
         return f"{self.module.name} {self.issue.name}"
 
 
+class ModuleProgress(IssueProgressModel):
+    module = models.OneToOneField(
+        Module,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="progress",
+    )
+
+    class Meta:
+        verbose_name = "Module Progress"
+        verbose_name_plural = "Module Progress"
+        db_table = "module_progress"
+
+    def __str__(self):
+        return f"{self.module_id} {self.completed_issues}/{self.total_issues}"
+
+
 class ModuleLink(ProjectBaseModel):
     title = models.CharField(max_length=255, blank=True, null=True)
     url = models.URLField()
@@ -137,3 +137,10 @@ class EmailNotificationLog(BaseModel):
         verbose_name_plural = "Email Notification Logs"
         db_table = "email_notification_logs"
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["receiver", "created_at"],
+                condition=models.Q(processed_at__isnull=True),
+                name="email_log_unprocessed_idx",
+            )
+        ]
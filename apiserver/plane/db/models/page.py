@@ -4,10 +4,13 @@ from django.conf import settings
 from django.utils import timezone
 
 # Django imports
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 # Module imports
 from plane.utils.html_processor import strip_tags
+from plane.utils.search import document_search_vector
 
 from .project import ProjectBaseModel
 from .base import BaseModel
@@ -62,6 +65,13 @@ class Page(BaseModel):
         verbose_name_plural = "Pages"
         db_table = "pages"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="page_name_trgm_idx",
+            ),
+            GinIndex(document_search_vector(), name="page_search_vector_idx"),
+        ]
 
     def __str__(self):
         """Return owner email and page name"""
@@ -4,8 +4,12 @@ from uuid import uuid4
 # Django imports
 from django.conf import settings
 from django.core.validators import MaxValueValidator, MinValueValidator
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
 from django.db.models import Q
+from django.db.models.functions import Upper
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Modeule imports
 from plane.db.mixins import AuditModel
@@ -145,6 +149,16 @@ class Project(BaseModel):
         verbose_name_plural = "Projects"
         db_table = "projects"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="project_name_trgm_idx",
+            ),
+            GinIndex(
+                OpClass(Upper("identifier"), name="gin_trgm_ops"),
+                name="project_identifier_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         self.identifier = self.identifier.strip().upper()
@@ -232,6 +246,13 @@ class ProjectMember(ProjectBaseModel):
         return f"{self.member.email} <{self.project.name}>"
 
 
+@receiver([post_save, post_delete], sender=ProjectMember)
+def invalidate_project_membership(sender, instance, **kwargs):
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership(instance.member_id)
+
+
 # TODO: Remove workspace relation later
 class ProjectIdentifier(AuditModel):
     workspace = models.ForeignKey(
@@ -2,8 +2,12 @@
 import string
 
 # Django imports
-from django.contrib.sessions.backends.db import SessionStore as DBSessionStore
+from django.conf import settings
+from django.contrib.sessions.backends.cached_db import (
+    SessionStore as CachedDBSessionStore,
+)
 from django.contrib.sessions.base_session import AbstractBaseSession
+from django.core.cache import caches
 from django.db import models
 from django.utils.crypto import get_random_string
 
@@ -33,12 +37,30 @@ class Session(AbstractBaseSession):
         db_table = "sessions"
 
 
-class SessionStore(DBSessionStore):
+class SessionStore(CachedDBSessionStore):
+    """
+    Sessions are read from the cache and written to both the cache and the
+    database. The database stays the source of truth for the sessions of a
+    user, revoke_user_sessions removes them from both
+    """
 
     @classmethod
     def get_model_class(cls):
         return Session
 
+    @classmethod
+    def revoke_user_sessions(cls, user_id):
+        """Delete every session of the user"""
+        session_keys = list(
+            Session.objects.filter(user_id=user_id).values_list(
+                "session_key", flat=True
+            )
+        )
+        caches[settings.SESSION_CACHE_ALIAS].delete_many(
+            [cls.cache_key_prefix + key for key in session_keys]
+        )
+        Session.objects.filter(session_key__in=session_keys).delete()
+
     def _get_new_session_key(self):
         """
         Return a new session key that is not present in the current backend.
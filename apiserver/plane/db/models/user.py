@@ -12,7 +12,7 @@ from django.contrib.auth.models import (
 
 # Django imports
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils import timezone
 
@@ -215,3 +215,10 @@ def create_user_notification(sender, instance, created, **kwargs):
             mention=False,
             issue_completed=False,
         )
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    from plane.utils.user_cache import invalidate_cached_user
+
+    invalidate_cached_user(instance.id)
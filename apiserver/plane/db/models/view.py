@@ -1,6 +1,8 @@
 # Django imports
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 # Module import
 from .base import BaseModel
@@ -115,6 +117,12 @@ class IssueView(WorkspaceBaseModel):
         verbose_name_plural = "Issue Views"
         db_table = "issue_views"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="issue_view_name_trgm_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         query_params = self.filters
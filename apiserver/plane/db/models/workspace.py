@@ -1,7 +1,11 @@
 # Django imports
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 # Module imports
 from .base import BaseModel
@@ -144,6 +148,12 @@ class Workspace(BaseModel):
         verbose_name_plural = "Workspaces"
         db_table = "workspaces"
         ordering = ("-created_at",)
+        indexes = [
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="workspace_name_trgm_idx",
+            ),
+        ]
 
 
 class WorkspaceBaseModel(BaseModel):
@@ -203,6 +213,13 @@ class WorkspaceMember(BaseModel):
         return f"{self.member.email} <{self.workspace.name}>"
 
 
+@receiver([post_save, post_delete], sender=WorkspaceMember)
+def invalidate_workspace_membership(sender, instance, **kwargs):
+    from plane.utils.membership import invalidate_membership
+
+    invalidate_membership(instance.member_id)
+
+
 class WorkspaceMemberInvite(BaseModel):
     workspace = models.ForeignKey(
         "db.Workspace",
@@ -1,4 +1,24 @@
-from plane.db.models import APIActivityLog
+# Python imports
+import json
+import random
+from uuid import uuid4
+
+# Django imports
+from django.conf import settings
+from django.utils import timezone
+
+# Module imports
+from plane.bgtasks.api_logs_task import API_LOG_QUEUE_KEY
+from plane.settings.redis import redis_pipeline
+from plane.utils.exception_logger import log_exception
+
+
+def truncate_body(body):
+    if not body:
+        return None
+    return body.decode("utf-8", errors="replace")[
+        : settings.API_LOG_BODY_LIMIT
+    ]
 
 
 class APITokenLogMiddleware:
@@ -11,33 +31,52 @@ class APITokenLogMiddleware:
         self.process_request(request, response, request_body)
         return response
 
+    def should_log(self, response):
+        # Failed requests are always logged, the rest is sampled
+        return (
+            response.status_code >= 400
+            or random.random() < settings.API_LOG_SAMPLE_RATE
+        )
+
     def process_request(self, request, response, request_body):
         api_key_header = "X-Api-Key"
         api_key = request.headers.get(api_key_header)
-        # If the API key is present, log the request
-        if api_key:
+        # If the API key is present, queue the request log
+        if api_key and self.should_log(response):
             try:
-                APIActivityLog.objects.create(
-                    token_identifier=api_key,
-                    path=request.path,
-                    method=request.method,
-                    query_params=request.META.get("QUERY_STRING", ""),
-                    headers=str(request.headers),
-                    body=(
-                        request_body.decode("utf-8") if request_body else None
+                user = getattr(request, "user", None)
+                log = {
+                    "id": str(uuid4()),
+                    # The log is written later, keep the time of the request
+                    "created_at": timezone.now().isoformat(),
+                    "token_identifier": api_key,
+                    "path": request.path,
+                    "method": request.method,
+                    "query_params": request.META.get("QUERY_STRING", ""),
+                    "headers": str(request.headers),
+                    "body": truncate_body(request_body),
+                    "response_body": (
+                        truncate_body(response.content)
+                        if not getattr(response, "streaming", False)
+                        else None
                     ),
-                    response_body=(
-                        response.content.decode("utf-8")
-                        if response.content
+                    "response_code": response.status_code,
+                    "ip_address": request.META.get("REMOTE_ADDR", None),
+                    "user_agent": request.META.get("HTTP_USER_AGENT", None),
+                    "created_by_id": (
+                        str(user.id)
+                        if user is not None and user.is_authenticated
                         else None
                     ),
-                    response_code=response.status_code,
-                    ip_address=request.META.get("REMOTE_ADDR", None),
-                    user_agent=request.META.get("HTTP_USER_AGENT", None),
-                )
+                }
+                # Written to the database in batches by process_api_logs
+                with redis_pipeline() as pipe:
+                    pipe.rpush(API_LOG_QUEUE_KEY, json.dumps(log))
+                    pipe.ltrim(
+                        API_LOG_QUEUE_KEY, -settings.API_LOG_QUEUE_LIMIT, -1
+                    )
 
             except Exception as e:
-                print(e)
-                # If the token does not exist, you can decide whether to log this as an invalid attempt
+                log_exception(e)
 
         return None
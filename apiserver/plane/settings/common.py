@@ -34,6 +34,7 @@ INSTALLED_APPS = [
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
+    "django.contrib.postgres",
     # Inhouse apps
     "plane.analytics",
     "plane.app",
@@ -83,9 +84,11 @@ REST_FRAMEWORK = {
 }
 
 # Django Auth Backend
+# The model backend stays listed for the sessions logged in with it
 AUTHENTICATION_BACKENDS = (
+    "plane.authentication.backends.CachedModelBackend",
     "django.contrib.auth.backends.ModelBackend",
-)  # default
+)
 
 # Root Urls
 ROOT_URLCONF = "plane.urls"
@@ -161,6 +164,8 @@ else:
 # Redis Config
 REDIS_URL = os.environ.get("REDIS_URL")
 REDIS_SSL = REDIS_URL and "rediss" in REDIS_URL
+# Connections of the shared redis pool of a process
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 100))
 
 if REDIS_SSL:
     CACHES = {
@@ -255,6 +260,14 @@ if AWS_S3_ENDPOINT_URL and USE_MINIO:
     AWS_S3_URL_PROTOCOL = f"{parsed_url.scheme}:"
 
 
+# API activity logs
+# Request and response bodies are cut to this many characters
+API_LOG_BODY_LIMIT = int(os.environ.get("API_LOG_BODY_LIMIT", 64 * 1024))
+# Share of the successful requests logged, failed requests are always logged
+API_LOG_SAMPLE_RATE = float(os.environ.get("API_LOG_SAMPLE_RATE", 1))
+# Logs waiting in redis to be written, the oldest are dropped past this
+API_LOG_QUEUE_LIMIT = int(os.environ.get("API_LOG_QUEUE_LIMIT", 100000))
+
 # Celery Configuration
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_SERIALIZER = "json"
@@ -274,6 +287,7 @@ CELERY_IMPORTS = (
     "plane.bgtasks.file_asset_task",
     "plane.bgtasks.email_notification_task",
     "plane.bgtasks.api_logs_task",
+    "plane.bgtasks.analytics_rollup_task",
     # management tasks
     "plane.bgtasks.dummy_data_task",
 )
@@ -357,3 +371,8 @@ SPACE_BASE_URL = os.environ.get("SPACE_BASE_URL", None)
 APP_BASE_URL = os.environ.get("APP_BASE_URL")
 
 HARD_DELETE_AFTER_DAYS = int(os.environ.get("HARD_DELETE_AFTER_DAYS", 60))
+# Rows purged per statement and the pause in seconds between statements
+HARD_DELETE_BATCH_SIZE = int(os.environ.get("HARD_DELETE_BATCH_SIZE", 1000))
+HARD_DELETE_BATCH_SLEEP = float(
+    os.environ.get("HARD_DELETE_BATCH_SLEEP", 0.1)
+)
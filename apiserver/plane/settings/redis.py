@@ -1,20 +1,83 @@
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
 import redis
 from django.conf import settings
-from urllib.parse import urlparse
 
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
 
-def redis_instance():
-    # connect to redis
+
+def create_redis_pool():
+    max_connections = getattr(settings, "REDIS_MAX_CONNECTIONS", None)
     if settings.REDIS_SSL:
         url = urlparse(settings.REDIS_URL)
-        ri = redis.Redis(
+        return redis.ConnectionPool(
+            connection_class=redis.SSLConnection,
             host=url.hostname,
             port=url.port,
             password=url.password,
-            ssl=True,
             ssl_cert_reqs=None,
+            max_connections=max_connections,
         )
-    else:
-        ri = redis.Redis.from_url(settings.REDIS_URL, db=0)
+    return redis.ConnectionPool.from_url(
+        settings.REDIS_URL, db=0, max_connections=max_connections
+    )
+
+
+def get_redis_pool():
+    """
+    Return the connection pool of the process. A forked process gets a new
+    pool instead of sharing the sockets of its parent
+    """
+    global _pool, _pool_pid
+    pid = os.getpid()
+    if _pool is None or _pool_pid != pid:
+        with _pool_lock:
+            if _pool is None or _pool_pid != pid:
+                _pool = create_redis_pool()
+                _pool_pid = pid
+    return _pool
+
+
+def reset_redis_pool():
+    """Drop the pool of the process, called after the worker forks"""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.disconnect()
+        _pool = None
+        _pool_pid = None
+
+
+def redis_instance():
+    # connect to redis through the shared pool
+    return redis.Redis(connection_pool=get_redis_pool())
+
+
+@contextmanager
+def redis_pipeline(transaction=False):
+    """
+    Queue several commands and send them in one round trip when the block
+    exits without an error
+    """
+    with redis_instance().pipeline(transaction=transaction) as pipe:
+        yield pipe
+        pipe.execute()
+
 
-    return ri
+def redis_pool_stats():
+    """Connection counts of the pool of the process"""
+    pool = get_redis_pool()
+    available = len(pool._available_connections)
+    in_use = len(pool._in_use_connections)
+    return {
+        "pid": _pool_pid,
+        "max_connections": pool.max_connections,
+        "created_connections": pool._created_connections,
+        "available_connections": available,
+        "in_use_connections": in_use,
+    }
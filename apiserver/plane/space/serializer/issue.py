@@ -28,6 +28,7 @@ from plane.db.models import (
     IssueVote,
     IssueRelation,
 )
+from plane.utils.group_count import invalidate_group_counts
 
 
 class IssueStateFlatSerializer(BaseSerializer):
@@ -408,6 +409,9 @@ class IssueCreateSerializer(BaseSerializer):
                 batch_size=10,
             )
 
+        # The links are written after the issue was saved
+        invalidate_group_counts(project_id)
+
         return issue
 
     def update(self, instance, validated_data):
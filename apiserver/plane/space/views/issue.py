@@ -161,6 +161,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                     return self.paginate(
                         request=request,
                         order_by=order_by_param,
+                        project_id=project_id,
                         queryset=issue_queryset,
                         on_results=lambda issues: issue_on_results(
                             group_by=group_by,
@@ -196,6 +197,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
                 return self.paginate(
                     request=request,
                     order_by=order_by_param,
+                    project_id=project_id,
                     queryset=issue_queryset,
                     on_results=lambda issues: issue_on_results(
                         group_by=group_by,
@@ -222,6 +224,7 @@ class ProjectIssuesPublicEndpoint(BaseAPIView):
         else:
             return self.paginate(
                 order_by=order_by_param,
+                project_id=project_id,
                 request=request,
                 queryset=issue_queryset,
                 on_results=lambda issues: issue_on_results(
@@ -3,7 +3,6 @@ from rest_framework.test import APITestCase, APIClient
 
 # Module imports
 from plane.db.models import User
-from plane.app.views.authentication import get_tokens_for_user
 
 
 class BaseAPITest(APITestCase):
@@ -29,8 +28,5 @@ class AuthenticatedAPITest(BaseAPITest):
         # Set Up User ID
         self.user_id = user.id
 
-        access_token, _ = get_tokens_for_user(user)
-        self.access_token = access_token
-
-        # Set Up Authentication Token
-        self.client.credentials(HTTP_AUTHORIZATION="Bearer " + access_token)
+        # Set Up Session
+        self.client.force_login(user)
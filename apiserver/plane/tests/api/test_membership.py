@@ -0,0 +1,142 @@
+# Python imports
+from unittest import mock
+
+# Django imports
+from django.core.cache import cache
+from django.test import RequestFactory, override_settings
+
+# Third party imports
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.bgtasks.deletion_task import (
+    restore_related_objects,
+    soft_delete_related_objects,
+)
+from plane.db.models import (
+    Project,
+    ProjectMember,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.utils.membership import get_membership, invalidate_membership
+
+
+# The cached memberships are kept apart from the shared redis
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "memberships",
+        }
+    }
+)
+class MembershipPermissionTests(AuthenticatedAPITest):
+    # The permission decorators answer the missing roles with a 401
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+        ## Create a workspace and a project administered by another user
+        self.admin = User.objects.create(
+            email="admin@plane.so", username="admin"
+        )
+        self.workspace = Workspace.objects.create(
+            slug="members", name="Members", owner=self.admin
+        )
+        self.project = Project.objects.create(
+            name="Members", identifier="MEM", workspace=self.workspace
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.admin, role=20
+        )
+        ProjectMember.objects.create(
+            project=self.project, member=self.admin, role=20
+        )
+
+        ## Add the user as a member of both
+        self.workspace_member = WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=15
+        )
+        self.project_member = ProjectMember.objects.create(
+            project=self.project, member=self.user, role=15
+        )
+
+        self.admin_client = APIClient()
+        self.admin_client.force_login(self.admin)
+
+        self.projects_url = f"/api/workspaces/{self.workspace.slug}/projects/"
+        self.issues_url = (
+            f"/api/workspaces/{self.workspace.slug}/projects/"
+            f"{self.project.id}/issues/"
+        )
+
+    def get_membership(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        return get_membership(request, self.workspace.slug)
+
+    def test_removed_project_member_is_denied_on_next_request(self):
+        response = self.client.get(self.issues_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        self.project_member.is_active = False
+        self.project_member.save()
+
+        response = self.client.get(self.issues_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_removed_workspace_member_is_denied_on_next_request(self):
+        for url in [self.projects_url, self.issues_url]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # The project memberships are deactivated with a set based update
+        response = self.admin_client.delete(
+            f"/api/workspaces/{self.workspace.slug}/members/"
+            f"{self.workspace_member.id}/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        for url in [self.projects_url, self.issues_url]:
+            response = self.client.get(url)
+            self.assertEqual(
+                response.status_code, status.HTTP_401_UNAUTHORIZED
+            )
+
+    def test_member_removed_while_roles_are_read_is_denied(self):
+        filter_project_members = ProjectMember.objects.filter
+
+        def remove_member(*args, **kwargs):
+            # The workspace role was read before the member was removed
+            WorkspaceMember.objects.filter(pk=self.workspace_member.pk).update(
+                is_active=False
+            )
+            invalidate_membership(self.user_id)
+            return filter_project_members(*args, **kwargs)
+
+        with mock.patch.object(
+            ProjectMember.objects, "filter", side_effect=remove_member
+        ):
+            self.assertEqual(self.get_membership()["workspace_role"], 15)
+
+        response = self.client.get(self.projects_url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_soft_deleted_project_drops_the_cached_roles(self):
+        project_id = str(self.project.id)
+        self.assertIn(project_id, self.get_membership()["project_roles"])
+
+        # The cascade runs here, without the signals of the memberships
+        with mock.patch.object(soft_delete_related_objects, "delay"):
+            self.project.delete()
+        soft_delete_related_objects("db", "project", self.project.id)
+
+        self.assertNotIn(project_id, self.get_membership()["project_roles"])
+
+        restore_related_objects("db", "project", self.project.id)
+
+        self.assertIn(project_id, self.get_membership()["project_roles"])
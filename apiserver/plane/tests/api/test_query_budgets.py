@@ -0,0 +1,97 @@
+# Django imports
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+# Module imports
+from .base import AuthenticatedAPITest
+from plane.db.models import Workspace, WorkspaceMember
+from plane.tests.query_budget import (
+    QueryBudgetExceeded,
+    QueryRecord,
+    query_budget,
+)
+from plane.utils.issue_progress import refresh_project_progress
+from plane.utils.synthetic_data import (
+    ProjectGenerator,
+    create_synthetic_members,
+)
+
+# Hot endpoints, checked against the budgets of their url names
+ENDPOINTS = [
+    "/api/workspaces/{slug}/projects/",
+    "/api/workspaces/{slug}/projects/{project_id}/issues/",
+    "/api/workspaces/{slug}/projects/{project_id}/issues/?group_by=state_id",
+    (
+        "/api/workspaces/{slug}/projects/{project_id}/issues/"
+        "?group_by=state_id&sub_group_by=priority"
+    ),
+    "/api/workspaces/{slug}/projects/{project_id}/cycles/",
+    "/api/workspaces/{slug}/projects/{project_id}/modules/",
+    "/api/workspaces/{slug}/analytics/?x_axis=priority&y_axis=issue_count",
+    "/api/workspaces/{slug}/search/?search=cycle",
+    "/api/workspaces/{slug}/users/notifications/?type=assigned",
+    "/api/workspaces/{slug}/dashboard/?dashboard_type=home",
+]
+
+
+# The generated ids repeat across runs, the cache of the test is kept apart
+# from the shared redis so that nothing cached by an earlier run is served
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "query-budgets",
+        }
+    }
+)
+class EndpointQueryBudgetTests(AuthenticatedAPITest):
+    def setUp(self):
+        super().setUp()
+        # Only clears the local cache of the test
+        cache.clear()
+
+        ## Create a workspace with one generated project
+        self.workspace = Workspace.objects.create(
+            slug="seeded", name="Seeded", owner=self.user
+        )
+        WorkspaceMember.objects.create(
+            workspace=self.workspace, member=self.user, role=20
+        )
+        member_ids = create_synthetic_members(self.workspace, "S", seed=0)
+        self.project_id = ProjectGenerator(
+            self.workspace, self.user_id, member_ids, "S", seed=0, index=0
+        ).generate()
+        refresh_project_progress(self.project_id)
+
+    def test_endpoints_within_query_budgets(self):
+        for endpoint in ENDPOINTS:
+            with self.subTest(endpoint=endpoint):
+                url = endpoint.format(
+                    slug=self.workspace.slug, project_id=self.project_id
+                )
+                with query_budget():
+                    response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+
+
+class QueryRecordTests(SimpleTestCase):
+    def test_repeated_queries_exceed_budget(self):
+        record = QueryRecord(
+            "project-issue",
+            "/api/",
+            [
+                f"SELECT * FROM issues WHERE id = '{issue_id}'"
+                for issue_id in ["a", "b", "c"]
+            ]
+            + ["SELECT * FROM states WHERE id IN (1, 2, 3)"],
+            10,
+        )
+
+        self.assertEqual(
+            record.duplicates, [("SELECT * FROM issues WHERE id = ?", 3)]
+        )
+        record.check(queries=4, duplicates=3)
+        with self.assertRaises(QueryBudgetExceeded):
+            record.check(duplicates=2)
+        with self.assertRaises(QueryBudgetExceeded):
+            record.check(queries=3)
@@ -0,0 +1,98 @@
+# Python imports
+import json
+
+# Third party imports
+import pytest
+
+# Module imports
+from plane.tests.query_budget import query_budget as record_query_budget
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("query budget")
+    group.addoption(
+        "--query-budget-report",
+        default=None,
+        help="write the queries and timings of the requests to a json file",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget: check the requests of the test against the query "
+        "budgets of their url names",
+    )
+    config._query_budget_records = []
+
+
+def keep_records(config, recorder):
+    # Requests over budget are reported as well
+    config._query_budget_records.extend(
+        record for record in recorder.records if record.name != "block"
+    )
+
+
+@pytest.fixture
+def query_budget(request):
+    """Check the requests of the test against the budgets of their urls"""
+    recorder = record_query_budget()
+    try:
+        with recorder:
+            yield recorder
+    finally:
+        keep_records(request.config, recorder)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        yield
+        return
+
+    recorder = record_query_budget(**marker.kwargs)
+    recorder.__enter__()
+    outcome = yield
+    try:
+        # Budgets are only checked for the tests that pass otherwise
+        recorder.__exit__(*(outcome.excinfo or (None, None, None)))
+    finally:
+        keep_records(item.config, recorder)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    records = config._query_budget_records
+    if not records:
+        return
+
+    endpoints = {}
+    for record in records:
+        summary = endpoints.setdefault(
+            record.name,
+            {"requests": 0, "queries": 0, "duplicates": 0, "milliseconds": 0},
+        )
+        values = record.as_dict()
+        summary["requests"] += 1
+        for key in ["queries", "duplicates", "milliseconds"]:
+            summary[key] = max(summary[key], values[key])
+
+    terminalreporter.section("query budgets")
+    for name, summary in sorted(endpoints.items(), key=lambda x: str(x[0])):
+        terminalreporter.write_line(
+            f"{name}: {summary['requests']} requests, at most "
+            f"{summary['queries']} queries, {summary['duplicates']} "
+            f"duplicates and {summary['milliseconds']}ms"
+        )
+
+    report = config.getoption("--query-budget-report")
+    if report:
+        with open(report, "w") as file:
+            json.dump(
+                {
+                    "endpoints": endpoints,
+                    "requests": [record.as_dict() for record in records],
+                },
+                file,
+                indent=2,
+            )
@@ -0,0 +1,195 @@
+# Python imports
+import re
+import time
+from collections import Counter
+from contextlib import ContextDecorator
+
+# Django imports
+from django.core.signals import request_finished, request_started
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+from django.urls import Resolver404, resolve
+
+# Budgets of the endpoints by url name. queries is the most a request may
+# run, duplicates the most times one query shape may repeat in a request
+# and milliseconds the longest it may take. Timings vary across machines,
+# so they are only checked where a budget declares them. The query counts
+# are the ones observed against the generated project of the smallest
+# profile, with some headroom
+QUERY_BUDGETS = {
+    "project-issue": {"queries": 16, "duplicates": 2},
+    "project-cycle": {"queries": 4, "duplicates": 2},
+    "project-modules": {"queries": 4, "duplicates": 2},
+    "plane-analytics": {"queries": 6, "duplicates": 2},
+    "global-search": {"queries": 3, "duplicates": 2},
+    "notifications": {"queries": 3, "duplicates": 2},
+    "dashboard": {"queries": 8, "duplicates": 2},
+    "project": {"queries": 10, "duplicates": 2},
+}
+
+# Literals are replaced so that the queries differing only in their
+# parameters share a fingerprint
+FINGERPRINT_PATTERNS = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(?)"),
+    (re.compile(r"\s+"), " "),
+]
+# Transaction statements of the test cases are not a part of the requests
+IGNORED_QUERIES = re.compile(r"^(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO)")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def fingerprint(sql):
+    for pattern, replacement in FINGERPRINT_PATTERNS:
+        sql = pattern.sub(replacement, sql)
+    return sql.strip()
+
+
+class QueryRecord:
+    """The queries and the wall time of a request, or of a block of code"""
+
+    def __init__(self, name, path, queries, milliseconds):
+        self.name = name
+        self.path = path
+        self.queries = [
+            query for query in queries if not IGNORED_QUERIES.match(query)
+        ]
+        self.milliseconds = milliseconds
+
+    @property
+    def duplicates(self):
+        """The query fingerprints run more than once, most repeated first"""
+        return [
+            (sql, count)
+            for sql, count in Counter(
+                fingerprint(query) for query in self.queries
+            ).most_common()
+            if count > 1
+        ]
+
+    def check(self, queries=None, duplicates=None, milliseconds=None):
+        errors = []
+        if queries is not None and len(self.queries) > queries:
+            errors.append(
+                f"ran {len(self.queries)} queries, the budget is {queries}"
+            )
+        if duplicates is not None:
+            errors.extend(
+                f"repeated {count} times, the budget is {duplicates}: {sql}"
+                for sql, count in self.duplicates
+                if count > duplicates
+            )
+        if milliseconds is not None and self.milliseconds > milliseconds:
+            errors.append(
+                f"took {self.milliseconds:.0f}ms, "
+                f"the budget is {milliseconds}ms"
+            )
+        if errors:
+            raise QueryBudgetExceeded(
+                f"{self.name} {self.path}:\n" + "\n".join(errors)
+            )
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "path": self.path,
+            "queries": len(self.queries),
+            "duplicates": self.duplicates[0][1] if self.duplicates else 0,
+            "milliseconds": round(self.milliseconds, 2),
+        }
+
+
+class query_budget(ContextDecorator):
+    """
+    Record the queries of the block and of every request made in it. On
+    exit the requests are checked against the budgets of their url names,
+    and the whole block against the limits given here, if any
+
+        with query_budget(queries=5):
+            paginator.paginate(...)
+    """
+
+    def __init__(
+        self,
+        queries=None,
+        duplicates=None,
+        milliseconds=None,
+        budgets=None,
+        using="default",
+    ):
+        self.limits = {
+            "queries": queries,
+            "duplicates": duplicates,
+            "milliseconds": milliseconds,
+        }
+        self.budgets = QUERY_BUDGETS if budgets is None else budgets
+        self.using = using
+
+    def request_started(self, environ=None, **kwargs):
+        path = (environ or {}).get("PATH_INFO", "")
+        try:
+            name = resolve(path).url_name
+        except Resolver404:
+            name = None
+        self.request = (
+            name,
+            path,
+            len(self.context.captured_queries),
+            time.perf_counter(),
+        )
+
+    def request_finished(self, **kwargs):
+        if self.request is None:
+            return
+        name, path, start, started_at = self.request
+        self.request = None
+        self.requests.append(
+            QueryRecord(
+                name,
+                path,
+                [
+                    query["sql"]
+                    for query in self.context.captured_queries[start:]
+                ],
+                (time.perf_counter() - started_at) * 1000,
+            )
+        )
+
+    def __enter__(self):
+        self.requests = []
+        self.request = None
+        self.context = CaptureQueriesContext(connections[self.using])
+        self.context.__enter__()
+        request_started.connect(self.request_started)
+        request_finished.connect(self.request_finished)
+        self.started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        milliseconds = (time.perf_counter() - self.started_at) * 1000
+        request_started.disconnect(self.request_started)
+        request_finished.disconnect(self.request_finished)
+        self.context.__exit__(exc_type, exc_value, traceback)
+        self.block = QueryRecord(
+            "block",
+            "",
+            [query["sql"] for query in self.context.captured_queries],
+            milliseconds,
+        )
+        if exc_type is None:
+            self.check()
+        return False
+
+    def check(self):
+        for record in self.requests:
+            if record.name in self.budgets:
+                record.check(**self.budgets[record.name])
+        self.block.check(**self.limits)
+
+    @property
+    def records(self):
+        return self.requests + [self.block]
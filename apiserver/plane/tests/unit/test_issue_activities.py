@@ -0,0 +1,150 @@
+# Python imports
+import json
+import uuid
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Module imports
+from plane.bgtasks.issue_activities_task import (
+    coalesce_issue_activities,
+    update_issue_activity,
+)
+
+ACTOR_ID = str(uuid.uuid4())
+PROJECT_ID = str(uuid.uuid4())
+WORKSPACE_ID = str(uuid.uuid4())
+
+
+def issue_update(issue_id, requested_data, current_instance, epoch):
+    return {
+        "type": "issue.activity.updated",
+        "requested_data": json.dumps(requested_data),
+        "current_instance": json.dumps(current_instance),
+        "issue_id": issue_id,
+        "actor_id": ACTOR_ID,
+        "project_id": PROJECT_ID,
+        "epoch": epoch,
+    }
+
+
+def tracked_changes(activity):
+    # The activities the update tracker records for the payload
+    issue_activities = []
+    update_issue_activity(
+        requested_data=activity["requested_data"],
+        current_instance=activity["current_instance"],
+        issue_id=activity["issue_id"],
+        project_id=PROJECT_ID,
+        workspace_id=WORKSPACE_ID,
+        actor_id=ACTOR_ID,
+        issue_activities=issue_activities,
+        epoch=activity["epoch"],
+    )
+    return [
+        (activity.field, activity.old_value, activity.new_value)
+        for activity in issue_activities
+    ]
+
+
+class CoalesceIssueActivitiesTests(SimpleTestCase):
+    def setUp(self):
+        self.issue_id = str(uuid.uuid4())
+
+    def test_field_changed_back_records_nothing(self):
+        activities = coalesce_issue_activities(
+            [
+                issue_update(
+                    self.issue_id, {"priority": "high"}, {"priority": "low"}, 1
+                ),
+                issue_update(
+                    self.issue_id, {"priority": "low"}, {"priority": "high"}, 2
+                ),
+            ]
+        )
+
+        self.assertEqual(len(activities), 1)
+        self.assertEqual(
+            json.loads(activities[0]["requested_data"]), {"priority": "low"}
+        )
+        self.assertEqual(
+            json.loads(activities[0]["current_instance"]), {"priority": "low"}
+        )
+        self.assertEqual(activities[0]["epoch"], 2)
+        self.assertEqual(tracked_changes(activities[0]), [])
+
+    def test_fields_of_an_issue_are_merged(self):
+        activities = coalesce_issue_activities(
+            [
+                issue_update(
+                    self.issue_id,
+                    {"name": "Second"},
+                    {"name": "First", "priority": "none"},
+                    1,
+                ),
+                issue_update(
+                    self.issue_id,
+                    {"priority": "urgent"},
+                    {"name": "Second", "priority": "none"},
+                    2,
+                ),
+                issue_update(
+                    self.issue_id,
+                    {"name": "Third"},
+                    {"name": "Second", "priority": "urgent"},
+                    3,
+                ),
+            ]
+        )
+
+        self.assertEqual(len(activities), 1)
+        # The oldest current value and the newest requested value are kept
+        self.assertEqual(
+            sorted(tracked_changes(activities[0])),
+            [("name", "First", "Third"), ("priority", "none", "urgent")],
+        )
+        self.assertEqual(activities[0]["epoch"], 3)
+
+    def test_issues_are_kept_apart(self):
+        other_issue_id = str(uuid.uuid4())
+        created = {
+            "type": "issue.activity.created",
+            "requested_data": None,
+            "current_instance": None,
+            "issue_id": self.issue_id,
+            "actor_id": ACTOR_ID,
+            "project_id": PROJECT_ID,
+            "epoch": 1,
+        }
+
+        activities = coalesce_issue_activities(
+            [
+                created,
+                issue_update(
+                    self.issue_id, {"priority": "high"}, {"priority": "low"}, 2
+                ),
+                issue_update(
+                    other_issue_id,
+                    {"priority": "medium"},
+                    {"priority": "none"},
+                    3,
+                ),
+                issue_update(
+                    self.issue_id, {"name": "Renamed"}, {"name": "Named"}, 4
+                ),
+            ]
+        )
+
+        # Other activity types pass through in their place
+        self.assertEqual(
+            [activity["issue_id"] for activity in activities],
+            [self.issue_id, self.issue_id, other_issue_id],
+        )
+        self.assertEqual(activities[0], created)
+        self.assertEqual(
+            sorted(tracked_changes(activities[1])),
+            [("name", "Named", "Renamed"), ("priority", "low", "high")],
+        )
+        self.assertEqual(
+            tracked_changes(activities[2]), [("priority", "none", "medium")]
+        )
@@ -0,0 +1,149 @@
+# Python imports
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+# Django imports
+from django.test import SimpleTestCase
+
+# Third party imports
+from rest_framework.exceptions import ParseError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+# Module imports
+from plane.db.models import Issue
+from plane.utils.paginator import (
+    BadPaginationError,
+    BasePaginator,
+    Cursor,
+    GroupedOffsetPaginator,
+    OffsetPaginator,
+)
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+PK = uuid.UUID("6eef7911-cfad-4159-9313-056ddd01512a")
+
+
+def encode_keys(payload):
+    # Tampered cursors are encoded the way the paginator encodes them
+    return (
+        base64.urlsafe_b64encode(json.dumps(payload).encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+class CursorTests(SimpleTestCase):
+    def test_keyset_cursor_round_trip(self):
+        cursor = Cursor(
+            50,
+            2,
+            False,
+            keys=[3, CREATED_AT, PK],
+            hits=120,
+            max_hits=3,
+        )
+
+        decoded = Cursor.from_string(str(cursor))
+
+        self.assertEqual(decoded.value, 50)
+        self.assertEqual(decoded.offset, 2)
+        self.assertFalse(decoded.is_prev)
+        self.assertEqual(
+            decoded.keys, [3, CREATED_AT.isoformat(), str(PK)]
+        )
+        self.assertEqual((decoded.hits, decoded.max_hits), (120, 3))
+
+    def test_grouped_keyset_cursor_round_trip(self):
+        keys = [
+            ["started", None, CREATED_AT.isoformat(), str(PK)],
+            [None, "high", CREATED_AT.isoformat(), str(uuid.uuid4())],
+        ]
+        cursor = Cursor(50, 1, False, keys=keys, hits=75, max_hits=2)
+
+        self.assertEqual(Cursor.from_string(str(cursor)).keys, keys)
+
+    def test_last_page_cursor_round_trip(self):
+        cursor = Cursor(50, 3, False, keys=[], hits=120, max_hits=3)
+
+        self.assertEqual(Cursor.from_string(str(cursor)).keys, [])
+
+    def test_tampered_cursor_is_rejected(self):
+        created_at, pk = CREATED_AT.isoformat(), str(PK)
+        payloads = [
+            # Keys of the wrong arity
+            {"k": [created_at, pk]},
+            {"k": [1, 2, created_at, pk]},
+            {"k": [["started", 1, created_at, pk], ["started", created_at]]},
+            # Group keys which are not lists
+            {"k": [["started", 1, created_at, pk], "started"]},
+            # Values of the wrong types
+            {"k": [1, created_at, "not-a-uuid"]},
+            {"k": [1, "yesterday", pk]},
+            {"k": [1, 12345, pk]},
+            {"k": [[1], created_at, pk]},
+            # Totals which are not counts
+            {"k": [1, created_at, pk], "h": "120", "m": 3},
+            {"k": [1, created_at, pk], "h": -1, "m": 0},
+            {"k": [1, created_at, pk], "h": 120, "m": 500},
+            {"k": [1, created_at, pk], "h": True, "m": 1},
+            {"k": [1, created_at, pk], "h": 120},
+            # Not a payload at all
+            {"keys": []},
+            [],
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                with self.assertRaises(ValueError):
+                    Cursor.from_string(f"50:1:0:{encode_keys(payload)}")
+
+        with self.assertRaises(ValueError):
+            Cursor.from_string("50:1:0:not-base64!")
+
+    def test_cursor_keys_not_fitting_the_paginator_are_rejected(self):
+        created_at, pk = CREATED_AT.isoformat(), str(PK)
+        paginator = OffsetPaginator(Issue.objects.all(), "sequence_id")
+        grouped_paginator = GroupedOffsetPaginator(
+            Issue.objects.all(),
+            "state_id",
+            [],
+            None,
+            order_by="sequence_id",
+        )
+
+        cursors = [
+            # Grouped keys sent to an ungrouped list
+            (paginator, [["started", 1, created_at, pk]]),
+            # Ungrouped keys sent to a grouped list
+            (grouped_paginator, [1, created_at, pk]),
+            # A sub grouped key sent to a grouped list
+            (grouped_paginator, [[str(PK), "high", 1, created_at, pk]]),
+            # An ordering value of the wrong type
+            (paginator, ["first", created_at, pk]),
+        ]
+        for current_paginator, keys in cursors:
+            with self.subTest(keys=keys):
+                cursor = Cursor(50, 1, False, keys=keys, hits=1, max_hits=1)
+                with self.assertRaises(BadPaginationError):
+                    current_paginator.get_result(limit=50, cursor=cursor)
+
+    def test_tampered_cursor_is_a_bad_request(self):
+        paginator = OffsetPaginator(Issue.objects.all(), "sequence_id")
+        cursor = Cursor(
+            50,
+            1,
+            False,
+            keys=[["started", 1, CREATED_AT.isoformat(), str(PK)]],
+        )
+
+        for value in [str(cursor), "50:1:0:e30"]:
+            with self.subTest(cursor=value):
+                request = Request(
+                    APIRequestFactory().get("/", {"cursor": value})
+                )
+                with self.assertRaises(ParseError):
+                    BasePaginator().paginate(
+                        request=request, paginator=paginator
+                    )
@@ -0,0 +1,196 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+# Django imports
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.bgtasks import webhook_task
+from plane.db.models import Project, User, Webhook, WebhookLog, Workspace
+from plane.utils.webhook_delivery import deliver_webhooks
+
+
+class WebhookStub(BaseHTTPRequestHandler):
+    """Record the deliveries and the deliveries running at once"""
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        # Hold the request so the concurrent deliveries overlap
+        time.sleep(server.delay)
+
+        with server.lock:
+            server.active -= 1
+            server.requests.append((self.path, dict(self.headers), body))
+
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def get_closed_port():
+    # Nothing listens on the port once the socket is closed
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class WebhookDeliveryTests(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookStub)
+        self.server.lock = threading.Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        self.server.delay = 0.05
+        self.server.requests = []
+        self.server.daemon_threads = True
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+        self.user = User.objects.create(
+            email="webhook@plane.so", username="webhook"
+        )
+        self.workspace = Workspace.objects.create(
+            slug="webhooks", name="Webhooks", owner=self.user
+        )
+        self.project = Project.objects.create(
+            name="Webhooks", identifier="WEB", workspace=self.workspace
+        )
+
+    def create_webhooks(self, count):
+        return [
+            Webhook.objects.create(
+                workspace=self.workspace,
+                url=f"{self.base_url}/hook/{index}",
+                project=True,
+            )
+            for index in range(count)
+        ]
+
+    def send_project_activity(self):
+        webhook_task.webhook_activity(
+            event="project",
+            verb="PATCH",
+            field="name",
+            old_value="Webhooks",
+            new_value="Hooks",
+            actor_id=self.user.id,
+            slug=self.workspace.slug,
+            current_site="http://localhost",
+            event_id=self.project.id,
+            old_identifier=None,
+            new_identifier=None,
+        )
+
+    def test_event_is_serialized_once_and_signed_per_webhook(self):
+        webhooks = {
+            f"/hook/{index}": webhook
+            for index, webhook in enumerate(self.create_webhooks(6))
+        }
+
+        with mock.patch.object(
+            webhook_task,
+            "get_model_data",
+            wraps=webhook_task.get_model_data,
+        ) as get_model_data, mock.patch.object(
+            webhook_task, "log_exception"
+        ) as log_exception:
+            self.send_project_activity()
+
+        log_exception.assert_not_called()
+        events = [call.kwargs["event"] for call in get_model_data.mock_calls]
+        self.assertEqual(events.count("project"), 1)
+
+        self.assertEqual(len(self.server.requests), len(webhooks))
+        event_data = set()
+        for path, headers, body in self.server.requests:
+            webhook = webhooks[path]
+            payload = json.loads(body)
+            self.assertEqual(payload["webhook_id"], str(webhook.id))
+            self.assertEqual(payload["action"], "update")
+            self.assertEqual(
+                headers["X-Plane-Signature"],
+                hmac.new(
+                    webhook.secret_key.encode("utf-8"),
+                    body,
+                    hashlib.sha256,
+                ).hexdigest(),
+            )
+            event_data.add(json.dumps(payload["data"], sort_keys=True))
+
+        # Every webhook received the same event data
+        self.assertEqual(len(event_data), 1)
+
+    def test_deliveries_to_a_host_are_capped(self):
+        webhooks = self.create_webhooks(8)
+
+        deliveries = deliver_webhooks(
+            webhooks,
+            event="project",
+            action="POST",
+            event_data={"id": str(self.project.id)},
+            max_per_host=2,
+        )
+
+        self.assertEqual(len(deliveries), len(webhooks))
+        self.assertTrue(all(error is None for *_, error in deliveries))
+        self.assertEqual(len(self.server.requests), len(webhooks))
+        self.assertLessEqual(self.server.max_active, 2)
+
+    def test_logs_are_inserted_together_and_failures_retried(self):
+        webhooks = self.create_webhooks(3)
+        failing_webhook = Webhook.objects.create(
+            workspace=self.workspace,
+            url=f"http://127.0.0.1:{get_closed_port()}/hook",
+            project=True,
+        )
+
+        with mock.patch.object(
+            webhook_task.webhook_send_task, "apply_async"
+        ) as apply_async, CaptureQueriesContext(connection) as queries:
+            self.send_project_activity()
+
+        log_inserts = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith('INSERT INTO "webhook_logs"')
+        ]
+        self.assertEqual(len(log_inserts), 1)
+        self.assertEqual(
+            WebhookLog.objects.filter(workspace=self.workspace).count(),
+            len(webhooks) + 1,
+        )
+        self.assertEqual(
+            WebhookLog.objects.get(webhook=failing_webhook).response_status,
+            "500",
+        )
+
+        # Only the failed delivery is handed over to the retrying task
+        apply_async.assert_called_once()
+        kwargs = apply_async.call_args.kwargs
+        self.assertEqual(kwargs["kwargs"]["webhook"], failing_webhook.id)
+        self.assertEqual(
+            kwargs["countdown"], webhook_task.WEBHOOK_RETRY_BACKOFF
+        )
+        self.assertEqual(kwargs["retries"], 1)
@@ -3,6 +3,7 @@ from datetime import timedelta
 from itertools import groupby
 
 # Django import
+from django.core.cache import cache
 from django.db import models
 from django.db.models import (
     Case,
@@ -26,6 +27,11 @@ from django.utils import timezone
 
 # Module imports
 from plane.db.models import Issue, Project
+from plane.utils.group_count import get_group_count_version
+
+# The completion histogram is keyed by the group count version of the
+# project, the timeout evicts the histograms of the replaced versions
+BURNDOWN_TIMEOUT = 60 * 10
 
 
 def annotate_with_monthly_dimension(queryset, field_name, attribute):
@@ -120,16 +126,24 @@ def build_graph_plot(queryset, x_axis, y_axis, segment=None):
     return sort_data(grouped_data, temp_axis)
 
 
-def burndown_plot(
-    queryset,
-    slug,
-    project_id,
-    plot_type,
-    cycle_id=None,
-    module_id=None,
-):
-    # Total Issues in Cycle or Module
-    total_issues = queryset.total_issues
+def get_burndown_data(slug, project_id, cycle_id=None, module_id=None):
+    """
+    Completions of the cycle or module per day, counted in issues and in
+    estimate points by a single query. Cached until the issues or the
+    states of the project change
+    """
+    version = get_group_count_version(project_id)
+    key = f"burndown:{project_id}:{version}:{cycle_id or module_id}"
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    issue_filter = (
+        {"issue_cycle__cycle_id": cycle_id}
+        if cycle_id
+        else {"issue_module__module_id": module_id}
+    )
+
     # check whether the estimate is a point or not
     estimate_type = Project.objects.filter(
         workspace__slug=slug,
@@ -137,134 +151,92 @@ def burndown_plot(
         estimate__isnull=False,
         estimate__type="points",
     ).exists()
-    if estimate_type and plot_type == "points" and cycle_id:
-        issue_estimates = Issue.objects.filter(
-            workspace__slug=slug,
-            project_id=project_id,
-            issue_cycle__cycle_id=cycle_id,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
+    total_estimate_points = 0
+    if estimate_type:
+        total_estimate_points = (
+            Issue.objects.filter(
+                workspace__slug=slug,
+                project_id=project_id,
+                estimate_point__isnull=False,
+                **issue_filter,
+            ).aggregate(
+                total=Sum(Cast("estimate_point__value", FloatField()))
+            )["total"]
+            or 0
+        )
 
-    if estimate_type and plot_type == "points" and module_id:
-        issue_estimates = Issue.objects.filter(
+    completed_distribution = list(
+        Issue.issue_objects.filter(
             workspace__slug=slug,
             project_id=project_id,
-            issue_module__module_id=module_id,
-            estimate_point__isnull=False,
-        ).values_list("estimate_point__value", flat=True)
-
-        issue_estimates = [float(value) for value in issue_estimates]
-        total_estimate_points = sum(issue_estimates)
-
-    if cycle_id:
-        if queryset.end_date and queryset.start_date:
-            # Get all dates between the two dates
-            date_range = [
-                queryset.start_date + timedelta(days=x)
-                for x in range(
-                    (queryset.end_date - queryset.start_date).days + 1
-                )
-            ]
-        else:
-            date_range = []
-
-        chart_data = {str(date): 0 for date in date_range}
-
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_cycle__cycle_id=cycle_id,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
+            completed_at__isnull=False,
+            **issue_filter,
+        )
+        .annotate(date=TruncDate("completed_at"))
+        .values("date")
+        .annotate(
+            completed_issues=Count("id"),
+            completed_points=Sum(
+                Cast("estimate_point__value", FloatField())
+            ),
+        )
+        .values_list("date", "completed_issues", "completed_points")
+        .order_by("date")
+    )
 
-    if module_id:
-        # Get all dates between the two dates
-        date_range = [
-            queryset.start_date + timedelta(days=x)
-            for x in range(
-                (queryset.target_date - queryset.start_date).days + 1
-            )
-        ]
+    data = {
+        "total_estimate_points": total_estimate_points,
+        "completed_distribution": completed_distribution,
+    }
+    cache.set(key, data, BURNDOWN_TIMEOUT)
+    return data
 
-        chart_data = {str(date): 0 for date in date_range}
 
-        if plot_type == "points":
-            completed_issues_estimate_point_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                    estimate_point__isnull=False,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .values("date", "estimate_point__value")
-                .order_by("date")
-            )
-        else:
-            completed_issues_distribution = (
-                Issue.issue_objects.filter(
-                    workspace__slug=slug,
-                    project_id=project_id,
-                    issue_module__module_id=module_id,
-                )
-                .annotate(date=TruncDate("completed_at"))
-                .values("date")
-                .annotate(total_completed=Count("id"))
-                .values("date", "total_completed")
-                .order_by("date")
-            )
+def burndown_plot(
+    queryset,
+    slug,
+    project_id,
+    plot_type,
+    cycle_id=None,
+    module_id=None,
+):
+    if cycle_id:
+        start_date, end_date = queryset.start_date, queryset.end_date
+    else:
+        start_date, end_date = queryset.start_date, queryset.target_date
+    if not start_date or not end_date:
+        return {}
 
+    data = get_burndown_data(
+        slug, project_id, cycle_id=cycle_id, module_id=module_id
+    )
     if plot_type == "points":
-        for date in date_range:
-            cumulative_pending_issues = total_estimate_points
-            total_completed = 0
-            total_completed = sum(
-                float(item["estimate_point__value"])
-                for item in completed_issues_estimate_point_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        total = data["total_estimate_points"]
+        completed_distribution = [
+            (date, points or 0)
+            for date, _, points in data["completed_distribution"]
+        ]
     else:
-        for date in date_range:
-            cumulative_pending_issues = total_issues
-            total_completed = 0
-            total_completed = sum(
-                item["total_completed"]
-                for item in completed_issues_distribution
-                if item["date"] is not None and item["date"] <= date
-            )
-            cumulative_pending_issues -= total_completed
-            if date > timezone.now().date():
-                chart_data[str(date)] = None
-            else:
-                chart_data[str(date)] = cumulative_pending_issues
+        # Total Issues in Cycle or Module
+        total = queryset.total_issues
+        completed_distribution = [
+            (date, issues)
+            for date, issues, _ in data["completed_distribution"]
+        ]
+
+    # Walk the days and the completions together, keeping a running sum
+    today = timezone.now().date()
+    chart_data = {}
+    completed = 0
+    index = 0
+    for day in range((end_date - start_date).days + 1):
+        date = start_date + timedelta(days=day)
+        while (
+            index < len(completed_distribution)
+            and completed_distribution[index][0] <= date
+        ):
+            completed += completed_distribution[index][1]
+            index += 1
+        chart_data[str(date)] = None if date > today else total - completed
 
     return chart_data
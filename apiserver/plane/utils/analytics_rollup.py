@@ -0,0 +1,270 @@
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, FloatField, Q, Sum
+from django.db.models.functions import Cast
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    Issue,
+    IssueAnalyticsRollup,
+    Label,
+    Module,
+    Project,
+    State,
+    User,
+)
+from plane.utils.analytics_plot import (
+    annotate_with_monthly_dimension,
+    extract_axis,
+    sort_data,
+)
+
+ROLLUP_TOTAL_AXIS = "total"
+DATE_AXES = ["created_at", "start_date", "target_date", "completed_at"]
+# Issue changes are rolled up at most once in this many seconds
+ANALYTICS_ROLLUP_REFRESH_DELAY = 60 * 5
+# A missing rollup is built at most once in this many seconds
+ANALYTICS_ROLLUP_BUILD_DELAY = 60 * 10
+
+# Details of the axes, looked up by the ids in the rolled up dimensions
+ROLLUP_DETAILS = {
+    "state_id": (
+        "state_details",
+        State,
+        {},
+        {"state_id": "id", "state__name": "name", "state__color": "color"},
+    ),
+    "labels__id": (
+        "label_details",
+        Label,
+        {},
+        {"labels__id": "id", "labels__color": "color", "labels__name": "name"},
+    ),
+    "assignees__id": (
+        "assignee_details",
+        User,
+        {"avatar__isnull": False},
+        {
+            "assignees__avatar": "avatar",
+            "assignees__display_name": "display_name",
+            "assignees__first_name": "first_name",
+            "assignees__last_name": "last_name",
+            "assignees__id": "id",
+        },
+    ),
+    "issue_cycle__cycle_id": (
+        "cycle_details",
+        Cycle,
+        {},
+        {"issue_cycle__cycle_id": "id", "issue_cycle__cycle__name": "name"},
+    ),
+    "issue_module__module_id": (
+        "module_details",
+        Module,
+        {},
+        {
+            "issue_module__module_id": "id",
+            "issue_module__module__name": "name",
+        },
+    ),
+}
+
+
+def compute_project_rollups(project, x_axis, segment_axis=""):
+    """Group the issues of the project by the axis and segment"""
+    queryset = Issue.issue_objects.filter(project_id=project.id)
+
+    if x_axis == ROLLUP_TOTAL_AXIS:
+        return [
+            IssueAnalyticsRollup(
+                workspace_id=project.workspace_id,
+                project_id=project.id,
+                x_axis=x_axis,
+                issue_count=queryset.count(),
+            )
+        ]
+
+    queryset, _ = extract_axis(queryset, x_axis)
+    fields = ["dimension"]
+    if segment_axis:
+        if segment_axis in DATE_AXES:
+            queryset = annotate_with_monthly_dimension(
+                queryset, segment_axis, "segmented"
+            )
+            queryset = queryset.annotate(segment=F("segmented"))
+        else:
+            queryset = queryset.annotate(segment=F(segment_axis))
+        fields.append("segment")
+
+    rollups = [
+        IssueAnalyticsRollup(
+            workspace_id=project.workspace_id,
+            project_id=project.id,
+            x_axis=x_axis,
+            segment_axis=segment_axis,
+            dimension=(
+                str(row["dimension"]) if row["dimension"] is not None else None
+            ),
+            segment=(
+                str(row["segment"])
+                if row.get("segment") is not None
+                else None
+            ),
+            issue_count=row["issue_count"],
+            estimate=row["estimate"],
+        )
+        for row in queryset.values(*fields)
+        .annotate(
+            issue_count=Count("*"),
+            estimate=Sum(Cast("estimate_point__value", FloatField())),
+        )
+        .order_by()
+    ]
+
+    # Keep an empty dimension row to tell the axis has been rolled up
+    if not any(rollup.dimension is None for rollup in rollups):
+        rollups.append(
+            IssueAnalyticsRollup(
+                workspace_id=project.workspace_id,
+                project_id=project.id,
+                x_axis=x_axis,
+                segment_axis=segment_axis,
+            )
+        )
+    return rollups
+
+
+def rebuild_project_rollups(project, x_axis, segment_axis=""):
+    rollups = compute_project_rollups(project, x_axis, segment_axis)
+    with transaction.atomic():
+        IssueAnalyticsRollup.objects.filter(
+            project_id=project.id, x_axis=x_axis, segment_axis=segment_axis
+        ).delete()
+        IssueAnalyticsRollup.objects.bulk_create(rollups, batch_size=1000)
+
+
+def schedule_analytics_refresh(project_id):
+    """Roll up the changes of the project once the changes settle"""
+    if project_id is None:
+        return
+    if cache.add(
+        f"analytics_rollup_refresh:{project_id}",
+        True,
+        ANALYTICS_ROLLUP_REFRESH_DELAY,
+    ):
+        from plane.bgtasks.analytics_rollup_task import (
+            refresh_project_analytics,
+        )
+
+        refresh_project_analytics.apply_async(
+            args=[str(project_id)], countdown=ANALYTICS_ROLLUP_REFRESH_DELAY
+        )
+
+
+def schedule_rollup_build(slug, x_axis, segment_axis):
+    if cache.add(
+        f"analytics_rollup_build:{slug}:{x_axis}:{segment_axis}",
+        True,
+        ANALYTICS_ROLLUP_BUILD_DELAY,
+    ):
+        from plane.bgtasks.analytics_rollup_task import (
+            build_analytics_rollups,
+        )
+
+        build_analytics_rollups.delay(
+            slug=slug, x_axis=x_axis, segment_axis=segment_axis
+        )
+
+
+def get_rollup_distribution(slug, filters, x_axis, y_axis, segment=None):
+    """
+    Answer the analytics from the rollups. Returns the total and the
+    distribution in the format of build_graph_plot, or None when the filters
+    need the issues or a project has not been rolled up yet
+    """
+    # Only the project filter can be answered from the rollups
+    if set(filters) - {"project__in"}:
+        return None
+
+    projects = Project.objects.filter(
+        workspace__slug=slug, archived_at__isnull=True
+    )
+    if filters.get("project__in"):
+        projects = projects.filter(pk__in=filters["project__in"])
+    project_ids = set(projects.values_list("id", flat=True))
+
+    segment_axis = segment or ""
+    rollups = IssueAnalyticsRollup.objects.filter(project_id__in=project_ids)
+
+    # Every project needs both the total and the requested axis
+    rolled_up = set(
+        rollups.filter(
+            Q(x_axis=x_axis, segment_axis=segment_axis)
+            | Q(x_axis=ROLLUP_TOTAL_AXIS),
+            dimension__isnull=True,
+        )
+        .values_list("x_axis", "project_id")
+        .distinct()
+    )
+    if any(
+        (axis, project_id) not in rolled_up
+        for project_id in project_ids
+        for axis in (x_axis, ROLLUP_TOTAL_AXIS)
+    ):
+        schedule_rollup_build(slug, x_axis, segment_axis)
+        return None
+
+    total = (
+        rollups.filter(x_axis=ROLLUP_TOTAL_AXIS).aggregate(
+            total=Sum("issue_count")
+        )["total"]
+        or 0
+    )
+
+    fields = ["dimension", "segment"] if segment else ["dimension"]
+    value_key = "count" if y_axis == "issue_count" else "estimate"
+    grouped_data = {}
+    for row in (
+        rollups.filter(
+            x_axis=x_axis,
+            segment_axis=segment_axis,
+            dimension__isnull=False,
+        )
+        .values(*fields)
+        .annotate(count=Sum("issue_count"), estimate=Sum("estimate"))
+        .order_by("dimension")
+    ):
+        item = {field: row[field] for field in fields}
+        item[value_key] = row[value_key]
+        grouped_data.setdefault(str(row["dimension"]), []).append(item)
+
+    return total, sort_data(grouped_data, x_axis)
+
+
+def get_rollup_details(distribution, x_axis, segment=None):
+    """Details of the ids on the axes of a rolled up distribution"""
+    details = {}
+    for axis, values in (
+        (x_axis, set(distribution.keys())),
+        (
+            segment,
+            {
+                item.get("segment")
+                for items in distribution.values()
+                for item in items
+            },
+        ),
+    ):
+        if axis not in ROLLUP_DETAILS:
+            continue
+        name, model, model_filters, fields = ROLLUP_DETAILS[axis]
+        details[name] = [
+            {key: row[field] for key, field in fields.items()}
+            for row in model.objects.filter(
+                pk__in=[value for value in values if value is not None],
+                **model_filters,
+            ).values(*fields.values())
+        ]
+    return details
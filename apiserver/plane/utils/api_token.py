@@ -0,0 +1,69 @@
+# Python imports
+import hashlib
+
+# Django imports
+from django.core.cache import cache
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import APIToken
+from plane.settings.redis import redis_instance
+
+# Dropped when the token row is saved or deleted, a token deactivated with
+# a queryset update is still accepted until the timeout
+API_TOKEN_CACHE_TIMEOUT = 60 * 5
+# Unknown tokens are remembered for a shorter time
+API_TOKEN_MISS_TIMEOUT = 60
+# Redis hash of token id to last use, written to the table in batches
+API_TOKEN_LAST_USED_KEY = "api_token_last_used"
+
+
+def api_token_cache_key(token):
+    # Do not keep the raw token in the cache keys
+    return f"api_token:{hashlib.sha256(token.encode()).hexdigest()}"
+
+
+def invalidate_api_token(token):
+    cache.delete(api_token_cache_key(token))
+
+
+def get_api_token(token):
+    """
+    Resolve an active token to its id, user, service flag and expiry.
+    Returns None for unknown, inactive and expired tokens
+    """
+    key = api_token_cache_key(token)
+    api_token = cache.get(key)
+    if api_token is None:
+        api_token = (
+            APIToken.objects.filter(token=token, is_active=True)
+            .values("id", "user_id", "is_service", "expired_at")
+            .first()
+        )
+        if api_token is None:
+            cache.set(key, {}, API_TOKEN_MISS_TIMEOUT)
+            return None
+        cache.set(key, api_token, API_TOKEN_CACHE_TIMEOUT)
+
+    if not api_token:
+        return None
+    # Expiry is checked on every use, the cached entry may outlive it
+    if (
+        api_token["expired_at"] is not None
+        and api_token["expired_at"] <= timezone.now()
+    ):
+        return None
+    return api_token
+
+
+def is_service_token(token):
+    api_token = get_api_token(token)
+    return api_token is not None and api_token["is_service"]
+
+
+def record_api_token_use(token_id):
+    """Remember the last use, flush_api_token_last_used saves it"""
+    redis_instance().hset(
+        API_TOKEN_LAST_USED_KEY, str(token_id), timezone.now().isoformat()
+    )
+
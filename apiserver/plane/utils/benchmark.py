@@ -0,0 +1,94 @@
+# Python imports
+import math
+import time
+
+# Django imports
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+# Module imports
+from plane.db.models import Project, User
+
+# The hot endpoints, formatted with the workspace, project and search term
+BENCHMARK_ENDPOINTS = {
+    "issue_list": "/api/workspaces/{slug}/projects/{project_id}/issues/",
+    "issue_list_grouped": (
+        "/api/workspaces/{slug}/projects/{project_id}/issues/"
+        "?group_by=state_id"
+    ),
+    "cycle_list": "/api/workspaces/{slug}/projects/{project_id}/cycles/",
+    "analytics": (
+        "/api/workspaces/{slug}/analytics/"
+        "?x_axis=priority&y_axis=issue_count&segment=state_id"
+    ),
+    "search": "/api/workspaces/{slug}/search/?search={search}",
+    "notifications": (
+        "/api/workspaces/{slug}/users/notifications/?type=assigned"
+    ),
+}
+
+
+def percentile(values, percent):
+    """Nearest rank percentile of the values"""
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def run_benchmarks(slug, email, iterations=20, warmup=2, endpoints=None):
+    """
+    Request the endpoints in process as the user, against the largest
+    project the user is a member of. Returns the latency percentiles in
+    milliseconds and the query counts of every endpoint
+    """
+    user = User.objects.get(email=email)
+    project = (
+        Project.objects.filter(
+            workspace__slug=slug,
+            project_projectmember__member=user,
+            project_projectmember__is_active=True,
+            archived_at__isnull=True,
+        )
+        .annotate(issue_count=Count("project_issue", distinct=True))
+        .order_by("-issue_count")
+        .first()
+    )
+    if project is None:
+        raise ValueError(f"{email} is not a member of a project in {slug}")
+
+    client = Client()
+    client.force_login(user)
+
+    results = {}
+    for name in endpoints or BENCHMARK_ENDPOINTS:
+        url = BENCHMARK_ENDPOINTS[name].format(
+            slug=slug,
+            project_id=project.id,
+            search=project.name.split()[0],
+        )
+        durations = []
+        query_counts = []
+        for iteration in range(warmup + iterations):
+            with CaptureQueriesContext(connection) as queries:
+                started_at = time.perf_counter()
+                response = client.get(url)
+                duration = (time.perf_counter() - started_at) * 1000
+            if response.status_code != 200:
+                raise ValueError(
+                    f"{url} responded with {response.status_code}"
+                )
+            # The first requests warm the caches and the connections
+            if iteration >= warmup:
+                durations.append(duration)
+                query_counts.append(len(queries.captured_queries))
+
+        results[name] = {
+            "url": url,
+            "iterations": iterations,
+            "p50_ms": round(percentile(durations, 50), 2),
+            "p95_ms": round(percentile(durations, 95), 2),
+            "queries": max(query_counts),
+        }
+    return results
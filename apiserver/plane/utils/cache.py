@@ -1,5 +1,6 @@
 # Python imports
 from functools import wraps
+from uuid import uuid4
 
 # Django imports
 from django.conf import settings
@@ -8,6 +9,10 @@ from django.core.cache import cache
 # Third party imports
 from rest_framework.response import Response
 
+# Tag versions outlive the longest cached response, a day. An expired
+# version only drops the responses recorded under it early
+CACHE_TAG_VERSION_TIMEOUT = 60 * 60 * 24 * 2
+
 
 def generate_cache_key(custom_path, auth_header=None):
     """Generate a cache key with the given params"""
@@ -18,6 +23,50 @@ def generate_cache_key(custom_path, auth_header=None):
     return key_data
 
 
+def get_cache_tags(custom_path, auth_header=None, slug=None):
+    """Tags a cached response depends on, invalidating a tag drops it"""
+    # The path tag covers every query string and user of the path
+    path = "/" + custom_path.split("?")[0].lstrip("/")
+    tags = [f"path:{path}"]
+    if auth_header:
+        tags.append(f"path:{path}:{auth_header}")
+    if slug:
+        tags.append(f"workspace:{slug}")
+    return tags
+
+
+def get_tag_version_key(tag):
+    return f"cache_tag_version:{tag}"
+
+
+def get_tag_versions(tags):
+    """Return the current version of every tag in one round trip"""
+    version_keys = [get_tag_version_key(tag) for tag in tags]
+    versions = cache.get_many(version_keys)
+    for version_key in version_keys:
+        if version_key not in versions:
+            # Keep the version of a concurrent request if it won the race
+            version = uuid4().hex
+            if not cache.add(
+                version_key, version, CACHE_TAG_VERSION_TIMEOUT
+            ):
+                version = cache.get(version_key, version)
+            versions[version_key] = version
+    return [versions[version_key] for version_key in version_keys]
+
+
+def invalidate_cache_tag(tag):
+    """Move the version of the tag, every entry recording it is dropped"""
+    cache.set(
+        get_tag_version_key(tag), uuid4().hex, CACHE_TAG_VERSION_TIMEOUT
+    )
+
+
+def invalidate_workspace_cache(slug):
+    """Drop every cached response recorded under the workspace"""
+    invalidate_cache_tag(f"workspace:{slug}")
+
+
 def cache_response(timeout=60 * 60, path=None, user=True):
     """decorator to create cache per user"""
 
@@ -31,7 +80,17 @@ def cache_response(timeout=60 * 60, path=None, user=True):
                 else str(request.user.id) if user else None
             )
             custom_path = path if path is not None else request.get_full_path()
-            key = generate_cache_key(custom_path, auth_header)
+            slug = (
+                request.resolver_match.kwargs.get("slug")
+                if request.resolver_match
+                else None
+            )
+            versions = get_tag_versions(
+                get_cache_tags(custom_path, auth_header, slug)
+            )
+            key = generate_cache_key(
+                f"{custom_path}:{':'.join(versions)}", auth_header
+            )
             cached_result = cache.get(key)
 
             if cached_result is not None:
@@ -69,12 +128,10 @@ def invalidate_cache_directly(
         if request and request.user.is_anonymous
         else str(request.user.id) if user else None
     )
-    key = generate_cache_key(custom_path, auth_header)
-
-    if multiple:
-        cache.delete_many(keys=cache.keys(f"*{key}*"))
-    else:
-        cache.delete(key)
+    # Invalidate the most specific tag, the path and user when the user is
+    # known and the whole path otherwise. As the path tag covers every query
+    # string, `multiple` no longer needs a keyspace scan
+    invalidate_cache_tag(get_cache_tags(custom_path, auth_header)[-1])
 
 
 def invalidate_cache(path=None, url_params=False, user=True, multiple=False):
@@ -0,0 +1,133 @@
+# Python imports
+import hashlib
+
+# Django imports
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+# Module imports
+from plane.db.models import Issue, IssueAssignee
+from plane.utils.group_count import get_group_count_versions
+from plane.utils.membership import get_membership
+
+# Counts are invalidated with the issues of the projects, the timeout only
+# bounds the staleness of the membership and the date based counts
+DASHBOARD_CACHE_TIMEOUT = 60
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+
+
+def dashboard_issues(request, slug):
+    """
+    The issues of the projects the user is an active member of, annotated
+    with whether the user is assigned. Guests only see their own issues
+    """
+    membership = get_membership(request, slug)
+    issues = Issue.issue_objects.filter(
+        workspace__slug=slug,
+        project_id__in=list(membership["project_roles"]),
+    ).annotate(
+        is_assigned=Exists(
+            IssueAssignee.objects.filter(
+                issue_id=OuterRef("id"), assignee_id=request.user.id
+            )
+        )
+    )
+    if membership["workspace_role"] == 5:
+        issues = issues.filter(created_by_id=request.user.id)
+    return issues
+
+
+def cached_dashboard_counts(request, slug, name, compute, filters=None):
+    """
+    Cache the counts of a widget per user and workspace. The key moves with
+    the group count versions of the member projects, so changing an issue
+    invalidates the counts of every user of its project
+    """
+    membership = get_membership(request, slug)
+    versions = get_group_count_versions(sorted(membership["project_roles"]))
+    key_data = hashlib.sha256(
+        str(
+            [
+                membership["workspace_role"],
+                sorted(versions.items()),
+                sorted((filters or {}).items()),
+                timezone.now().date(),
+            ]
+        ).encode()
+    ).hexdigest()
+    key = f"dashboard:{slug}:{request.user.id}:{name}:{key_data}"
+
+    counts = cache.get(key)
+    if counts is None:
+        counts = compute()
+        cache.set(key, counts, DASHBOARD_CACHE_TIMEOUT)
+    return counts
+
+
+def get_overview_counts(request, slug):
+    """Every counter of the overview widget in one conditional aggregate"""
+
+    def compute():
+        assigned = Q(is_assigned=True)
+        return dashboard_issues(request, slug).aggregate(
+            assigned_issues_count=Count("id", filter=assigned),
+            pending_issues_count=Count(
+                "id",
+                filter=assigned
+                & ~Q(state__group__in=["completed", "cancelled"])
+                & Q(target_date__lt=timezone.now().date()),
+            ),
+            completed_issues_count=Count(
+                "id", filter=assigned & Q(state__group="completed")
+            ),
+            created_issues_count=Count(
+                "id", filter=Q(created_by_id=request.user.id)
+            ),
+        )
+
+    return cached_dashboard_counts(request, slug, "overview", compute)
+
+
+def get_assigned_issue_counts(request, slug, filters):
+    """
+    The assigned issues counted by state group and by priority in one
+    query, shared by the state group and the priority widgets
+    """
+
+    def compute():
+        aggregates = {
+            f"state_{group}": Count(
+                "id", distinct=True, filter=Q(state__group=group)
+            )
+            for group in STATE_GROUPS
+        }
+        aggregates.update(
+            {
+                f"priority_{priority}": Count(
+                    "id", distinct=True, filter=Q(priority=priority)
+                )
+                for priority in PRIORITIES
+            }
+        )
+        counts = (
+            dashboard_issues(request, slug)
+            .filter(is_assigned=True)
+            .filter(**filters)
+            .aggregate(**aggregates)
+        )
+        return {
+            "state_groups": {
+                group: counts[f"state_{group}"] for group in STATE_GROUPS
+            },
+            "priorities": {
+                priority: counts[f"priority_{priority}"]
+                for priority in PRIORITIES
+            },
+        }
+
+    return cached_dashboard_counts(
+        request, slug, "assigned", compute, filters
+    )
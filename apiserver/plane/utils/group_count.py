@@ -0,0 +1,79 @@
+# Python imports
+import hashlib
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+
+# Counts are read under the current version of the project, which issue,
+# state and issue link writes move. The timeout evicts the counts of the
+# versions that are no longer read
+GROUP_COUNT_TIMEOUT = 60 * 10
+
+
+def group_count_version_key(project_id):
+    return f"issue_group_count:{project_id}:version"
+
+
+def get_group_count_version(project_id):
+    """Return the current version of the group counts of the project"""
+    version_key = group_count_version_key(project_id)
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid4().hex
+        # Do not overwrite a version set by a concurrent invalidation
+        if not cache.add(version_key, version, None):
+            version = cache.get(version_key, version)
+    return version
+
+
+def get_group_count_versions(project_ids):
+    """Return the versions of the group counts of the projects at once"""
+    version_keys = {
+        project_id: group_count_version_key(project_id)
+        for project_id in project_ids
+    }
+    versions = cache.get_many(list(version_keys.values()))
+    return {
+        project_id: (
+            versions[version_key]
+            if version_key in versions
+            else get_group_count_version(project_id)
+        )
+        for project_id, version_key in version_keys.items()
+    }
+
+
+def invalidate_group_counts(project_id):
+    """Drop every cached group count of the project by moving its version"""
+    if project_id is None:
+        return
+    cache.set(group_count_version_key(project_id), uuid4().hex, None)
+
+
+def cached_group_count(queryset, project_id, evaluate=list, version=None):
+    """
+    Evaluate an aggregate queryset once per project version.
+    The key is the sql of the queryset so that the filters, the grouping
+    and the requesting user restrictions are all a part of it
+    """
+    if project_id is None:
+        return evaluate(queryset)
+
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return evaluate(queryset)
+
+    query_hash = hashlib.sha256(
+        f"{sql}:{params}:{evaluate.__name__}".encode()
+    ).hexdigest()
+    version = version or get_group_count_version(project_id)
+    key = f"issue_group_count:{project_id}:{version}:{query_hash}"
+
+    result = cache.get(key)
+    if result is None:
+        result = evaluate(queryset)
+        cache.set(key, result, GROUP_COUNT_TIMEOUT)
+    return result
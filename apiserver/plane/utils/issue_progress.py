@@ -0,0 +1,208 @@
+# Django imports
+from django.db.models import (
+    Count,
+    F,
+    FloatField,
+    IntegerField,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Cast, Coalesce
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    CycleProgress,
+    Issue,
+    Module,
+    ModuleIssue,
+    ModuleProgress,
+)
+
+STATE_GROUPS = ["backlog", "unstarted", "started", "completed", "cancelled"]
+
+PROGRESS_FIELDS = [
+    f"{group}_{value}"
+    for value in ["issues", "estimate_points"]
+    for group in ["total"] + STATE_GROUPS
+]
+
+
+def estimate_point_sum(relation, state_group=None):
+    """Correlated sum of the estimate points of the cycle or module"""
+    state_filter = {"state__group": state_group} if state_group else {}
+    return Coalesce(
+        Subquery(
+            Issue.issue_objects.filter(
+                estimate_point__estimate__type="points",
+                **{relation: OuterRef("pk")},
+                **state_filter,
+            )
+            .values(relation)
+            .annotate(
+                estimate_points=Sum(
+                    Cast("estimate_point__value", FloatField())
+                )
+            )
+            .values("estimate_points")[:1]
+        ),
+        Value(0, output_field=FloatField()),
+    )
+
+
+def cycle_progress_annotations():
+    """The counts and the estimate sums of the cycles, from the issues"""
+    annotations = {}
+    for state_group in [None] + STATE_GROUPS:
+        state_filter = (
+            {"issue_cycle__issue__state__group": state_group}
+            if state_group
+            else {}
+        )
+        annotations[f"{state_group or 'total'}_issues"] = Count(
+            "issue_cycle__issue__id",
+            distinct=True,
+            filter=Q(
+                issue_cycle__issue__archived_at__isnull=True,
+                issue_cycle__issue__is_draft=False,
+                **state_filter,
+            ),
+        )
+        annotations[f"{state_group or 'total'}_estimate_points"] = (
+            estimate_point_sum("issue_cycle__cycle_id", state_group)
+        )
+    return annotations
+
+
+def module_progress_annotations():
+    """The counts and the estimate sums of the modules, from the issues"""
+    annotations = {}
+    for state_group in [None] + STATE_GROUPS:
+        state_filter = {"state__group": state_group} if state_group else {}
+        annotations[f"{state_group or 'total'}_issues"] = Coalesce(
+            Subquery(
+                Issue.issue_objects.filter(
+                    issue_module__module_id=OuterRef("pk"), **state_filter
+                )
+                .values("issue_module__module_id")
+                .annotate(cnt=Count("pk"))
+                .values("cnt")[:1]
+            ),
+            Value(0, output_field=IntegerField()),
+        )
+        annotations[f"{state_group or 'total'}_estimate_points"] = (
+            estimate_point_sum("issue_module__module_id", state_group)
+        )
+    return annotations
+
+
+def progress_annotations():
+    """Read the stored progress of the cycles or modules being queried"""
+    return {
+        field: Coalesce(
+            F(f"progress__{field}"),
+            Value(
+                0,
+                output_field=(
+                    IntegerField()
+                    if field.endswith("_issues")
+                    else FloatField()
+                ),
+            ),
+        )
+        for field in PROGRESS_FIELDS
+    }
+
+
+def save_progress(model, rows, key):
+    model.objects.bulk_create(
+        [
+            model(
+                **{f"{key}_id": row["id"]},
+                **{field: row[field] for field in PROGRESS_FIELDS},
+            )
+            for row in rows
+        ],
+        update_conflicts=True,
+        unique_fields=[key],
+        update_fields=PROGRESS_FIELDS + ["updated_at"],
+    )
+
+
+def refresh_cycle_progress(cycle_ids):
+    """Recompute the stored progress of the cycles"""
+    cycle_ids = {cycle_id for cycle_id in cycle_ids if cycle_id is not None}
+    if not cycle_ids:
+        return
+    save_progress(
+        CycleProgress,
+        Cycle.objects.filter(pk__in=cycle_ids)
+        .annotate(**cycle_progress_annotations())
+        .values("id", *PROGRESS_FIELDS),
+        "cycle",
+    )
+
+
+def refresh_module_progress(module_ids):
+    """Recompute the stored progress of the modules"""
+    module_ids = {
+        module_id for module_id in module_ids if module_id is not None
+    }
+    if not module_ids:
+        return
+    save_progress(
+        ModuleProgress,
+        Module.objects.filter(pk__in=module_ids)
+        .annotate(**module_progress_annotations())
+        .values("id", *PROGRESS_FIELDS),
+        "module",
+    )
+
+
+def refresh_issue_progress(issue_ids):
+    """Recompute the progress of the cycles and modules of the issues"""
+    issue_ids = list(issue_ids)
+    if not issue_ids:
+        return
+    refresh_cycle_progress(
+        CycleIssue.all_objects.filter(issue_id__in=issue_ids)
+        .values_list("cycle_id", flat=True)
+        .distinct()
+    )
+    refresh_module_progress(
+        ModuleIssue.all_objects.filter(issue_id__in=issue_ids)
+        .values_list("module_id", flat=True)
+        .distinct()
+    )
+
+
+def refresh_project_progress(project_id):
+    """Recompute the progress of every cycle and module of the project"""
+    refresh_cycle_progress(
+        Cycle.objects.filter(project_id=project_id).values_list(
+            "id", flat=True
+        )
+    )
+    refresh_module_progress(
+        Module.objects.filter(project_id=project_id).values_list(
+            "id", flat=True
+        )
+    )
+
+
+def ensure_cycle_progress(cycles):
+    """Compute the progress of the cycles that do not have one yet"""
+    refresh_cycle_progress(
+        cycles.filter(progress__isnull=True).values_list("id", flat=True)
+    )
+
+
+def ensure_module_progress(modules):
+    """Compute the progress of the modules that do not have one yet"""
+    refresh_module_progress(
+        modules.filter(progress__isnull=True).values_list("id", flat=True)
+    )
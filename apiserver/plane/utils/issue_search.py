@@ -5,6 +5,7 @@ import re
 from django.db.models import Q
 
 # Module imports
+from plane.utils.search import document_search_vector, search_query
 
 
 def search_issues(query, queryset):
@@ -17,6 +18,12 @@ def search_issues(query, queryset):
                 q |= Q(**{"sequence_id": sequence_id})
         else:
             q |= Q(**{f"{field}__icontains": query})
+
+    # Words of the description are matched through the search index
+    query_words = search_query(query)
+    if query_words is not None:
+        queryset = queryset.alias(search_document=document_search_vector())
+        q |= Q(search_document=query_words)
     return queryset.filter(
         q,
     ).distinct()
@@ -0,0 +1,130 @@
+# Python imports
+from uuid import uuid4
+
+# Django imports
+from django.core.cache import cache
+from django.db import transaction
+
+# Module imports
+from plane.db.models import ProjectMember, WorkspaceMember
+
+# Keyed by the membership version of the user, which the member receivers
+# and the bulk member writes move. The short timeout bounds a role change
+# made by any other queryset update
+MEMBERSHIP_CACHE_TIMEOUT = 60
+# A version outlives the memberships cached under it, an expired version
+# only drops them early
+MEMBERSHIP_VERSION_TIMEOUT = MEMBERSHIP_CACHE_TIMEOUT * 10
+
+
+def membership_version_key(user_id):
+    return f"membership:{user_id}:version"
+
+
+def get_membership_version(user_id):
+    """Return the current version of the cached memberships of the user"""
+    version_key = membership_version_key(user_id)
+    version = cache.get(version_key)
+    if version is None:
+        version = uuid4().hex
+        # Do not overwrite a version set by a concurrent invalidation
+        if not cache.add(version_key, version, MEMBERSHIP_VERSION_TIMEOUT):
+            version = cache.get(version_key, version)
+    return version
+
+
+def membership_cache_key(user_id, version, slug):
+    return f"membership:{user_id}:{version}:{slug}"
+
+
+def invalidate_membership(*user_ids):
+    """
+    Drop the cached memberships of the given users by moving their
+    versions. A request that read the roles before the change caches them
+    under the old version, where they are never read again. The versions
+    move again on commit, for the requests reading before the commit
+    """
+
+    def move_versions():
+        cache.set_many(
+            {
+                membership_version_key(user_id): uuid4().hex
+                for user_id in user_ids
+                if user_id
+            },
+            MEMBERSHIP_VERSION_TIMEOUT,
+        )
+
+    move_versions()
+    transaction.on_commit(move_versions)
+
+
+def get_membership(request, slug):
+    """
+    Return the active workspace role and the active project roles of the
+    requesting user in the workspace. The result is memoized on the request
+    and shared across workers through the cache for a short time
+    """
+    # Memoize on the django request, the drf request wraps it
+    http_request = getattr(request, "_request", request)
+    if not hasattr(http_request, "_plane_membership"):
+        http_request._plane_membership = {}
+    memo = http_request._plane_membership
+    if slug in memo:
+        return memo[slug]
+
+    user_id = request.user.id
+    # The version is read before the roles, so a change made meanwhile
+    # moves it away from the roles cached below
+    key = membership_cache_key(user_id, get_membership_version(user_id), slug)
+    membership = cache.get(key)
+    if membership is None:
+        membership = {
+            "workspace_role": WorkspaceMember.objects.filter(
+                member_id=user_id,
+                workspace__slug=slug,
+                is_active=True,
+            )
+            .values_list("role", flat=True)
+            .first(),
+            "project_roles": {
+                str(project_id): role
+                for project_id, role in ProjectMember.objects.filter(
+                    member_id=user_id,
+                    workspace__slug=slug,
+                    is_active=True,
+                ).values_list("project_id", "role")
+            },
+        }
+        cache.set(key, membership, MEMBERSHIP_CACHE_TIMEOUT)
+
+    memo[slug] = membership
+    return membership
+
+
+def get_workspace_role(request, slug):
+    return get_membership(request, slug)["workspace_role"]
+
+
+def get_project_role(request, slug, project_id):
+    return get_membership(request, slug)["project_roles"].get(str(project_id))
+
+
+def is_workspace_member(request, slug, roles=None):
+    """Check the active workspace membership, optionally for the roles"""
+    role = get_workspace_role(request, slug)
+    return role is not None and (roles is None or role in roles)
+
+
+def is_project_member(request, slug, project_id=None, roles=None):
+    """
+    Check the active project membership, optionally for the roles. Without
+    a project any project of the workspace is accepted
+    """
+    project_roles = get_membership(request, slug)["project_roles"]
+    if project_id is None:
+        return any(
+            roles is None or role in roles for role in project_roles.values()
+        )
+    role = project_roles.get(str(project_id))
+    return role is not None and (roles is None or role in roles)
@@ -1,36 +1,78 @@
 # Python imports
+import base64
+import json
 import math
+import uuid
+from datetime import datetime
 from collections import defaultdict
 from collections.abc import Sequence
+from functools import reduce
+from operator import or_
 
 # Django imports
-from django.db.models import Count, F, Window
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, F, Q, QuerySet, Window
 from django.db.models.functions import RowNumber
+from django.utils.dateparse import parse_datetime
 
 # Third party imports
 from rest_framework.exceptions import ParseError
 from rest_framework.response import Response
 
 # Module imports
+from plane.utils.group_count import cached_group_count
+
+
+class CursorKeyEncoder(DjangoJSONEncoder):
+    # Keep the microseconds, the keys are compared for equality
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
 
 
 class Cursor:
     # The cursor value
-    def __init__(self, value, offset=0, is_prev=False, has_results=None):
+    def __init__(
+        self,
+        value,
+        offset=0,
+        is_prev=False,
+        has_results=None,
+        keys=None,
+        hits=None,
+        max_hits=None,
+    ):
         self.value = value
         self.offset = int(offset)
         self.is_prev = bool(is_prev)
         self.has_results = has_results
+        # Keyset state - the last seen row(s) and the totals of page 1
+        self.keys = keys
+        self.hits = hits
+        self.max_hits = max_hits
 
     # Return the cursor value in string format
     def __str__(self):
-        return f"{self.value}:{self.offset}:{int(self.is_prev)}"
+        cursor = f"{self.value}:{self.offset}:{int(self.is_prev)}"
+        if self.keys is None:
+            return cursor
+        return f"{cursor}:{self.encode_keys()}"
 
     # Return the cursor value
     def __eq__(self, other):
         return all(
             getattr(self, attr) == getattr(other, attr)
-            for attr in ("value", "offset", "is_prev", "has_results")
+            for attr in (
+                "value",
+                "offset",
+                "is_prev",
+                "has_results",
+                "keys",
+                "hits",
+                "max_hits",
+            )
         )
 
     # Return the representation of the cursor
@@ -41,18 +83,94 @@ class Cursor:
     def __bool__(self):
         return bool(self.has_results)
 
+    @property
+    def is_keyset(self):
+        return self.keys is not None
+
+    def encode_keys(self):
+        """Encode the keyset state as an url safe string"""
+        payload = json.dumps(
+            {"k": self.keys, "h": self.hits, "m": self.max_hits},
+            cls=CursorKeyEncoder,
+            separators=(",", ":"),
+        )
+        return (
+            base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        )
+
+    @staticmethod
+    def decode_keys(value):
+        """Decode the keyset state from the url safe string"""
+        padding = "=" * (-len(value) % 4)
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(value + padding))
+        except (TypeError, ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor keys: {e}")
+        if not isinstance(payload, dict) or not isinstance(
+            payload.get("k"), list
+        ):
+            raise ValueError("Invalid cursor keys")
+
+        keys, hits, max_hits = payload["k"], payload.get("h"), payload.get("m")
+        # The grouped cursors carry a key per group, the others a single one
+        if keys and all(isinstance(key, list) for key in keys):
+            Cursor.validate_keys(keys, lengths=(4, 5))
+        elif keys:
+            Cursor.validate_keys([keys], lengths=(3,))
+
+        # The totals are echoed back as they are, so they must at least be
+        # counts, and never more pages than rows
+        if hits is None and max_hits is None:
+            return keys, hits, max_hits
+        if any(
+            isinstance(total, bool) or not isinstance(total, int)
+            for total in (hits, max_hits)
+        ) or not (0 <= hits and 0 <= max_hits <= max(hits, 1)):
+            raise ValueError("Invalid cursor totals")
+        return keys, hits, max_hits
+
+    @staticmethod
+    def validate_keys(keys, lengths):
+        """
+        Check the keys are the group values and the ordering value, then the
+        created_at and the id of a row, all of the same length
+        """
+        if len({len(key) for key in keys}) != 1:
+            raise ValueError("Invalid cursor keys")
+        for key in keys:
+            if len(key) not in lengths or any(
+                isinstance(value, (list, dict)) for value in key
+            ):
+                raise ValueError("Invalid cursor keys")
+            created_at, pk = key[-2:]
+            if not isinstance(created_at, str) or not isinstance(pk, str):
+                raise ValueError("Invalid cursor keys")
+            if parse_datetime(created_at) is None:
+                raise ValueError("Invalid cursor keys")
+            uuid.UUID(pk)
+
     @classmethod
     def from_string(cls, value):
         """Return the cursor value from string format"""
         try:
             bits = value.split(":")
-            if len(bits) != 3:
+            if len(bits) not in (3, 4):
                 raise ValueError(
-                    "Cursor must be in the format 'value:offset:is_prev'"
+                    "Cursor must be in the format 'value:offset:is_prev' or 'value:offset:is_prev:keys'"
                 )
 
             value = float(bits[0]) if "." in bits[0] else int(bits[0])
-            return cls(value, int(bits[1]), bool(int(bits[2])))
+            keys, hits, max_hits = (
+                cls.decode_keys(bits[3]) if len(bits) == 4 else (None,) * 3
+            )
+            return cls(
+                value,
+                int(bits[1]),
+                bool(int(bits[2])),
+                keys=keys,
+                hits=hits,
+                max_hits=max_hits,
+            )
         except (TypeError, ValueError) as e:
             raise ValueError(f"Invalid cursor format: {e}")
 
@@ -85,6 +203,10 @@ class CursorResult(Sequence):
 MAX_LIMIT = 100
 
 
+# Cursor mode requesting seek pagination on the first page
+KEYSET_CURSOR = "keyset"
+
+
 class BadPaginationError(Exception):
     pass
 
@@ -104,6 +226,9 @@ class OffsetPaginator:
         max_limit=MAX_LIMIT,
         max_offset=None,
         on_results=None,
+        keyset=False,
+        count_hits=True,
+        project_id=None,
     ):
         # Key tuple and remove `-` if descending order by
         self.key = (
@@ -117,6 +242,227 @@ class OffsetPaginator:
         self.max_limit = max_limit
         self.max_offset = max_offset
         self.on_results = on_results
+        # Seek from the last row of the previous page instead of offsetting
+        self.keyset = keyset
+        # Skip the total count when the caller does not need it
+        self.count_hits = count_hits
+        # Project the counts are cached for, counts are live when not set
+        self.project_id = project_id
+
+    def get_ordering(self):
+        # Order by the key, then by created_at and id so that every row has
+        # a unique position which the keyset cursor can seek from
+        ordering = []
+        if self.key:
+            ordering.append(
+                F(*self.key).desc(nulls_last=True)
+                if self.desc
+                else F(*self.key).asc(nulls_last=True)
+            )
+        ordering.extend([F("created_at").desc(), F("id").desc()])
+        return ordering
+
+    def get_seek_filter(self, order_value, created_at, pk):
+        """Filter the rows which come after the given row in the ordering"""
+        tail = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        if not self.key:
+            return tail
+
+        key = self.key[0]
+        # Nulls are ordered last in both the directions
+        if order_value is None:
+            return Q(**{f"{key}__isnull": True}) & tail
+        return (
+            Q(**{f"{key}__{'lt' if self.desc else 'gt'}": order_value})
+            | Q(**{f"{key}__isnull": True})
+            | (Q(**{key: order_value}) & tail)
+        )
+
+    def get_group_filter(self, group_fields, group_values):
+        # Filter the rows belonging to the given group (and sub group)
+        return reduce(
+            lambda query, group_query: query & group_query,
+            [
+                (
+                    Q(**{f"{field}__isnull": True})
+                    if value is None
+                    else Q(**{field: value})
+                )
+                for field, value in zip(group_fields, group_values)
+            ],
+        )
+
+    def seek(self, queryset, keys, group_fields=None):
+        """
+        Filter the rows after the keys of a cursor. The keys come from the
+        client, so keys not fitting the ordering or the grouping are a bad
+        cursor rather than an error
+        """
+        if not keys:
+            return queryset.none()
+        try:
+            if group_fields is None:
+                if len(keys) != len(self.get_seek_fields()):
+                    raise ValueError("The cursor keys do not fit the order")
+                return queryset.filter(self.get_seek_filter(*keys))
+
+            if any(
+                not isinstance(key, list)
+                or len(key) != len(group_fields) + len(self.get_seek_fields())
+                for key in keys
+            ):
+                raise ValueError("The cursor keys do not fit the groups")
+            return queryset.filter(
+                reduce(
+                    or_,
+                    [
+                        self.get_group_filter(
+                            group_fields, key[: len(group_fields)]
+                        )
+                        & self.get_seek_filter(*key[len(group_fields) :])
+                        for key in keys
+                    ],
+                )
+            )
+        except (TypeError, ValueError, ValidationError) as e:
+            raise BadPaginationError(f"Invalid cursor keys: {e}")
+
+    def get_seek_fields(self):
+        # Fields read from the last row of a page to build the next cursor
+        return [self.key[0] if self.key else "created_at", "created_at", "id"]
+
+    def get_keyset_result(self, limit, cursor):
+        page = cursor.offset
+        queryset = self.queryset.order_by(*self.get_ordering())
+
+        # Seek past the last row of the previous page
+        if cursor.is_keyset:
+            queryset = self.seek(queryset, cursor.keys)
+
+        # Fetch one extra row to know whether there is a next page
+        rows = list(
+            queryset.values_list(*self.get_seek_fields())[: limit + 1]
+        )
+        results = queryset[:limit]
+
+        # Total is computed on the first page and carried by the cursor
+        if cursor.is_keyset:
+            hits, max_hits = cursor.hits, cursor.max_hits
+        elif self.count_hits:
+            hits = cached_group_count(
+                self.queryset, self.project_id, QuerySet.count
+            )
+            max_hits = math.ceil(hits / limit)
+        else:
+            hits, max_hits = None, None
+
+        has_next = len(rows) > limit
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            has_next,
+            keys=list(rows[limit - 1]) if has_next else [],
+            hits=hits,
+            max_hits=max_hits,
+        )
+        # Seeking backwards is not supported, the previous page is offset
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        if self.on_results:
+            results = self.on_results(results)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits,
+        )
+
+    def get_max_hits(self, limit):
+        # Number of pages needed by the largest group
+        counts = cached_group_count(
+            self.queryset.values(self.group_by_field_name)
+            .annotate(
+                count=Count(
+                    "id",
+                    filter=self.count_filter,
+                    distinct=True,
+                )
+            )
+            .order_by("-count")[:1],
+            self.project_id,
+        )
+        return math.ceil(counts[0]["count"] / limit) if counts else 0
+
+    def get_grouped_keyset_result(self, limit, cursor, group_fields):
+        """Seek every group (and sub group) from its own last row"""
+        page = cursor.offset
+        queryset = self.queryset
+
+        if cursor.is_keyset:
+            queryset = self.seek(queryset, cursor.keys, group_fields)
+
+        # Number the rows of every group after seeking
+        queryset = queryset.annotate(
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F(field) for field in group_fields],
+                order_by=self.get_ordering(),
+            )
+        )
+
+        # Only the last row of the page and the row after it are needed
+        last_rows = {}
+        groups_with_next = set()
+        for *values, row_number in queryset.filter(
+            row_number__gte=limit, row_number__lte=limit + 1
+        ).values_list(*group_fields, *self.get_seek_fields(), "row_number"):
+            group = tuple(str(value) for value in values[: len(group_fields)])
+            if row_number == limit:
+                last_rows[group] = values
+            else:
+                groups_with_next.add(group)
+
+        next_keys = [
+            last_rows[group] for group in groups_with_next if group in last_rows
+        ]
+
+        results = queryset.filter(row_number__lte=limit).order_by(
+            *self.get_ordering()
+        )
+
+        # Totals are computed on the first page and carried by the cursor
+        if cursor.is_keyset:
+            hits, max_hits = cursor.hits, cursor.max_hits
+        elif self.count_hits:
+            hits = cached_group_count(
+                self.queryset, self.project_id, QuerySet.count
+            )
+            max_hits = self.get_max_hits(limit) if hits else 0
+        else:
+            hits, max_hits = None, None
+
+        next_cursor = Cursor(
+            limit,
+            page + 1,
+            False,
+            bool(next_keys),
+            keys=next_keys,
+            hits=hits,
+            max_hits=max_hits,
+        )
+        # Seeking backwards is not supported, the previous page is offset
+        prev_cursor = Cursor(limit, page - 1, True, page > 0)
+
+        return CursorResult(
+            results=results,
+            next=next_cursor,
+            prev=prev_cursor,
+            hits=hits,
+            max_hits=max_hits,
+        )
 
     def get_result(self, limit=100, cursor=None):
         # offset is page #
@@ -127,6 +473,9 @@ class OffsetPaginator:
         # Get the min from limit and max limit
         limit = min(limit, self.max_limit)
 
+        if self.keyset or cursor.is_keyset:
+            return self.get_keyset_result(limit=limit, cursor=cursor)
+
         # queryset
         queryset = self.queryset
         if self.key:
@@ -167,7 +516,7 @@ class OffsetPaginator:
             results = self.on_results(results)
 
         # Count the queryset
-        count = queryset.count()
+        count = cached_group_count(queryset, self.project_id, QuerySet.count)
 
         # Optionally, calculate the total count and max_hits if needed
         max_hits = math.ceil(count / limit)
@@ -221,6 +570,13 @@ class GroupedOffsetPaginator(OffsetPaginator):
 
         limit = min(limit, self.max_limit)
 
+        if self.keyset or cursor.is_keyset:
+            return self.get_grouped_keyset_result(
+                limit=limit,
+                cursor=cursor,
+                group_fields=[self.group_by_field_name],
+            )
+
         # Adjust the initial offset and stop based on the cursor and limit
         queryset = self.queryset
 
@@ -286,23 +642,12 @@ class GroupedOffsetPaginator(OffsetPaginator):
         )
 
         # Count the queryset
-        count = queryset.count()
+        count = cached_group_count(queryset, self.project_id, QuerySet.count)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
         if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(
-                    count=Count(
-                        "id",
-                        filter=self.count_filter,
-                        distinct=True,
-                    )
-                )
-                .order_by("-count")[0]["count"]
-                / limit
-            )
+            max_hits = self.get_max_hits(limit)
         else:
             max_hits = 0
         return CursorResult(
@@ -330,7 +675,9 @@ class GroupedOffsetPaginator(OffsetPaginator):
     def __get_total_dict(self):
         # Convert the total into dictionary of keys as group name and value as the total
         total_group_dict = {}
-        for group in self.__get_total_queryset():
+        for group in cached_group_count(
+            self.__get_total_queryset(), self.project_id
+        ):
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(
                     str(group.get(self.group_by_field_name)), 0
@@ -460,6 +807,16 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # get the minimum value
         limit = min(limit, self.max_limit)
 
+        if self.keyset or cursor.is_keyset:
+            return self.get_grouped_keyset_result(
+                limit=limit,
+                cursor=cursor,
+                group_fields=[
+                    self.group_by_field_name,
+                    self.sub_group_by_field_name,
+                ],
+            )
+
         # Adjust the initial offset and stop based on the cursor and limit
         queryset = self.queryset
 
@@ -528,23 +885,12 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         )
 
         # Count the queryset
-        count = queryset.count()
+        count = cached_group_count(queryset, self.project_id, QuerySet.count)
 
         # Optionally, calculate the total count and max_hits if needed
         # This might require adjustments based on specific use cases
         if results:
-            max_hits = math.ceil(
-                queryset.values(self.group_by_field_name)
-                .annotate(
-                    count=Count(
-                        "id",
-                        filter=self.count_filter,
-                        distinct=True,
-                    )
-                )
-                .order_by("-count")[0]["count"]
-                / limit
-            )
+            max_hits = self.get_max_hits(limit)
         else:
             max_hits = 0
         return CursorResult(
@@ -589,7 +935,9 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
         # Use the above to convert to dictionary of 2D objects
         total_group_dict = {}
         total_sub_group_dict = {}
-        for group in self.__get_group_total_queryset():
+        for group in cached_group_count(
+            self.__get_group_total_queryset(), self.project_id
+        ):
             total_group_dict[str(group.get(self.group_by_field_name))] = (
                 total_group_dict.get(
                     str(group.get(self.group_by_field_name)), 0
@@ -598,7 +946,9 @@ class SubGroupedOffsetPaginator(OffsetPaginator):
             )
 
         # Sub group total values
-        for item in self.__get_subgroup_total_queryset():
+        for item in cached_group_count(
+            self.__get_subgroup_total_queryset(), self.project_id
+        ):
             group = str(item[self.group_by_field_name])
             subgroup = str(item[self.sub_group_by_field_name])
             count = item["count"]
@@ -725,6 +1075,8 @@ class BasePaginator:
 
     # cursor query parameter name
     cursor_name = "cursor"
+    # cursor mode query parameter name, `keyset` enables seek pagination
+    cursor_mode_name = "cursor_mode"
 
     # get the per page parameter from request
     def get_per_page(self, request, default_per_page=100, max_per_page=100):
@@ -772,6 +1124,10 @@ class BasePaginator:
             raise ParseError(detail="Invalid cursor parameter.")
 
         if not paginator:
+            paginator_kwargs["keyset"] = (
+                input_cursor.is_keyset
+                or request.GET.get(self.cursor_mode_name) == KEYSET_CURSOR
+            )
             if group_by_field_name:
                 paginator_kwargs["group_by_field_name"] = group_by_field_name
                 paginator_kwargs["group_by_fields"] = group_by_fields
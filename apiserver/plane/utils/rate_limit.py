@@ -0,0 +1,107 @@
+# Python imports
+import time
+
+# Third party imports
+from rest_framework.throttling import SimpleRateThrottle
+
+# Module imports
+from plane.settings.redis import redis_instance
+from plane.utils.exception_logger import log_exception
+
+# Generic cell rate algorithm, the key holds the theoretical arrival time
+# of the next request. Returns allowed, remaining, reset after, retry after
+GCRA_SCRIPT = """
+if redis.replicate_commands then
+    redis.replicate_commands()
+end
+
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local interval = period / limit
+
+local tat = tonumber(redis.call("GET", KEYS[1]))
+if tat == nil or tat < now then
+    tat = now
+end
+
+local new_tat = tat + interval
+local allow_at = new_tat - period
+if allow_at > now then
+    return {0, 0, tostring(tat - now), tostring(allow_at - now)}
+end
+
+redis.call(
+    "SET", KEYS[1], tostring(new_tat),
+    "PX", math.ceil((new_tat - now) * 1000)
+)
+local remaining = math.floor((now - allow_at) / interval)
+return {1, remaining, tostring(new_tat - now), "0"}
+"""
+
+_gcra_script = None
+
+
+def check_rate_limit(key, limit, period):
+    """
+    Count a request against the limit of the key in one atomic redis call.
+    Returns (allowed, remaining, reset after, retry after) with the times
+    in seconds
+    """
+    global _gcra_script
+    ri = redis_instance()
+    if _gcra_script is None:
+        _gcra_script = ri.register_script(GCRA_SCRIPT)
+    allowed, remaining, reset_after, retry_after = _gcra_script(
+        keys=[key], args=[limit, period], client=ri
+    )
+    return (
+        bool(allowed),
+        int(remaining),
+        float(reset_after),
+        float(retry_after),
+    )
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle counted in redis, the limit and the remaining requests
+    come from a single atomic call instead of the request history
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        try:
+            allowed, remaining, reset_after, retry_after = check_rate_limit(
+                key=f"throttle:{self.key}",
+                limit=self.num_requests,
+                period=self.duration,
+            )
+        except Exception as e:
+            # Do not fail the requests when redis is unavailable
+            log_exception(e)
+            return True
+
+        self.retry_after = retry_after
+
+        # Add headers
+        request.META["X-RateLimit-Remaining"] = remaining
+        # Unix timestamp for when the rate limit will reset
+        request.META["X-RateLimit-Reset"] = int(time.time() + reset_after)
+
+        if not allowed:
+            return self.throttle_failure()
+        return self.throttle_success()
+
+    def throttle_success(self):
+        return True
+
+    def wait(self):
+        return self.retry_after or None
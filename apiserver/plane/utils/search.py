@@ -0,0 +1,35 @@
+# Python imports
+import re
+
+# Django imports
+from django.contrib.postgres.search import SearchQuery, SearchVector
+
+# The simple configuration does not stem, names and identifiers are
+# matched as they are written in any language
+SEARCH_CONFIG = "simple"
+
+
+def document_search_vector():
+    """
+    The search document of issues and pages, the expression of their
+    search index. Queries have to use the same expression to be served by
+    the index
+    """
+    return SearchVector(
+        "name", weight="A", config=SEARCH_CONFIG
+    ) + SearchVector("description_stripped", weight="B", config=SEARCH_CONFIG)
+
+
+def search_query(query):
+    """
+    Match every word of the query as a prefix, so that the results update
+    while the last word is being typed. Returns None without any word
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words),
+        search_type="raw",
+        config=SEARCH_CONFIG,
+    )
@@ -0,0 +1,517 @@
+# Python imports
+import multiprocessing
+import random
+import uuid
+from datetime import timedelta
+
+# Django imports
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+# Third party imports
+from faker import Faker
+
+# Module imports
+from plane.db.models import (
+    Cycle,
+    CycleIssue,
+    Issue,
+    IssueActivity,
+    IssueAssignee,
+    IssueComment,
+    IssueLabel,
+    IssueSequence,
+    IssueSequenceCounter,
+    Label,
+    Module,
+    ModuleIssue,
+    Notification,
+    Page,
+    Project,
+    ProjectMember,
+    ProjectPage,
+    State,
+    User,
+    Workspace,
+    WorkspaceMember,
+)
+from plane.utils.issue_progress import refresh_project_progress
+
+# Sizes of the generated workspaces. Members are per workspace, the other
+# counts per project, and activities, comments and notifications per issue
+SYNTHETIC_DATA_PROFILES = {
+    "S": {
+        "projects": 5,
+        "members": 10,
+        "project_members": 5,
+        "issues": 200,
+        "cycles": 5,
+        "modules": 5,
+        "labels": 10,
+        "pages": 10,
+        "activities": 3,
+        "comments": 1,
+        "notifications": 1,
+    },
+    "M": {
+        "projects": 25,
+        "members": 50,
+        "project_members": 10,
+        "issues": 2000,
+        "cycles": 10,
+        "modules": 10,
+        "labels": 20,
+        "pages": 25,
+        "activities": 4,
+        "comments": 2,
+        "notifications": 1,
+    },
+    "L": {
+        "projects": 100,
+        "members": 200,
+        "project_members": 20,
+        "issues": 10000,
+        "cycles": 20,
+        "modules": 20,
+        "labels": 30,
+        "pages": 50,
+        "activities": 5,
+        "comments": 2,
+        "notifications": 2,
+    },
+    "XL": {
+        "projects": 400,
+        "members": 1000,
+        "project_members": 30,
+        "issues": 10000,
+        "cycles": 30,
+        "modules": 30,
+        "labels": 50,
+        "pages": 100,
+        "activities": 6,
+        "comments": 3,
+        "notifications": 2,
+    },
+}
+
+STATES = [
+    ("Backlog", "#A3A3A3", "backlog"),
+    ("Todo", "#3A3A3A", "unstarted"),
+    ("In Progress", "#F59E0B", "started"),
+    ("Done", "#16A34A", "completed"),
+    ("Cancelled", "#EF4444", "cancelled"),
+]
+PRIORITIES = ["urgent", "high", "medium", "low", "none"]
+# Issues are spread over this many days before the generation
+HISTORY_DAYS = 365
+
+
+def copy_instances(instances):
+    """
+    Load model instances of a single model with COPY. The field defaults of
+    the instances apply, their save methods and signals do not
+    """
+    if not instances:
+        return
+    model = type(instances[0])
+    fields = model._meta.concrete_fields
+    now = timezone.now()
+    columns = ", ".join(
+        connection.ops.quote_name(field.column) for field in fields
+    )
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    with connection.cursor() as cursor:
+        with cursor.cursor.copy(
+            f"COPY {table} ({columns}) FROM STDIN"
+        ) as copy:
+            for instance in instances:
+                row = []
+                for field in fields:
+                    value = getattr(instance, field.attname)
+                    # Timestamps set by the generator are kept
+                    if value is None and (
+                        getattr(field, "auto_now", False)
+                        or getattr(field, "auto_now_add", False)
+                    ):
+                        value = now
+                    row.append(field.get_db_prep_save(value, connection))
+                copy.write_row(row)
+
+
+class ProjectGenerator:
+    """Generate the rows of one project, the same ones for the same seed"""
+
+    def __init__(self, workspace, owner_id, member_ids, profile, seed, index):
+        self.workspace = workspace
+        self.owner_id = owner_id
+        self.profile = SYNTHETIC_DATA_PROFILES[profile]
+        self.index = index
+        self.random = random.Random(f"{seed}:{index}")
+        self.fake = Faker()
+        self.fake.seed_instance(f"{seed}:{index}")
+        self.now = timezone.now()
+        self.member_ids = [owner_id] + self.random.sample(
+            member_ids, min(len(member_ids), self.profile["project_members"])
+        )
+
+    def uuid(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def past(self, days=HISTORY_DAYS):
+        return self.now - timedelta(
+            seconds=self.random.randint(0, days * 24 * 60 * 60)
+        )
+
+    def scoped(self, model, **kwargs):
+        return model(
+            id=self.uuid(),
+            project=self.project,
+            workspace=self.workspace,
+            **kwargs,
+        )
+
+    def generate(self):
+        self.project = Project(
+            id=self.uuid(),
+            workspace=self.workspace,
+            name=f"{self.fake.catch_phrase()} {self.index}",
+            identifier=f"P{self.index}",
+            created_by_id=self.owner_id,
+            inbox_view=True,
+        )
+        copy_instances([self.project])
+        copy_instances(
+            [
+                self.scoped(
+                    ProjectMember,
+                    member_id=member_id,
+                    role=20,
+                    sort_order=self.random.randint(0, 65535),
+                )
+                for member_id in self.member_ids
+            ]
+        )
+
+        self.states = [
+            self.scoped(
+                State,
+                name=name,
+                color=color,
+                group=group,
+                slug=name.lower().replace(" ", "-"),
+                sequence=15000 + position * 10000,
+                default=position == 0,
+            )
+            for position, (name, color, group) in enumerate(STATES)
+        ]
+        self.labels = [
+            self.scoped(
+                Label,
+                name=f"{self.fake.word()} {position}",
+                color=self.fake.hex_color(),
+                sort_order=position * 10000,
+            )
+            for position in range(self.profile["labels"])
+        ]
+        self.cycles = [
+            self.cycle(position) for position in range(self.profile["cycles"])
+        ]
+        self.modules = [
+            self.scoped(
+                Module,
+                name=self.fake.bs().title(),
+                start_date=self.past().date(),
+                target_date=(self.now + timedelta(days=30)).date(),
+                sort_order=position * 10000,
+            )
+            for position in range(self.profile["modules"])
+        ]
+        for rows in [self.states, self.labels, self.cycles, self.modules]:
+            copy_instances(rows)
+
+        self.generate_issues()
+        self.generate_pages()
+        return self.project.id
+
+    def cycle(self, position):
+        # Two week cycles back to back, the last one running
+        end_date = self.now - timedelta(
+            days=14 * (self.profile["cycles"] - position - 1) - 7
+        )
+        return self.scoped(
+            Cycle,
+            name=f"Cycle {position + 1}",
+            owned_by_id=self.owner_id,
+            start_date=(end_date - timedelta(days=14)).date(),
+            end_date=end_date.date(),
+            sort_order=position * 10000,
+        )
+
+    def generate_issues(self):
+        issue_count = self.profile["issues"]
+        sequences = IssueSequenceCounter.objects.allocate(
+            self.project.id, count=issue_count
+        )
+
+        issues = []
+        for sequence_id in sequences:
+            created_at = self.past()
+            state = self.random.choice(self.states)
+            start_date = (
+                (created_at + timedelta(days=self.random.randint(0, 14)))
+                if self.random.random() < 0.5
+                else None
+            )
+            description = self.fake.paragraph(nb_sentences=5)
+            issues.append(
+                self.scoped(
+                    Issue,
+                    name=self.fake.sentence(nb_words=8)[:255],
+                    description_html=f"<p>{description}</p>",
+                    description_stripped=description,
+                    state_id=state.id,
+                    sequence_id=sequence_id,
+                    sort_order=sequence_id * 1000,
+                    priority=self.random.choice(PRIORITIES),
+                    start_date=start_date.date() if start_date else None,
+                    target_date=(
+                        (start_date + timedelta(days=14)).date()
+                        if start_date
+                        else None
+                    ),
+                    completed_at=(
+                        created_at + timedelta(days=self.random.randint(1, 30))
+                        if state.group == "completed"
+                        else None
+                    ),
+                    created_by_id=self.random.choice(self.member_ids),
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+            )
+        # A quarter of the issues are sub issues of the first issues
+        for issue in issues[len(issues) // 2 :: 2]:
+            issue.parent_id = self.random.choice(issues[: len(issues) // 4]).id
+        copy_instances(issues)
+
+        copy_instances(
+            [
+                self.scoped(
+                    IssueSequence,
+                    issue_id=issue.id,
+                    sequence=issue.sequence_id,
+                )
+                for issue in issues
+            ]
+        )
+
+        assignees = []
+        labels = []
+        cycle_issues = []
+        module_issues = []
+        activities = []
+        comments = []
+        notifications = []
+        for issue in issues:
+            issue_assignees = self.random.sample(
+                self.member_ids, self.random.randint(0, 2)
+            )
+            assignees.extend(
+                self.scoped(
+                    IssueAssignee, issue_id=issue.id, assignee_id=assignee_id
+                )
+                for assignee_id in issue_assignees
+            )
+            labels.extend(
+                self.scoped(IssueLabel, issue_id=issue.id, label_id=label.id)
+                for label in self.random.sample(
+                    self.labels,
+                    min(len(self.labels), self.random.randint(0, 3)),
+                )
+            )
+            if self.cycles and self.random.random() < 0.5:
+                cycle_issues.append(
+                    self.scoped(
+                        CycleIssue,
+                        issue_id=issue.id,
+                        cycle_id=self.random.choice(self.cycles).id,
+                    )
+                )
+            if self.modules and self.random.random() < 0.5:
+                module_issues.append(
+                    self.scoped(
+                        ModuleIssue,
+                        issue_id=issue.id,
+                        module_id=self.random.choice(self.modules).id,
+                    )
+                )
+
+            activities.append(
+                self.scoped(
+                    IssueActivity,
+                    issue_id=issue.id,
+                    actor_id=issue.created_by_id,
+                    verb="created",
+                    comment="created the issue",
+                    created_at=issue.created_at,
+                )
+            )
+            for _ in range(self.profile["activities"] - 1):
+                activities.append(
+                    self.scoped(
+                        IssueActivity,
+                        issue_id=issue.id,
+                        actor_id=self.random.choice(self.member_ids),
+                        verb="updated",
+                        field="priority",
+                        old_value=self.random.choice(PRIORITIES),
+                        new_value=issue.priority,
+                        comment="updated the priority to",
+                        epoch=issue.created_at.timestamp(),
+                        created_at=issue.created_at,
+                    )
+                )
+            for _ in range(self.profile["comments"]):
+                text = self.fake.sentence()
+                comments.append(
+                    self.scoped(
+                        IssueComment,
+                        issue_id=issue.id,
+                        actor_id=self.random.choice(self.member_ids),
+                        comment_stripped=text,
+                        comment_html=f"<p>{text}</p>",
+                        created_at=issue.created_at,
+                    )
+                )
+            for assignee_id in issue_assignees[
+                : self.profile["notifications"]
+            ]:
+                notifications.append(
+                    self.scoped(
+                        Notification,
+                        receiver_id=assignee_id,
+                        triggered_by_id=issue.created_by_id,
+                        entity_identifier=issue.id,
+                        entity_name="issue",
+                        title=issue.name,
+                        sender="in_app:issue_activities:assigned",
+                        data={
+                            "issue": {
+                                "id": str(issue.id),
+                                "name": issue.name,
+                                "sequence_id": issue.sequence_id,
+                                "identifier": self.project.identifier,
+                            },
+                        },
+                        read_at=(
+                            issue.created_at
+                            if self.random.random() < 0.5
+                            else None
+                        ),
+                        created_at=issue.created_at,
+                    )
+                )
+
+        for rows in [
+            assignees,
+            labels,
+            cycle_issues,
+            module_issues,
+            activities,
+            comments,
+            notifications,
+        ]:
+            copy_instances(rows)
+
+    def generate_pages(self):
+        pages = [
+            Page(
+                id=self.uuid(),
+                workspace=self.workspace,
+                name=self.fake.catch_phrase(),
+                owned_by_id=self.random.choice(self.member_ids),
+                access=self.random.randint(0, 1),
+                color=self.fake.hex_color(),
+                description_html=f"<p>{self.fake.text(max_nb_chars=2000)}</p>",
+            )
+            for _ in range(self.profile["pages"])
+        ]
+        copy_instances(pages)
+        copy_instances(
+            [self.scoped(ProjectPage, page_id=page.id) for page in pages]
+        )
+
+
+def generate_project(workspace_id, owner_id, member_ids, profile, seed, index):
+    workspace = Workspace.objects.get(pk=workspace_id)
+    with transaction.atomic():
+        project_id = ProjectGenerator(
+            workspace, owner_id, member_ids, profile, seed, index
+        ).generate()
+    # The stored progress is computed by signals the loading skips
+    refresh_project_progress(project_id)
+    return project_id
+
+
+def create_synthetic_members(workspace, profile, seed):
+    """The members of the workspace, created once for the workspace"""
+    rng = random.Random(f"{seed}:members")
+    fake = Faker()
+    fake.seed_instance(f"{seed}:members")
+
+    users = []
+    for position in range(SYNTHETIC_DATA_PROFILES[profile]["members"]):
+        first_name, last_name = fake.first_name(), fake.last_name()
+        users.append(
+            User(
+                id=uuid.UUID(int=rng.getrandbits(128), version=4),
+                username=f"{workspace.slug}-{position}",
+                email=f"member-{position}@{workspace.slug}.example.com",
+                first_name=first_name,
+                last_name=last_name,
+                display_name=f"{first_name}{position}",
+                is_active=True,
+            )
+        )
+    User.objects.bulk_create(users, ignore_conflicts=True)
+    ids_by_email = dict(
+        User.objects.filter(
+            email__in=[user.email for user in users]
+        ).values_list("email", "id")
+    )
+    # The projects sample the members, so they are kept in the order they
+    # were generated in rather than the order the query returns them in
+    member_ids = [ids_by_email[user.email] for user in users]
+    WorkspaceMember.objects.bulk_create(
+        [
+            WorkspaceMember(workspace=workspace, member_id=member_id, role=15)
+            for member_id in member_ids
+        ],
+        ignore_conflicts=True,
+    )
+    return member_ids
+
+
+def generate_synthetic_data(slug, email, profile, seed=0, processes=None):
+    """
+    Fill the workspace with the projects of the profile, generated in
+    parallel processes. Returns the ids of the created projects
+    """
+    owner = User.objects.get(email=email)
+    workspace, _ = Workspace.objects.get_or_create(
+        slug=slug, defaults={"name": slug, "owner": owner}
+    )
+    WorkspaceMember.objects.get_or_create(
+        workspace=workspace, member=owner, defaults={"role": 20}
+    )
+    member_ids = create_synthetic_members(workspace, profile, seed)
+
+    arguments = [
+        (workspace.id, owner.id, member_ids, profile, seed, index)
+        for index in range(SYNTHETIC_DATA_PROFILES[profile]["projects"])
+    ]
+    # The forked processes must not share the connections of the parent
+    connections.close_all()
+    with multiprocessing.get_context("fork").Pool(processes) as pool:
+        return pool.starmap(generate_project, arguments)
@@ -0,0 +1,29 @@
+# Django imports
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+# Dropped by the save and delete receiver of the user. The timeout bounds
+# how long a queryset update of the user, which skips it, is served stale
+USER_CACHE_TIMEOUT = 60 * 5
+
+
+def user_cache_key(user_id):
+    return f"user:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+def get_cached_user(user_id):
+    """Load the user by id through the cache, None when it does not exist"""
+    key = user_cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        User = get_user_model()
+        try:
+            user = User._default_manager.get(pk=user_id)
+        except (User.DoesNotExist, ValueError):
+            return None
+        cache.set(key, user, USER_CACHE_TIMEOUT)
+    return user
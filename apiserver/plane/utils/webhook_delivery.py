@@ -0,0 +1,186 @@
+# Python imports
+import hashlib
+import hmac
+import json
+import threading
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+# Third party imports
+import requests
+from requests.adapters import HTTPAdapter
+
+# Django imports
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Module imports
+from plane.db.models import WebhookLog
+
+WEBHOOK_TIMEOUT = 30
+# Deliveries running at once for a single event
+WEBHOOK_MAX_WORKERS = 16
+# Deliveries running at once against a single host
+WEBHOOK_MAX_PER_HOST = 4
+
+WEBHOOK_ACTIONS = {
+    "POST": "create",
+    "PATCH": "update",
+    "PUT": "update",
+    "DELETE": "delete",
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_webhook_session():
+    """
+    Return the keep-alive session of the worker process, the connections
+    to a host are reused across the deliveries and the tasks
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=WEBHOOK_MAX_WORKERS,
+                    pool_maxsize=WEBHOOK_MAX_PER_HOST,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def to_json_data(data):
+    """Convert the serializer data to plain json types"""
+    return (
+        json.loads(json.dumps(data, cls=DjangoJSONEncoder))
+        if data is not None
+        else None
+    )
+
+
+def build_webhook_request(webhook, event, action, event_data, activity=None):
+    """
+    Build the body and the headers of the delivery to the webhook.
+    The event data is shared across the webhooks, only the identifiers
+    and the signature are specific to the webhook
+    """
+    payload = {
+        "event": event,
+        "action": WEBHOOK_ACTIONS.get(action, action),
+        "webhook_id": str(webhook.id),
+        "workspace_id": str(webhook.workspace_id),
+        "data": event_data,
+    }
+    if activity is not None:
+        payload["activity"] = activity
+
+    body = json.dumps(payload)
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "Autopilot",
+        "X-Plane-Delivery": str(uuid.uuid4()),
+        "X-Plane-Event": event,
+    }
+
+    # Sign the exact bytes being sent
+    if webhook.secret_key:
+        headers["X-Plane-Signature"] = hmac.new(
+            webhook.secret_key.encode("utf-8"),
+            body.encode("utf-8"),
+            hashlib.sha256,
+        ).hexdigest()
+
+    return payload, body, headers
+
+
+def send_webhook_request(session, webhook, body, headers):
+    """Post the body to the webhook, return the response or the error"""
+    try:
+        return (
+            session.post(
+                webhook.url,
+                data=body.encode("utf-8"),
+                headers=headers,
+                timeout=WEBHOOK_TIMEOUT,
+            ),
+            None,
+        )
+    except requests.RequestException as e:
+        return None, e
+
+
+def deliver_webhooks(
+    webhooks,
+    event,
+    action,
+    event_data,
+    activity=None,
+    session=None,
+    max_per_host=WEBHOOK_MAX_PER_HOST,
+):
+    """
+    Deliver one event to all the webhooks concurrently.
+    The requests run in a thread pool with a bound on the requests running
+    against the same host, nothing in the threads touches the database.
+    Returns a list of (webhook, payload, headers, response, error)
+    """
+    webhooks = list(webhooks)
+    if not webhooks:
+        return []
+
+    session = session or get_webhook_session()
+    host_limits = defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+    for webhook in webhooks:
+        host_limits[urlsplit(webhook.url).netloc]
+
+    def deliver(webhook):
+        payload, body, headers = build_webhook_request(
+            webhook, event, action, event_data, activity
+        )
+        with host_limits[urlsplit(webhook.url).netloc]:
+            response, error = send_webhook_request(
+                session, webhook, body, headers
+            )
+        return webhook, payload, headers, response, error
+
+    if len(webhooks) == 1:
+        return [deliver(webhooks[0])]
+
+    with ThreadPoolExecutor(
+        max_workers=min(len(webhooks), WEBHOOK_MAX_WORKERS)
+    ) as executor:
+        return list(executor.map(deliver, webhooks))
+
+
+def create_webhook_logs(deliveries, event, action, retry_count=0):
+    """Record the deliveries with a single insert"""
+    return WebhookLog.objects.bulk_create(
+        [
+            WebhookLog(
+                workspace_id=webhook.workspace_id,
+                webhook_id=webhook.id,
+                event_type=str(event),
+                request_method=str(WEBHOOK_ACTIONS.get(action, action)),
+                request_headers=str(headers),
+                request_body=str(payload),
+                response_status=(
+                    str(response.status_code) if error is None else 500
+                ),
+                response_headers=(
+                    str(response.headers) if error is None else ""
+                ),
+                response_body=(
+                    str(response.text) if error is None else str(error)
+                ),
+                retry_count=retry_count,
+            )
+            for webhook, payload, headers, response, error in deliveries
+        ],
+        batch_size=100,
+    )